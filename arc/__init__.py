@@ -20,7 +20,17 @@ from arc.define import (
     namespace,
 )
 from arc.errors import ConversionError, ExecutionError, ValidationError, exit
-from arc.present import err, info, pager, print, usage, log, markdown, parse_markdown
+from arc.present import (
+    err,
+    info,
+    pager,
+    print,
+    usage,
+    log,
+    markdown,
+    parse_markdown,
+    stream_markdown,
+)
 from arc.prompt import Prompt
 from arc.runtime import App, ExecMiddleware, InitMiddleware, Context
 from arc.types import State, convert
@@ -61,6 +71,7 @@ __all__ = [
     "log",
     "markdown",
     "parse_markdown",
+    "stream_markdown",
     # Prompt
     "Prompt",
     # Runtime
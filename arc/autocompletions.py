@@ -1,31 +1,286 @@
 from __future__ import annotations
 from contextlib import redirect_stderr
 
+import contextvars
 import dataclasses as dc
+import functools
+import inspect
 import os
+import queue
+import threading
+import time
 import typing as t
+import weakref
 
 from arc import errors
 from arc.present.joiner import Join
 
 if t.TYPE_CHECKING:
+    from concurrent.futures import Future
+
     from arc.typing import CompletionProtocol
     from arc.define.command import Command
 
+T = t.TypeVar("T")
+
+_DEADLINE_GRACE = 0.05
+"""Seconds to wait past a deadline for completions that were found before it"""
+
+_CACHED_INPUTS = 32
+"""Number of inputs to keep the last complete results of, per completion source"""
+
+_last_results: weakref.WeakKeyDictionary[t.Any, dict[t.Hashable, list[Completion]]] = (
+    weakref.WeakKeyDictionary()
+)
+"""The last complete results of each completion source, for each input. Lives as
+long as the process, so it carries over between requests under `App.serve()`"""
+_results_lock = threading.Lock()
+
 
 def get_completions(
     obj: CompletionProtocol,
     info: CompletionInfo,
     *args: t.Any,
+    deadline: float | None = None,
     **kwargs: t.Any,
 ) -> list[Completion]:
-    """Gets the completions for a particular object that supports the `CompletionProtocol`"""
+    """Gets the completions for a particular object that supports the `CompletionProtocol`.
+
+    If a `deadline` (in terms of `time.monotonic()`) is provided, the completions are
+    generated on one of the `_workers`, and whatever has been generated once the
+    deadline passes is returned. The deadline also applies to any completions
+    retrieved while generating these ones. Asynchronous completions (a coroutine
+    or async iterable) are cancelled when it passes.
+
+    When a source is cut off by the deadline, the results from the last time it
+    finished for the same input in this process (like when the app is run with
+    `App.serve()`) are added to the ones it found before the deadline"""
+    if deadline is not None:
+        return _get_completions_in_worker(obj, info, args, kwargs, deadline)
+
+    found: list[Completion] = []
+    state = _deadline.get()
+    if state is None:
+        _get_completions(obj, info, args, kwargs, None, found)
+        return found
+
+    # Retrieved for a caller that is bound by the deadline. What has been found so
+    # far is kept in `state.found`, so that the caller can return it if this blocks
+    state.found.append(found)
+    try:
+        finished = _get_completions(obj, info, args, kwargs, state.at, found)
+    finally:
+        state.found.pop()
+
+    state.finished &= finished
+    return _with_last_results(
+        obj, (tuple(info.words), info.current, args), found, finished
+    )
+
+
+def _get_completions_in_worker(
+    obj: CompletionProtocol,
+    info: CompletionInfo,
+    args: tuple[t.Any, ...],
+    kwargs: dict[str, t.Any],
+    deadline: float,
+) -> list[Completion]:
+    """Runs `_get_completions()` on one of the `_workers`, returning whatever it
+    (and any source it retrieves) has found once the deadline passes"""
+    state = _Deadline(deadline)
+    found: list[Completion] = []
+    state.found.append(found)
+
+    def run() -> None:
+        _deadline.set(state)
+        state.finished &= _get_completions(obj, info, args, kwargs, deadline, found)
+
+    future = _workers.submit(run)
+    try:
+        future.result(max(deadline - time.monotonic(), 0) + _DEADLINE_GRACE)
+    except TimeoutError:
+        # Left to finish on its own, if it has started
+        future.cancel()
+        state.finished = False
+        found = [comp for comps in list(state.found) for comp in comps]
+
+    key = (tuple(info.words), info.current, args)
+    return _with_last_results(obj, key, list(found), state.finished)
+
+
+def _with_last_results(
+    obj: CompletionProtocol,
+    key: t.Hashable,
+    found: list[Completion],
+    finished: bool,
+) -> list[Completion]:
+    """Stores `found` as the last results of `obj` for `key` if the source `finished`.
+    Otherwise, adds the last results that aren't in `found` already"""
+    try:
+        with _results_lock:
+            results = _last_results.setdefault(obj, {})
+            if finished:
+                results.pop(key, None)
+                results[key] = list(found)
+                if len(results) > _CACHED_INPUTS:
+                    del results[next(iter(results))]
+                return found
+
+            last = results.get(key, [])
+    except TypeError:
+        # `obj` can't be weakly referenced, or `key` isn't hashable
+        return found
+
+    values = [comp.value for comp in found]
+    return found + [comp for comp in last if comp.value not in values]
+
+
+def _get_completions(
+    obj: CompletionProtocol,
+    info: CompletionInfo,
+    args: tuple[t.Any, ...],
+    kwargs: dict[str, t.Any],
+    deadline: float | None,
+    found: list[Completion],
+) -> bool:
+    """Adds the completions for `obj` to `found` as they are generated.
+    Returns whether they finished before the deadline"""
+    comps = obj.__completions__(info, *args, **kwargs)
+    if comps is None:
+        return True
+
+    if inspect.isawaitable(comps) or isinstance(comps, t.AsyncIterable):
+        return _complete_async(comps, deadline, found)
+
+    for comp in comps:
+        found.append(comp)
+        # Completions from nested sources that were cut off by the
+        # deadline are only handed back after it, so allow for them
+        if deadline is not None and time.monotonic() > deadline + _DEADLINE_GRACE:
+            return False
+
+    return True
+
+
+def _complete_async(
+    comps: t.Awaitable[t.Iterable[Completion] | None] | t.AsyncIterable[Completion],
+    deadline: float | None,
+    found: list[Completion],
+) -> bool:
+    """Runs asynchronous completions, adding them to `found`. If the `deadline`
+    passes first, they are cancelled. Returns whether they finished"""
+    import asyncio
+
+    async def collect() -> None:
+        if isinstance(comps, t.AsyncIterable):
+            async for comp in comps:
+                found.append(comp)
+        else:
+            res = await comps
+            if res is not None:
+                found.extend(res)
+
+    async def run() -> bool:
+        timeout = None if deadline is None else max(deadline - time.monotonic(), 0)
+        try:
+            await asyncio.wait_for(collect(), timeout)
+        except asyncio.TimeoutError:
+            return False
+
+        return True
+
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        return asyncio.run(run())
+
+    # Called from synchronous code inside of a coroutine, so the
+    # running loop can't be blocked on. Use a loop in another thread
+    from concurrent.futures import ThreadPoolExecutor
+
+    with ThreadPoolExecutor(1) as pool:
+        ctx = contextvars.copy_context()
+        return pool.submit(ctx.run, asyncio.run, run()).result()
+
+
+async def get_completions_async(
+    obj: CompletionProtocol, info: CompletionInfo, *args: t.Any, **kwargs: t.Any
+) -> list[Completion]:
+    """Asynchronous version of `get_completions()`, for use in asynchronous completion
+    functions. Awaiting several of these with `asyncio.gather()` retrieves the
+    completions of each object concurrently, on the loop the function is running on"""
     comps = obj.__completions__(info, *args, **kwargs)
     if comps is None:
-        comps = []
-    else:
-        comps = list(comps)
-    return comps
+        return []
+
+    if isinstance(comps, t.AsyncIterable):
+        return [comp async for comp in comps]
+
+    if inspect.isawaitable(comps):
+        return list(await comps or [])
+
+    return list(comps)
+
+
+@dc.dataclass
+class _Deadline:
+    at: float
+    finished: bool = True
+    """Whether every source retrieved so far finished before the deadline"""
+    found: list[list[Completion]] = dc.field(default_factory=list)
+    """What each source that is still running has found so far"""
+
+
+_deadline: contextvars.ContextVar[_Deadline | None] = contextvars.ContextVar(
+    "arc.completion.deadline", default=None
+)
+
+
+class _Workers:
+    """Bounded pool of threads that completion sources bound by a deadline run on.
+    Sources that are still blocked at the deadline keep their thread until they
+    finish, so once every thread is taken, new requests only get cached results.
+
+    Unlike `ThreadPoolExecutor`, the threads are daemons, because the executor waits
+    for its threads at exit, and a blocked source would keep the shell waiting"""
+
+    def __init__(self, size: int) -> None:
+        self.size = size
+        self.threads: list[threading.Thread] = []
+        self.jobs: queue.SimpleQueue[tuple[Future[t.Any], t.Callable[[], t.Any]]] = (
+            queue.SimpleQueue()
+        )
+        self.idle = threading.Semaphore(0)
+        self.lock = threading.Lock()
+
+    def submit(self, func: t.Callable[[], T]) -> Future[T]:
+        """Runs `func` in the current context on one of the threads"""
+        from concurrent.futures import Future
+
+        future: Future[T] = Future()
+        self.jobs.put((future, functools.partial(contextvars.copy_context().run, func)))
+
+        with self.lock:
+            if not self.idle.acquire(blocking=False) and len(self.threads) < self.size:
+                thread = threading.Thread(target=self.work, daemon=True)
+                thread.start()
+                self.threads.append(thread)
+
+        return future
+
+    def work(self) -> None:
+        while True:
+            future, func = self.jobs.get()
+            if future.set_running_or_notify_cancel():
+                try:
+                    future.set_result(func())
+                except BaseException as e:  # noqa: BLE001
+                    future.set_exception(e)
+
+            self.idle.release()
+
+
+_workers = _Workers(4)
 
 
 @dc.dataclass
@@ -64,6 +319,10 @@ class Completion:
 class ShellCompletion:
     template: t.ClassVar[str]
     shells: dict[str, type["ShellCompletion"]] = {}
+    timeout: t.ClassVar[float] = 0.5
+    """Seconds to spend generating completions. Whatever has been
+    generated once the time runs out is returned"""
+    log_file: t.ClassVar[str] = "completions.log"
 
     def __init__(self, command: Command, info: CompletionInfo):
         self.command = command
@@ -86,7 +345,12 @@ class ShellCompletion:
 
     @property
     def completion_var(self) -> str:
-        return f"_{self.command_name}_complete".upper().replace("-", "_")
+        return self.completion_var_for(self.command_name)
+
+    @staticmethod
+    def completion_var_for(command_name: str) -> str:
+        """The enviroment variable that shells set when requesting completions"""
+        return f"_{command_name}_complete".upper().replace("-", "_")
 
     def should_complete(self) -> bool:
         return os.getenv(self.completion_var) is not None
@@ -102,8 +366,16 @@ class ShellCompletion:
     def format_completion(self, comp: Completion) -> str:
         return ""
 
+    def get_completions(self) -> list[Completion]:
+        return get_completions(
+            self.command, self.info, deadline=time.monotonic() + self.timeout
+        )
+
     @classmethod
-    def run(cls, shell: str, command: Command) -> str:
+    def run(cls, shell: str, command: Command, log: bool = False) -> str:
+        """Returns the completions when the shell is requesting them, or the
+        completion script otherwise. When `log` is set, the output (and anything
+        written to stderr) is also written to `log_file`, for debugging"""
         info = CompletionInfo.from_env()
         if shell not in cls.shells:
             raise errors.ArgumentError(
@@ -112,7 +384,10 @@ class ShellCompletion:
             )
         comp: ShellCompletion = cls.shells[shell](command, info)
 
-        with open("completions.log", "w+") as f, redirect_stderr(f):
+        if not log:
+            return comp.complete() if comp.should_complete() else comp.source()
+
+        with open(cls.log_file, "w+") as f, redirect_stderr(f):
             res = comp.complete() if comp.should_complete() else comp.source()
             f.write("\n")
             f.write(" ".join(info.words))
@@ -151,7 +426,7 @@ complete -o nosort -F {func_name} {name_exe}
 """
 
     def complete(self) -> str:
-        comps = get_completions(self.command, self.info)
+        comps = self.get_completions()
         return "\n".join([self.format_completion(comp) for comp in comps])
 
     def format_completion(self, comp: Completion) -> str:
@@ -196,7 +471,7 @@ compdef {func_name} {name_exe};
 """
 
     def complete(self) -> str:
-        comps = get_completions(self.command, self.info)
+        comps = self.get_completions()
         return "\n".join([self.format_completion(comp) for comp in comps])
 
     def format_completion(self, comp: Completion) -> str:
@@ -241,7 +516,7 @@ complete -f -c {name_com} -a "({func_name})";
 """
 
     def complete(self) -> str:
-        comps = get_completions(self.command, self.info)
+        comps = self.get_completions()
         return "\n".join([self.format_completion(comp) for comp in comps])
 
     def format_completion(self, comp: Completion) -> str:
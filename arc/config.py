@@ -40,6 +40,11 @@ class PresentConfig:
     """The color configuration for the application"""
     formatter: type[HelpFormatter] = DefaultHelpFormatter
     """Class to use when formatting help messages"""
+    cache_dir: str | None = None
+    """Directory to cache rendered help and usage messages in. Messages are only
+    rendered again when the command, terminal width or color configuration changes.
+    [`user_cache_dir()`][arc.present.render_cache.user_cache_dir] provides a suitable
+    location. Disabled by default"""
 
 
 @dataclass
@@ -97,6 +102,10 @@ class Config:
     version: str | SemVer | None = None
     autocomplete: bool = False
     allow_unrecognized_args: bool = False
+    allow_abbreviated_commands: bool = False
+    allow_argfiles: bool = False
+    completion_index: str | None = None
+    parser: at.ParserEngine = "argparse"
     debug: bool = False
     prompt: Prompt = field(default_factory=Prompt)
     suggest: SuggestionConfig = field(default_factory=SuggestionConfig)
@@ -150,6 +159,10 @@ def configure(
     prompt: Prompt | None = None,
     autocomplete: bool | None = None,
     allow_unrecognized_args: bool | None = None,
+    allow_abbreviated_commands: bool | None = None,
+    allow_argfiles: bool | None = None,
+    completion_index: str | None = None,
+    parser: at.ParserEngine | None = None,
     debug: bool | None = None,
     links: LinksConfig | None = None,
     present: PresentConfig | None = None,
@@ -187,6 +200,33 @@ def configure(
             that arc does not recognize. Their values will be stored in the context under the
             key `arc.parse.extra`. Defaults to `False`
 
+        allow_abbreviated_commands (bool, optional): Subcommands may be referred to by any
+            unique prefix of their name or aliases. For example, `cli dep` would execute
+            `cli deploy`, if there is no other subcommand starting with `dep`.
+            Defaults to `False`
+
+        allow_argfiles (bool, optional): Any argument of the form `@path` will be replaced
+            by the contents of the file at `path`, with each line of the file being a single
+            argument (blank lines are skipped). Argument files may reference other argument
+            files. Useful for passing more arguments than the OS allows on the command line.
+            `Stream[T]` arguments read `@path` themselves, so commands that have them can't
+            be used with this enabled. Defaults to `False`
+
+        completion_index (str, optional): Path of a file to store the static completions
+            (subcommands, options, `Literal` / `Enum` values, etc...) of the app in. When
+            completions are requested they are read from the file, instead of being
+            computed from the command tree. The file is created after the app runs a
+            command, and recreated the next time a command runs after the app's version
+            or the modules that define its commands change. Until then, completions are
+            computed from the command tree. Completions provided with `complete=` are
+            still computed on each request, as are the completions of lazy subcommands
+            that weren't imported when the file was created
+
+        parser (str, optional): The engine used to parse the command line. `argparse` builds
+            an `argparse.ArgumentParser`, `native` uses arc's own single-pass parser, which is
+            faster to build and run. Unlike `argparse`, the native parser treats every argument
+            after `--` as positional. Defaults to `argparse`
+
         debug (bool, optional): enable / disable arc debug logs.
 
         present (PresentConfig, optional): set the presentation configuration for arc
@@ -207,6 +247,10 @@ def configure(
         "prompt": prompt,
         "autocomplete": autocomplete,
         "allow_unrecognized_args": allow_unrecognized_args,
+        "allow_abbreviated_commands": allow_abbreviated_commands,
+        "allow_argfiles": allow_argfiles,
+        "completion_index": completion_index,
+        "parser": parser,
         "debug": debug,
         "links": links,
         "present": present,
@@ -2,6 +2,7 @@ from __future__ import annotations
 from datetime import datetime
 
 import functools
+import importlib
 import inspect
 import typing as t
 
@@ -14,11 +15,14 @@ from arc.define import classful
 from arc.define.alias import AliasDict
 from arc.define.documentation import Documentation
 from arc.define.param import ParamMixin
+from arc.define.trie import Trie
 from arc.present.joiner import Join
 from arc.runtime import App, ExecMiddleware, MiddlewareManager, MiddlewareStack
 from arc.runtime import Context
 
 if t.TYPE_CHECKING:
+    from arc.parser import NativeParser, Parser
+
     from .param import ParamDefinition
 
 
@@ -27,10 +31,13 @@ class Command(ParamMixin, MiddlewareManager):
     parent: Command | None
     config: Config
     subcommands: AliasDict[str, Command]
+    lazy_subcommands: AliasDict[str, LazyCommand]
     param_def: ParamDefinition
     doc: Documentation
     explicit_name: bool
     data: dict[str, t.Any]
+    _parser_cache: tuple[tuple[t.Any, ...], Parser | NativeParser] | None
+    _subcommand_trie: Trie[str] | None
 
     def __init__(
         self,
@@ -56,9 +63,12 @@ class Command(ParamMixin, MiddlewareManager):
         self.name = name or callback.__name__
         self.parent = parent
         self.subcommands = AliasDict()
+        self.lazy_subcommands = AliasDict()
         self.doc = Documentation(self, self.config.present, description)
         self.explicit_name = explicit_name
         self.data = kwargs
+        self._parser_cache = None
+        self._subcommand_trie = None
 
     __repr__ = utils.display("name")
 
@@ -95,7 +105,15 @@ class Command(ParamMixin, MiddlewareManager):
         # - Does not take into account that collection types
         #   can be repeated when they're options
         # - Assumes that the user's cursor is at the end of the line
-        command, args = self.find_command(info.words)
+        if info.current and info.words:
+            # The word being typed should not be treated as an abbreviation
+            command, args = self.find_command(info.words[:-1])
+            if args:
+                args.append(info.words[-1])
+            else:
+                command, args = command.find_command(info.words[-1:], abbreviate=False)
+        else:
+            command, args = self.find_command(info.words)
 
         if len(args) == 0:
             yield from command.__complete_subcommands(info)
@@ -115,14 +133,20 @@ class Command(ParamMixin, MiddlewareManager):
             pos = command.__complete_positional_value(info, args)
             if pos:
                 yield from pos
-            elif len(args) == 1 and any(
-                c.name.startswith(args[0]) for c in self.subcommands.values()
-            ):
+            elif len(args) == 1 and command.subcommand_trie.items(args[0]):
                 yield from command.__complete_subcommands(info)
 
     def __complete_subcommands(self, info: CompletionInfo) -> t.Iterable[Completion]:
-        for command in self.subcommands.values():
-            yield Completion(command.name, description=command.doc.short_description)
+        for name, canonical in self.subcommand_trie.items(info.current):
+            if name != canonical:
+                continue
+
+            if name in self.subcommands:
+                description = self.subcommands[name].doc.short_description
+            else:
+                description = self.lazy_subcommands[name].short_description
+
+            yield Completion(name, description=description)
 
     def __complete_options(self, info: CompletionInfo) -> t.Iterable[Completion]:
         for param in self.key_params:
@@ -168,6 +192,22 @@ class Command(ParamMixin, MiddlewareManager):
             "subcommands": [com.schema for com in self.subcommands.values()],
         }
 
+    @property
+    def subcommand_trie(self) -> Trie[str]:
+        """Trie that maps the names and aliases of all the subcommands
+        (including lazy ones) to their canonical name"""
+        if self._subcommand_trie is None:
+            trie: Trie[str] = Trie()
+            for commands in (self.subcommands, self.lazy_subcommands):
+                for name in commands:
+                    trie.insert(name, name)
+                for alias, name in commands.aliases.items():
+                    trie.insert(alias, name)
+
+            self._subcommand_trie = trie
+
+        return self._subcommand_trie
+
     @property
     def is_namespace(self) -> bool:
         """Whether or not this command was created using `arc.namespace()`"""
@@ -221,6 +261,7 @@ class Command(ParamMixin, MiddlewareManager):
         for command in self.command_chain:
             stack.extend(command._stack)
 
+        stack = ExecMiddleware.compile(stack)
         ctx = stack.start(ctx)
         if "arc.args" not in ctx:
             raise errors.InternalError(
@@ -234,6 +275,8 @@ class Command(ParamMixin, MiddlewareManager):
         res = None
         try:
             res = self.callback(**args)
+            if inspect.isawaitable(res):
+                res = ctx.app.run_async(res)
         except Exception as e:
             stack.throw(e)
         else:
@@ -352,12 +395,87 @@ class Command(ParamMixin, MiddlewareManager):
         if aliases:
             self.subcommands.add_aliases(command.name, *aliases)
 
+        self._subcommand_trie = None
         return command
 
     def add_commands(self, *commands: Command) -> list[Command]:
         """Add multiple commands as subcommands"""
         return [self.add_command(command) for command in commands]
 
+    def lazy_subcommand(
+        self,
+        path: str,
+        *aliases: str,
+        name: str | None = None,
+        desc: str | None = None,
+    ) -> LazyCommand:
+        """Register a subcommand by its import path, without importing it.
+        The module will only be imported once the subcommand is actually used.
+
+        ```py
+        command.lazy_subcommand("mycli.deploy:deploy", "d", desc="Deploy the app")
+        ```
+
+        Args:
+            path (str): Import path to the command object or callback, in the
+                form `"package.module:attribute"`
+            *aliases (str): Optional aliases to refer to the command by
+            name (str | None, optional): Name of the subcommand. If one is not
+                provided, it will be derived from the attribute's name.
+            desc (str | None, optional): Short description of the command, used for
+                listing the subcommand in help output and shell completions.
+        """
+        module, _, attr = path.partition(":")
+        if not module or not attr:
+            raise errors.CommandError(
+                f"Invalid import path: {path!r}. "
+                "Must be in the form 'package.module:attribute'"
+            )
+
+        if name is None:
+            name = attr.split(".")[-1]
+            if self.config.transform_snake_case:
+                name = name.replace("_", "-")
+
+        lazy = LazyCommand(path, name, desc)
+        self.lazy_subcommands[name] = lazy
+        if aliases:
+            self.lazy_subcommands.add_aliases(name, *aliases)
+
+        self._subcommand_trie = None
+        return lazy
+
+    def get_subcommand(self, name: str) -> Command | None:
+        """Retrieve a subcommand by its name or alias. If the subcommand was
+        registered lazily, it will be imported and added to the command tree"""
+        command = self.subcommands.get(name)
+        if command is not None or name not in self.lazy_subcommands:
+            return command
+
+        lazy = self.lazy_subcommands[self.lazy_subcommands.aliases.get(name, name)]
+        # Only removed once it has loaded, so a failed import leaves it in the tree
+        obj = lazy.load()
+        aliases = self.lazy_subcommands.aliases_for(lazy.name)
+        del self.lazy_subcommands[lazy.name]
+        for alias in aliases:
+            del self.lazy_subcommands.aliases[alias]
+
+        if isinstance(obj, Command):
+            if obj.parent is None:
+                obj.name = lazy.name
+            return self.add_command(obj, aliases)
+
+        return self.subcommand(lazy.name, *aliases, desc=lazy.description)(obj)
+
+    def load_lazy_subcommands(self) -> None:
+        """Imports all of the lazily registered subcommands
+        in the tree, starting at this command"""
+        for name in list(self.lazy_subcommands):
+            self.get_subcommand(name)
+
+        for sub in self.subcommands.values():
+            sub.load_lazy_subcommands()
+
     @staticmethod
     def get_canonical_subcommand_name(
         callback: at.CommandCallback,
@@ -375,24 +493,42 @@ class Command(ParamMixin, MiddlewareManager):
 
     # Helpers --------------------------------------------------------------------
 
-    def find_command(self, names: list[str]) -> tuple[Command, list[str]]:
+    def find_command(
+        self, names: t.Iterable[str], abbreviate: bool | None = None
+    ) -> tuple[Command, list[str]]:
         """Seperates out a sequence of args into:
         - a subcommand object
         - command arguments
+
+        If `abbreviate` is enabled (defaults to `Config.allow_abbreviated_commands`),
+        subcommands may also be referred to by a unique prefix of their names.
         """
-        index = 0
+        names = iter(names)
+        rest: list[str] = []
         command: Command = self
 
         for name in names:
-            if name in command.subcommands:
-                index += 1
-                child = command.subcommands.get(name)
-                assert child is not None
-                command = child
-            else:
+            canonical = command.subcommand_trie.get(name)
+
+            allowed = (
+                command.config.allow_abbreviated_commands
+                if abbreviate is None
+                else abbreviate
+            )
+
+            if canonical is None and name and allowed:
+                matches = {value for _, value in command.subcommand_trie.items(name)}
+                if len(matches) == 1:
+                    canonical = matches.pop()
+
+            child = command.get_subcommand(canonical) if canonical else None
+            if child is None:
+                rest.append(name)
                 break
 
-        rest: list[str] = names[index:]
+            command = child
+
+        rest.extend(names)
 
         return command, rest
 
@@ -445,6 +581,36 @@ class Command(ParamMixin, MiddlewareManager):
         return wrapper
 
 
+class LazyCommand:
+    """A subcommand that has been registered by its import path,
+    but not imported yet. Created with `Command.lazy_subcommand()`"""
+
+    def __init__(self, path: str, name: str, description: str | None = None):
+        self.path = path
+        self.name = name
+        self.description = description
+
+    __repr__ = utils.display("path", "name")
+
+    @property
+    def short_description(self) -> str | None:
+        return self.description.split("\n")[0] if self.description else None
+
+    def load(self) -> Command | at.CommandCallback:
+        """Import the object the path points to"""
+        module, _, attr = self.path.partition(":")
+        try:
+            obj: t.Any = importlib.import_module(module)
+            for part in attr.split("."):
+                obj = getattr(obj, part)
+        except (ImportError, AttributeError) as e:
+            raise errors.CommandError(
+                f"Failed to load subcommand {self.name!r} from {self.path!r}: {e}"
+            ) from e
+
+        return obj
+
+
 @t.overload
 def command(callback: at.CommandCallback, /) -> Command: ...
 
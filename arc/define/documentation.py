@@ -1,15 +1,21 @@
 from __future__ import annotations
 import typing as t
 from functools import cached_property
+import re
 import textwrap
 
 import arc.typing as at
 from arc.define.param import param
+from arc.present.render_cache import RenderCache
 
 if t.TYPE_CHECKING:
     from arc.define.command import Command
     from arc.config import PresentConfig
 
+# Matches the memory address in the default repr() of objects
+# (`<Thing object at 0x7f...>`), which changes between processes
+ADDRESS = re.compile(r" at 0x[0-9a-fA-F]+")
+
 ParamKinds = t.Literal["argument", "option", "flag"]
 
 KIND_MAPPING: dict[type[param.Param[t.Any]], ParamKinds] = {
@@ -43,11 +49,11 @@ class Documentation:
 
     def help(self) -> str:
         formatter = self.config.formatter(self, self.config)
-        return formatter.format_help()
+        return self._render("help", formatter, formatter.format_help)
 
     def usage(self) -> str:
         formatter = self.config.formatter(self, self.config)
-        return formatter.format_usage()
+        return self._render("usage", formatter, formatter.format_usage)
 
     @property
     def fullname(self) -> list[str]:
@@ -70,6 +76,49 @@ class Documentation:
     def params(self) -> list[ParamDoc]:
         return self._param_helper(self.command)
 
+    def _render(self, kind: str, formatter: t.Any, render: t.Callable[[], str]) -> str:
+        """Renders with the configured render cache, if there is one"""
+        if not self.config.cache_dir:
+            return render()
+
+        cache = RenderCache(self.config.cache_dir)
+        key = cache.key(
+            kind,
+            type(formatter).__qualname__,
+            getattr(formatter, "width", None),
+            self.config.width,
+            self.config.indent,
+            self.config.color,
+            self._fingerprint(),
+        )
+        return cache.fetch(key, render)
+
+    def _fingerprint(self) -> tuple[t.Any, ...]:
+        """Everything about the command that is displayed in its help"""
+        command = self.command
+        subcommands = command.subcommands
+        lazy_subcommands = command.lazy_subcommands
+        return (
+            self.docstring,
+            command.root.name,
+            self.fullname,
+            command.is_root,
+            command.is_namespace,
+            [{**doc, "default": _default_key(doc["default"])} for doc in self.params],
+            [
+                (sub.name, sub.doc.short_description, subcommands.aliases_for(sub.name))
+                for sub in subcommands.values()
+            ],
+            [
+                (
+                    lazy.name,
+                    lazy.short_description,
+                    lazy_subcommands.aliases_for(lazy.name),
+                )
+                for lazy in lazy_subcommands.values()
+            ],
+        )
+
     @cached_property
     def _split_sections(self) -> tuple[str, str]:
         desc = ""
@@ -107,3 +156,9 @@ class Documentation:
         doc = " " * 10 + doc
         doc = textwrap.dedent(doc)
         return doc
+
+
+def _default_key(default: t.Any) -> str:
+    """The text of `default` to use in the fingerprint of a command.
+    Memory addresses are left out, so that the key is stable between processes"""
+    return ADDRESS.sub("", str(default))
@@ -10,6 +10,7 @@ from arc import safe, utils
 from arc.autocompletions import CompletionInfo, get_completions
 from arc.color import colorize, fg
 from arc.constants import MISSING, Constant
+from arc.prompt.prompts import input_prompt
 from arc.types.convert import convert_type
 from arc.types.type_info import TypeInfo
 
@@ -64,11 +65,22 @@ class Param(t.Generic[T]):
     doesn't matter. This is used to implment the `--version` and `--help` flags"""
     comp_func: at.CompletionFunc | None
     """Function that can provide shell completions for the parameter"""
-    getter_func: at.ParamGetter | None
-    """Function that can retrieve a value not provided on the command line"""
+    dispatch_callback: t.Callable[..., t.Any] | None
+    """`callback`, pre-bound with `utils.dispatcher()`. Kept up to date when
+    `callback` is assigned"""
+    dispatch_getter: t.Callable[..., t.Any] | None
+    """`getter_func`, pre-bound with `utils.dispatcher()`. Kept up to date when
+    `getter_func` is assigned"""
     data: dict[str, t.Any]
     """Dictionary of any other key values passed to the constructors"""
 
+    revision: t.ClassVar[int] = 0
+    """Incremented whenever an attribute that a `ResolutionPlan` depends on is
+    assigned, on any param. Part of the key that plans are cached with"""
+    _PLANNED: t.ClassVar[frozenset[str]] = frozenset(
+        ("type", "envvar", "prompt", "expose", "_callback", "_getter_func")
+    )
+
     def __init__(
         self,
         argument_name: str,
@@ -106,6 +118,39 @@ class Param(t.Generic[T]):
 
     __repr__ = utils.display("argument_name", "type")
 
+    def __setattr__(self, name: str, value: t.Any) -> None:
+        super().__setattr__(name, value)
+        if name in Param._PLANNED:
+            Param.revision += 1
+
+    @property
+    def callback(self) -> at.ParamCallback | None:
+        """Function that is called with the param's value once it has been retrieved"""
+        return self._callback
+
+    @callback.setter
+    def callback(self, callback: at.ParamCallback | None) -> None:
+        self._callback = callback
+        self.dispatch_callback = utils.dispatcher(callback) if callback else None
+
+    @property
+    def getter_func(self) -> at.ParamGetter | None:
+        """Function that can retrieve a value not provided on the command line"""
+        return self._getter_func
+
+    @getter_func.setter
+    def getter_func(self, getter_func: at.ParamGetter | None) -> None:
+        self._getter_func = getter_func
+        self.dispatch_getter = utils.dispatcher(getter_func) if getter_func else None
+
+    @cached_property
+    def dispatch_prompt(self) -> t.Callable[..., t.Any]:
+        """The type's `__prompt__` method (or the default input prompt),
+        pre-bound with `utils.dispatcher()`"""
+        return utils.dispatcher(
+            getattr(self.type.resolved_type, "__prompt__", input_prompt)
+        )
+
     def __completions__(
         self, info: CompletionInfo, *args: t.Any, **kwargs: t.Any
     ) -> at.CompletionReturn:
@@ -185,11 +230,11 @@ class Param(t.Generic[T]):
         return "?"  # Optional
 
     def convert(self, value: t.Any) -> T:
-        return convert_type(self.type.resolved_type, value, self.type)
+        return convert_type(self.type.resolved_type, value, self.type, self)
 
     def run_middleware(self, value: t.Any, ctx: t.Any) -> t.Any:
-        for middleware in self.type.middleware:
-            value = utils.dispatch_args(middleware, value, ctx, self)
+        for middleware in self.type.middleware_dispatchers:
+            value = middleware(value, ctx, self)
 
         return value
 
@@ -284,8 +329,8 @@ class InjectedParam(Param[T]):
     callback: at.ParamGetter  # type: ignore[assignment]
 
     def get_injected_value(self, ctx: t.Any) -> t.Any:
-        value = utils.dispatch_args(self.callback, ctx, self)
-        return value
+        assert self.dispatch_callback is not None
+        return self.dispatch_callback(ctx, self)
 
     @property
     def is_injected(self) -> bool:
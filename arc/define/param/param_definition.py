@@ -16,11 +16,8 @@ from arc.define.param.param import (
     OptionParam,
     Param,
 )
-from arc.define.param.param_instance import (
-    ParamInstanceTree,
-    ParamInstanceInteriorNode,
-    ParamInstanceLeafNode,
-)
+from arc.define.param.plan import ResolutionPlan
+from arc.define.param.param_instance import ParamInstanceTree
 from arc.types.type_info import TypeInfo
 
 
@@ -41,6 +38,7 @@ class ParamDefinition:
         self.cls: type | None = cls
         self.params = collections.deque[Param[t.Any]]()
         self.children: list[ParamDefinition] = []
+        self._plan: tuple[tuple[t.Any, ...], ResolutionPlan] | None = None
 
     __repr__ = utils.display("name", "cls", "params", "children")
 
@@ -52,31 +50,27 @@ class ParamDefinition:
             for child in self.children:
                 yield from child.all_params()
 
-    def create_instance(self) -> ParamInstanceTree[type[dict[str, t.Any]]]:
-        root = self.__create_instance_tree(self)
-        return ParamInstanceTree(root)
-
-    def __create_instance_tree(
-        self, definition: ParamDefinition
-    ) -> ParamInstanceInteriorNode[t.Any]:
-
-        # Create Param instances for all the params of the current group
-        values: list[ParamInstanceInteriorNode[t.Any] | ParamInstanceLeafNode] = [
-            ParamInstanceLeafNode(param.argument_name, MISSING, param)
-            for param in definition.params
-        ]
-
-        # Recursively create instances for all the children of the current group
-        # (so this would be any sub-groups of the current group)
-        values.extend(
-            self.__create_instance_tree(child) for child in definition.children
-        )
+    @property
+    def plan(self) -> ResolutionPlan:
+        """The resolution plan for the params in this definition. Built when it is
+        first needed, and cached until the params change (or any of the param
+        attributes the plan depends on are assigned)"""
+        key = (Param.revision, *self.all_params())
+        cached = self._plan
 
-        return ParamInstanceInteriorNode(
-            definition.name,
-            definition.cls or dict,
-            values,
-        )
+        if cached and cached[0] == key:
+            return cached[1]
+
+        plan = ResolutionPlan(self)
+        self._plan = (key, plan)
+        return plan
+
+    def invalidate_plan(self) -> None:
+        """Discards the cached plan"""
+        self._plan = None
+
+    def create_instance(self) -> ParamInstanceTree[type[dict[str, t.Any]]]:
+        return ParamInstanceTree(self.plan.layout)
 
 
 class ParamDefinitionFactory:
@@ -84,10 +78,12 @@ class ParamDefinitionFactory:
         self,
         get_command_name: t.Callable[..., str],
         transform_snake_case: bool = True,
+        allow_argfiles: bool = False,
     ):
         self.param_names: set[str] = set()
         self.get_command_name = get_command_name
         self.transform_snake_case = transform_snake_case
+        self.allow_argfiles = allow_argfiles
 
     def from_function(self, func: t.Callable[..., t.Any]) -> ParamDefinition:
         self.param_names.clear()
@@ -158,10 +154,29 @@ class ParamDefinitionFactory:
                                 self.get_command_name(),
                             )
 
+                if self.allow_argfiles and self._reads_stream(command_param.type):
+                    # The `@path` would be expanded into the command's
+                    # arguments before the stream ever sees it
+                    raise errors.ParamError(
+                        "Stream arguments cannot be used when argument "
+                        "files are enabled (Config.allow_argfiles)",
+                        self.get_command_name(),
+                        command_param,
+                    )
+
                 root.params.append(command_param)
 
         return root
 
+    def _reads_stream(self, info: TypeInfo[t.Any]) -> bool:
+        """Whether `info` is a `Stream[T]`, which reads `@path` arguments itself"""
+        from arc.types.file import Stream
+
+        if info.is_union_type:
+            return any(self._reads_stream(sub) for sub in info.sub_types)
+
+        return safe.issubclass(info.origin, Stream) and bool(info.sub_types)
+
     def create_param(self, param: inspect.Parameter) -> Param[t.Any]:
         if param.name in self.param_names:
             raise errors.ParamError(
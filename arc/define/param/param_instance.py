@@ -1,15 +1,21 @@
 from __future__ import annotations
 
+import itertools
 import typing as t
+import warnings
 from dataclasses import dataclass
 
+from arc.constants import MISSING
+
 if t.TYPE_CHECKING:
-    from arc.define.param import Param
+    from arc.define.param import Param, ParamDefinition
 
 T = t.TypeVar("T", bound=type)
 
+GroupLayout = tuple[type, tuple[tuple[str, "int | GroupLayout"], ...]]
 
-@dataclass
+
+@dataclass(slots=True)
 class ParamInstanceLeafNode:
     name: str
     value: t.Any
@@ -18,8 +24,13 @@ class ParamInstanceLeafNode:
 
 @dataclass
 class ParamInstanceInteriorNode(t.Generic[T]):
-    """Tree data stucture that represents all
-    the param values for a particular command execution"""
+    """A group of param values.
+
+    Deprecated: Param values are no longer stored in a tree of nodes, use
+    `ParamInstanceTree.leaves()`, indexing and `compile()` instead. Only
+    created by `ParamInstanceTree.root`, which returns a view of the values
+    in the tree (the leaves are shared, so setting their values updates the tree)
+    """
 
     name: str
     cls: T
@@ -45,43 +56,113 @@ class ParamInstanceInteriorNode(t.Generic[T]):
         return self.cls(**compiled)
 
 
-@dataclass
+class ParamInstanceLayout:
+    """Precomputed shape of a `ParamDefinition`. Maps the keypath of each
+    param to its index in the flat list of leaves, and records how to
+    rebuild the groups when compiling. Cached on the definition's plan"""
+
+    __slots__ = ("group", "params", "paths")
+
+    def __init__(self, definition: ParamDefinition) -> None:
+        self.params: tuple[Param[t.Any], ...] = tuple(definition.all_params())
+        self.paths: dict[tuple[str, ...], int] = {}
+        self.group = self.__layout(definition, (), itertools.count())
+
+    def __layout(
+        self,
+        definition: ParamDefinition,
+        prefix: tuple[str, ...],
+        counter: t.Iterator[int],
+    ) -> GroupLayout:
+        # Indexes are handed out in the same order as `ParamDefinition.all_params()`
+        members: list[tuple[str, int | GroupLayout]] = []
+        for param in definition.params:
+            idx = next(counter)
+            self.paths[(*prefix, param.argument_name)] = idx
+            members.append((param.argument_name, idx))
+
+        for child in definition.children:
+            members.append(
+                (child.name, self.__layout(child, (*prefix, child.name), counter))
+            )
+
+        return (definition.cls or dict, tuple(members))
+
+
 class ParamInstanceTree(t.Generic[T]):
-    root: ParamInstanceInteriorNode[T]
+    """Represents all the param values for a particular command execution.
+    Values are stored in a flat list, in the order of `ParamDefinition.all_params()`,
+    and looked up by keypath through the definition's `ParamInstanceLayout`"""
+
+    __slots__ = ("_leaves", "layout")
+
+    def __init__(self, layout: ParamInstanceLayout) -> None:
+        self.layout = layout
+        self._leaves = [
+            ParamInstanceLeafNode(param.argument_name, MISSING, param)
+            for param in layout.params
+        ]
 
     def __getitem__(self, path: t.Sequence[str]) -> t.Any:
-        curr = self.__get_from_path(path)
-        return curr.value
+        return self.__get_from_path(path).value
 
     def __setitem__(self, path: t.Sequence[str], value: t.Any) -> None:
-        curr = self.__get_from_path(path)
-        curr.value = value
+        self.__get_from_path(path).value = value
 
     def __get_from_path(self, path: t.Sequence[str]) -> ParamInstanceLeafNode:
         if isinstance(path, str):
             path = (path,)
 
-        curr: ParamInstanceInteriorNode[t.Any] | ParamInstanceLeafNode = self.root
-
-        for component in path:
-            if isinstance(curr, ParamInstanceInteriorNode):
-                possbile_child = [
-                    child for child in curr.children if child.name == component
-                ]
-                if not possbile_child:
-                    raise KeyError(f"{path} not a valid keypath")
+        idx = self.layout.paths.get(tuple(path))
+        if idx is None:
+            raise KeyError(f"{path} not a valid keypath")
 
-                curr = possbile_child[0]
-            else:
-                raise KeyError(f"{path} not a valid keypath")
+        return self._leaves[idx]
+
+    def leaves(self) -> t.Sequence[ParamInstanceLeafNode]:
+        """All of the values in the tree, indexable by `ParamPlanEntry.index`"""
+        return self._leaves
+
+    @property
+    def root(self) -> ParamInstanceInteriorNode[T]:
+        """Deprecated: The values of the tree as nested `ParamInstanceInteriorNode`
+        objects. Use `leaves()`, indexing and `compile()` instead"""
+        warnings.warn(
+            "ParamInstanceTree.root is deprecated, use leaves(), "
+            "indexing and compile() instead",
+            DeprecationWarning,
+            stacklevel=2,
+        )
+        return self.__node("root", self.layout.group)
+
+    def __node(self, name: str, group: GroupLayout) -> ParamInstanceInteriorNode[T]:
+        cls, members = group
+        return ParamInstanceInteriorNode(
+            name,
+            cls,  # type: ignore[arg-type]
+            [
+                (
+                    self._leaves[member]
+                    if isinstance(member, int)
+                    else self.__node(member_name, member)
+                )
+                for member_name, member in members
+            ],
+        )
 
-        if not isinstance(curr, ParamInstanceLeafNode):
-            raise KeyError(f"{path} not a valid keypath")
+    def compile(self, include_hidden: bool = False) -> T:
+        return self.__compile(self.layout.group, include_hidden)
 
-        return curr
+    def __compile(self, group: GroupLayout, include_hidden: bool) -> t.Any:
+        cls, members = group
+        compiled = {}
 
-    def leaves(self) -> t.Generator[ParamInstanceLeafNode, None, None]:
-        return self.root.leaves()
+        for name, member in members:
+            if isinstance(member, int):
+                leaf = self._leaves[member]
+                if leaf.param.expose or include_hidden:
+                    compiled[name] = leaf.value
+            else:
+                compiled[name] = self.__compile(member, include_hidden)
 
-    def compile(self, include_hidden: bool = False) -> T:
-        return self.root.compile(include_hidden)
+        return cls(**compiled)
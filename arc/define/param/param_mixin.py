@@ -40,6 +40,7 @@ class ParamMixin:
         root = ParamDefinitionFactory(
             lambda: Join.with_space(t.cast("Command", self).doc.fullname),
             self.config.transform_snake_case,
+            self.config.allow_argfiles,
         ).from_function(self.callback)
 
         self.__add_help_param(root)
@@ -0,0 +1,74 @@
+from __future__ import annotations
+
+import typing as t
+from dataclasses import dataclass
+
+import arc.typing as at
+from arc.define.param.param_instance import ParamInstanceLayout
+from arc.prompt.prompts import input_prompt
+
+if t.TYPE_CHECKING:
+    from arc.define.param import Param, ParamDefinition
+
+
+@dataclass(frozen=True, slots=True)
+class ParamPlanEntry:
+    """Precomputed information on how to resolve the value of a single param"""
+
+    index: int
+    """Position of the param in `ParamInstanceTree.leaves()`"""
+    param: Param[t.Any]
+    skip: bool
+    """Whether the value sources (command line, env, prompt, etc...) apply to this param"""
+    injected: bool
+    envvar: str | None
+    prompter: t.Callable[..., t.Any] | None
+    getter: at.ParamGetter | None
+    middleware: tuple[at.TypeMiddleware, ...]
+    callback: at.ParamCallback | None
+
+
+class ResolutionPlan:
+    """Immutable, flat list of the params in a `ParamDefinition`, in the order
+    of `ParamInstanceTree.leaves()`, along with how each of their values should be resolved.
+    Use `ParamDefinition.plan` to retrieve the cached plan for a definition"""
+
+    __slots__ = ("_selections", "entries", "layout")
+
+    def __init__(self, definition: ParamDefinition) -> None:
+        self.layout = ParamInstanceLayout(definition)
+        params = self.layout.params
+        self._selections: dict[t.Any, tuple[t.Any, ...]] = {}
+        self.entries: tuple[ParamPlanEntry, ...] = tuple(
+            ParamPlanEntry(
+                index=idx,
+                param=param,
+                skip=param.is_injected or not param.expose,
+                injected=param.is_injected,
+                envvar=param.envvar,
+                prompter=(
+                    getattr(param.type.resolved_type, "__prompt__", input_prompt)
+                    if param.prompt
+                    else None
+                ),
+                getter=param.getter_func,
+                middleware=tuple(param.type.middleware),
+                callback=param.callback,
+            )
+            for idx, param in enumerate(params)
+        )
+
+    def __len__(self) -> int:
+        return len(self.entries)
+
+    def select(
+        self, predicate: t.Callable[[ParamPlanEntry], bool]
+    ) -> tuple[ParamPlanEntry, ...]:
+        """The entries that `predicate` returns true for. Results are cached per
+        predicate, so it should only depend on the entry"""
+        selected = self._selections.get(predicate)
+        if selected is None:
+            selected = tuple(entry for entry in self.entries if predicate(entry))
+            self._selections[predicate] = selected
+
+        return selected
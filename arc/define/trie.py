@@ -0,0 +1,56 @@
+from __future__ import annotations
+
+import typing as t
+
+V = t.TypeVar("V")
+
+
+class Trie(t.Generic[V]):
+    """Character trie that maps string keys to values. Used for looking
+    up keys, and every key that starts with a given prefix. Each node
+    stores the keys below it, so finding the keys that start with a
+    prefix only takes walking the prefix"""
+
+    __slots__ = ("children", "keys")
+
+    def __init__(self) -> None:
+        self.children: dict[str, Trie[V]] = {}
+        self.keys: dict[str, V] = {}
+        """Every key that starts with the prefix of this node, in insertion order"""
+
+    def __len__(self) -> int:
+        return len(self.keys)
+
+    def __contains__(self, key: str) -> bool:
+        return key in self.keys
+
+    def insert(self, key: str, value: V) -> None:
+        node = self
+        node.keys[key] = value
+        for char in key:
+            child = node.children.get(char)
+            if child is None:
+                child = node.children[char] = Trie()
+            node = child
+            node.keys[key] = value
+
+    def get(self, key: str, default: V | None = None) -> V | None:
+        return self.keys.get(key, default)
+
+    def items(self, prefix: str = "") -> list[tuple[str, V]]:
+        """All of the keys that start with `prefix`, along with their values.
+        Returned in the order they were inserted"""
+        node = self._node(prefix)
+        if node is None:
+            return []
+
+        return list(node.keys.items())
+
+    def _node(self, key: str) -> Trie[V] | None:
+        node: Trie[V] | None = self
+        for char in key:
+            node = node.children.get(char)  # type: ignore[union-attr]
+            if node is None:
+                return None
+
+        return node
@@ -1,12 +1,14 @@
 from __future__ import annotations
 
 import argparse
+import re
 import typing as t
 
 import arc
 import arc.typing as at
 from arc import errors, safe
 from arc.autocompletions import ShellCompletion
+from arc.constants import MISSING
 from arc.define.param import Action, Param
 
 
@@ -74,6 +76,333 @@ class Parser(argparse.ArgumentParser):
         raise errors.Exit(status, message)
 
 
+_NEGATIVE_NUMBER = re.compile(r"^-\d+$|^-\d*\.\d+$")
+
+# A classified token is either `None` (a positional value)
+# or a tuple of (param, option string, explicit argument). `param`
+# is `None` when the token looks like an option, but isn't one we know about
+OptionMatch = tuple[Param[t.Any] | None, str, str | None] | None
+
+
+class NativeParser:
+    """arc's native parsing engine. Produces the same results as `Parser`,
+    but works directly off of the `Param` objects instead of building
+    up an `argparse.ArgumentParser`. Input is tokenized in a single pass,
+    options are consumed as they are encountered and positional values
+    are distributed amongst the argument params once all input is consumed.
+    """
+
+    def __init__(self) -> None:
+        self.param_map: dict[str, Param[t.Any]] = {}
+        self.positionals: list[Param[t.Any]] = []
+        self.options: dict[str, Param[t.Any]] = {}
+        self.defaults: dict[str, t.Any] = {}
+        self.custom_actions: dict[str, argparse.Action] = {}
+        self._has_negative_number_options = False
+
+    def add_param(self, param: Param[t.Any], command: Command) -> None:
+        names = param.get_param_names()
+
+        for name in names:
+            self.param_map[name] = param
+
+        if safe.issubclass(param.action, argparse.Action):
+            action_cls = t.cast(type[argparse.Action], param.action)
+            kwargs: dict[str, t.Any] = {"dest": param.argument_name}
+            if (default := param.parser_default) is not None:
+                kwargs["default"] = default
+            if safe.issubclass(action_cls, CustomAction):
+                kwargs["command"] = command
+
+            action = action_cls(option_strings=names, **kwargs)
+            self.custom_actions[param.argument_name] = action
+            if action.default is not argparse.SUPPRESS:
+                self.defaults[param.argument_name] = action.default
+        else:
+            self.defaults[param.argument_name] = param.parser_default
+
+        if param.is_argument:
+            self.positionals.append(param)
+        else:
+            for name in names:
+                self.options[name] = param
+                if _NEGATIVE_NUMBER.match(name):
+                    self._has_negative_number_options = True
+
+    def parse_known_intermixed_args(
+        self, args: t.Sequence[str]
+    ) -> tuple[at.ParseResult, list[str]]:
+        namespace = argparse.Namespace()
+        result: dict[str, t.Any] = vars(namespace)
+        result.update(self.defaults)
+        args, tokens = self._tokenize(args)
+        values: list[str] = []
+        extra: list[str] = []
+
+        index = 0
+        while index < len(args):
+            match = tokens[index]
+            if match is None:
+                values.append(args[index])
+                index += 1
+            elif match[0] is None:
+                extra.append(args[index])
+                index += 1
+            else:
+                index = self._consume_option(match, args, tokens, index + 1, namespace)
+
+        extra.extend(self._consume_positionals(values, result))
+
+        return result, extra
+
+    def error(self, message: str) -> t.NoReturn:
+        raise errors.ParserError(message)
+
+    def _tokenize(self, args: t.Sequence[str]) -> tuple[list[str], list[OptionMatch]]:
+        """Classifies each arg as either an option or a positional value"""
+        tokens: list[OptionMatch] = []
+
+        for index, arg in enumerate(args):
+            if arg == "--":
+                # Everything after the seperator is positional,
+                # the seperator itself is discarded
+                rest = list(args[index + 1 :])
+                tokens.extend(None for _ in rest)
+                return [*args[:index], *rest], tokens
+
+            tokens.append(self._match_option(arg))
+
+        return list(args), tokens
+
+    def _match_option(self, arg: str) -> OptionMatch:
+        if not arg or arg[0] != "-":
+            return None
+
+        if arg in self.options:
+            return self.options[arg], arg, None
+
+        if len(arg) == 1:
+            return None
+
+        if "=" in arg:
+            option_string, explicit = arg.split("=", 1)
+            if option_string in self.options:
+                return self.options[option_string], option_string, explicit
+
+        matches = self._match_abbreviation(arg)
+        if len(matches) > 1:
+            options = ", ".join(option_string for _, option_string, _ in matches)
+            self.error(f"ambiguous option: {arg} could match {options}")
+        elif matches:
+            return matches[0]
+
+        if _NEGATIVE_NUMBER.match(arg) and not self._has_negative_number_options:
+            return None
+
+        if " " in arg:
+            return None
+
+        return None, arg, None
+
+    def _match_abbreviation(
+        self, arg: str
+    ) -> list[tuple[Param[t.Any], str, str | None]]:
+        matches: list[tuple[Param[t.Any], str, str | None]] = []
+
+        if arg.startswith("--"):
+            prefix, sep, explicit = arg.partition("=")
+            for option_string, param in self.options.items():
+                if option_string.startswith(prefix):
+                    matches.append((param, option_string, explicit if sep else None))
+        else:
+            short = arg[:2]
+            for option_string, param in self.options.items():
+                if option_string == short:
+                    matches.append((param, option_string, arg[2:]))
+                elif option_string.startswith(arg):
+                    matches.append((param, option_string, None))
+
+        return matches
+
+    def _consume_option(
+        self,
+        match: tuple[Param[t.Any] | None, str, str | None],
+        args: list[str],
+        tokens: list[OptionMatch],
+        index: int,
+        namespace: argparse.Namespace,
+    ) -> int:
+        param, option_string, explicit = match
+        assert param is not None
+
+        while True:
+            nargs = self._nargs(param)
+
+            if explicit is None:
+                available = 0
+                while (
+                    index + available < len(args) and tokens[index + available] is None
+                ):
+                    available += 1
+
+                count = self._option_arg_count(param, nargs, available)
+                self._apply(
+                    param, option_string, nargs, args[index : index + count], namespace
+                )
+                return index + count
+
+            if nargs == 0:
+                # Combined short flags (-abc) are handled by
+                # splitting off the next flag and continuing on
+                if option_string[1] != "-" and explicit:
+                    self._apply(param, option_string, nargs, [], namespace)
+                    next_option = "-" + explicit[0]
+                    if next_option in self.options:
+                        param = self.options[next_option]
+                        option_string = next_option
+                        explicit = explicit[1:] or None
+                        continue
+
+                self.error(
+                    f"argument {'/'.join(param.get_param_names())}: "
+                    f"ignored explicit argument {explicit!r}"
+                )
+
+            self._option_arg_count(param, nargs, 1)
+            self._apply(param, option_string, nargs, [explicit], namespace)
+            return index
+
+    def _option_arg_count(
+        self, param: Param[t.Any], nargs: at.NArgs, available: int
+    ) -> int:
+        if nargs == "?":
+            return min(available, 1)
+        elif nargs == "*":
+            return available
+        elif nargs == "+" or nargs is None:
+            required = 1
+        else:
+            required = nargs
+
+        if available < required:
+            raise errors.MissingOptionValueError(param)
+
+        return available if nargs == "+" else required
+
+    def _apply(
+        self,
+        param: Param[t.Any],
+        option_string: str,
+        nargs: at.NArgs,
+        strings: list[str],
+        namespace: argparse.Namespace,
+    ) -> None:
+        result = vars(namespace)
+        dest = param.argument_name
+        value = self._get_values(param, nargs, strings)
+
+        if action := self.custom_actions.get(dest):
+            action(
+                t.cast(argparse.ArgumentParser, self), namespace, value, option_string
+            )
+        elif param.action is Action.STORE_TRUE:
+            result[dest] = True
+        elif param.action is Action.STORE_FALSE:
+            result[dest] = False
+        elif param.action is Action.COUNT:
+            count = result.get(dest)
+            if count is None or count is MISSING:
+                count = 0
+            result[dest] = count + 1
+        elif param.action is Action.APPEND:
+            items = result.get(dest)
+            items = [] if items is None or items is MISSING else list(items)
+            items.append(value)
+            result[dest] = items
+        else:
+            result[dest] = value
+
+    def _get_values(
+        self, param: Param[t.Any], nargs: at.NArgs, strings: list[str]
+    ) -> t.Any:
+        if nargs == "?":
+            if strings:
+                return strings[0]
+            return self.defaults.get(param.argument_name) if param.is_argument else None
+        elif nargs is None:
+            return strings[0] if strings else None
+        elif nargs == "*" and not strings and param.is_argument:
+            default = self.defaults.get(param.argument_name)
+            return default if default is not None else strings
+
+        return strings
+
+    def _consume_positionals(
+        self, values: list[str], result: dict[str, t.Any]
+    ) -> list[str]:
+        minimums = [self._min_args(param) for param in self.positionals]
+
+        if sum(minimums) > len(values):
+            # Mirror argparse: match the longest prefix of positionals we can,
+            # the rest are reported as missing if they require a value
+            total = 0
+            matched = 0
+            for minimum in minimums:
+                if total + minimum > len(values):
+                    break
+                total += minimum
+                matched += 1
+
+            missing = [
+                param.argument_name
+                for param, minimum in zip(
+                    self.positionals[matched:], minimums[matched:]
+                )
+                if minimum
+            ]
+            self.error(f"the following arguments are required: {', '.join(missing)}")
+
+        index = 0
+        for pos, param in enumerate(self.positionals):
+            nargs = self._nargs(param)
+            available = len(values) - index - sum(minimums[pos + 1 :])
+
+            if nargs == "?":
+                count = min(available, 1)
+            elif nargs in ("*", "+"):
+                count = available
+            elif nargs is None:
+                count = 1
+            else:
+                count = t.cast(int, nargs)
+
+            strings = values[index : index + count]
+            index += count
+            result[param.argument_name] = self._get_values(param, nargs, strings)
+
+        return values[index:]
+
+    def _min_args(self, param: Param[t.Any]) -> int:
+        nargs = self._nargs(param)
+        if nargs in ("?", "*"):
+            return 0
+        elif nargs in ("+", None):
+            return 1
+
+        return t.cast(int, nargs)
+
+    def _nargs(self, param: Param[t.Any]) -> at.NArgs:
+        if action := self.custom_actions.get(param.argument_name):
+            return action.nargs  # type: ignore[return-value]
+
+        if param.action in (Action.STORE_TRUE, Action.STORE_FALSE, Action.COUNT):
+            return 0
+        elif param.action is Action.APPEND:
+            return None
+
+        return param.nargs
+
+
 class CustomAction(argparse.Action):
     def __init__(self, *args: t.Any, command: Command, **kwargs: t.Any) -> None:
         super().__init__(*args, **kwargs)
@@ -100,5 +429,8 @@ class CustomAutocompleteAction(CustomAction, argparse._StoreAction):
         value: t.Any,
         option_string: str | None = None,
     ) -> None:
-        print(ShellCompletion.run(value, self.command), end="")
+        print(
+            ShellCompletion.run(value, self.command, log=self.command.config.debug),
+            end="",
+        )
         arc.exit()
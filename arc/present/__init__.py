@@ -7,4 +7,4 @@ from .joiner import Join as Join
 from .out import err as err, info as info, print as print, usage as usage, log as log
 from .pager import pager as pager
 from .table import Table as Table
-from ._markdown import markdown as markdown, parse_markdown as parse_markdown, MarkdownParser as MarkdownParser
+from ._markdown import markdown as markdown, parse_markdown as parse_markdown, stream_markdown as stream_markdown, MarkdownParser as MarkdownParser
@@ -1,2 +1,6 @@
 from .markdown_parser import MarkdownParser as MarkdownParser
-from ._markdown import markdown as markdown, parse_markdown as parse_markdown
+from ._markdown import (
+    markdown as markdown,
+    parse_markdown as parse_markdown,
+    stream_markdown as stream_markdown,
+)
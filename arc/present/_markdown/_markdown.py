@@ -19,6 +19,43 @@ def markdown(text: str, config: PresentConfig | None = None) -> str:
     return doc.fmt(config)
 
 
+def stream_markdown(
+    lines: str | t.Iterable[str], config: PresentConfig | None = None
+) -> t.Iterator[str]:
+    """Converts markdown to formatted strings, one per block. `lines` may be
+    a string, an open file, or any other iterable of lines. Each block is yielded
+    as soon as it has been parsed, so the whole document is never held in memory.
+    Joining the results together is equivalent to calling `markdown()`"""
+    if isinstance(lines, str):
+        lines = lines.strip().split("\n")
+
+    if config is None:
+        from arc.config import PresentConfig
+
+        config = PresentConfig()
+
+    # The newlines at the end of each block are held back until another
+    # non-empty block follows, so that the end of the document can be
+    # trimmed the same way `Document.fmt()` does
+    pending = ""
+    started = False
+    for node in MarkdownParser().parse_stream(lines):
+        text = node.fmt(config)
+        if not started:
+            text = text.lstrip("\n")
+
+        body = text.rstrip("\n")
+        if body:
+            yield pending + body
+            pending = ""
+            started = True
+
+        if started:
+            pending += text[len(body) :]
+
+    yield "\n"
+
+
 def parse_markdown(text: str) -> Document:
     """Converts a markdown string to a formatted string."""
     parser = MarkdownParser()
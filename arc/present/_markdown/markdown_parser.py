@@ -1,4 +1,5 @@
 from __future__ import annotations
+import typing as t
 from collections import deque
 from arc.present._markdown.nodes import (
     BlockNode,
@@ -30,34 +31,60 @@ class InputDeque(deque[str]):
         return self[0]
 
 
+class LineStream:
+    """Lazily reads lines from an iterable, holding at most one line of lookahead"""
+
+    def __init__(self, lines: t.Iterable[str]) -> None:
+        self.__lines = iter(lines)
+        self.__next: str | None = None
+
+    def __bool__(self) -> bool:
+        return self.peek() is not None
+
+    def peek(self) -> str | None:
+        if self.__next is None:
+            line = next(self.__lines, None)
+            if line is not None:
+                self.__next = line.rstrip("\r\n")
+
+        return self.__next
+
+    def popleft(self) -> str:
+        line = self.peek()
+        if line is None:
+            raise IndexError("pop from an empty LineStream")
+
+        self.__next = None
+        return line
+
+
 class MarkdownParser:
     def parse(self, input: str) -> Document:
-        stream = InputDeque(line for line in input.strip().split("\n"))
+        return Document(list(self.parse_stream(input.strip().split("\n"))))
 
-        nodes: list[BlockNode] = []
-
-        while stream:
-            curr = stream[0]
+    def parse_stream(self, lines: t.Iterable[str]) -> t.Iterator[BlockNode]:
+        """Parses `lines` lazily, yielding each block node as soon as
+        the lines that make it up have been consumed"""
+        stream = LineStream(lines)
 
+        while (curr := stream.peek()) is not None:
             if not curr:
                 stream.popleft()
                 continue
 
             if curr.startswith("#"):
                 stream.popleft()
-                nodes.append(self.parse_heading(curr))
+                yield self.parse_heading(curr)
             elif curr.startswith("---"):
                 stream.popleft()
-                nodes.append(HorizontalRule())
+                yield HorizontalRule()
             elif curr.startswith("-"):
-                nodes.append(self.parse_list(stream))
+                yield self.parse_list(stream)
             elif curr == "```":
                 stream.popleft()
-                nodes.append(self.parse_unformatted(stream))
+                yield self.parse_unformatted(stream)
             else:
-                nodes.append(self.parse_paragraph(stream))
-
-        return Document(nodes)
+                yield self.parse_paragraph(stream)
 
     def parse_heading(self, line: str) -> Heading:
         level = len(line) - len(line.lstrip("#"))
@@ -67,10 +94,10 @@ class MarkdownParser:
 
         return Heading(content, level)
 
-    def parse_paragraph(self, stream: deque[str]) -> Paragraph:
+    def parse_paragraph(self, stream: LineStream) -> Paragraph:
         lines: list[InlineNode] = []
 
-        while stream and stream[0] != "":
+        while stream and stream.peek() != "":
             line = stream.popleft().strip()
             lines.append(self.parse_inline(line))
             lines.append(Spacer())
@@ -80,7 +107,7 @@ class MarkdownParser:
 
         return Paragraph(lines)
 
-    def parse_list(self, stream: InputDeque) -> List:
+    def parse_list(self, stream: LineStream) -> List:
         elements: list[InlineNode] = []
 
         curr_element: str = stream.popleft()[1:].strip()
@@ -99,7 +126,7 @@ class MarkdownParser:
         elements.append(self.parse_inline(curr_element))
         return List(elements)
 
-    def parse_unformatted(self, stream: InputDeque) -> Unformatted:
+    def parse_unformatted(self, stream: LineStream) -> Unformatted:
         lines: list[str] = []
 
         while stream and stream.peek() != "```":
@@ -3,6 +3,25 @@
 import functools
 import re
 import typing as t
+import unicodedata
+
+ESCAPE_SEQUENCE = re.compile(
+    # OSC (hyperlinks, window titles, etc...), terminated by BEL or ST
+    r"(?:\x1b\]|\x9d)[^\x07\x1b\x9c]*(?:\x07|\x1b\\|\x9c)?"
+    # CSI (colors, cursor movement, etc...), terminated by any final byte
+    r"|(?:\x1b\[|\x9b)[0-?]*[ -/]*[@-~]"
+    # Any other escape sequence
+    r"|\x1b[ -/]*[0-~]"
+)
+"""Matches ANSI escape sequences"""
+ESCAPE_SEQUENCE_SPLIT = re.compile(f"({ESCAPE_SEQUENCE.pattern})")
+
+ESCAPE_CHARS = frozenset("\x1b\x9b\x9d")
+
+WIDTH_CACHE_SIZE = 4096
+"""Number of strings to cache the display width of"""
+WIDTH_CACHE_MAX_LENGTH = 256
+"""Strings longer than this are not cached, so that the cache doesn't keep large strings alive"""
 
 
 class Ansi:
@@ -17,28 +36,75 @@ class Ansi:
     @classmethod
     def clean(cls, string: str) -> str:
         """Gets rid of escape sequences"""
-        return cls.__ansi_escape().sub("", string)
+        if ESCAPE_CHARS.isdisjoint(string):
+            return string
+
+        return ESCAPE_SEQUENCE.sub("", string)
 
     @classmethod
     def len(cls, string: str) -> int:
-        """Length of a string, not including escape sequences"""
-        length = 0
-        in_escape_code = False
-
-        for char in string:
-            if in_escape_code and char == "m":
-                in_escape_code = False
-            elif char == "\x1b" or in_escape_code:
-                in_escape_code = True
-            else:
-                length += 1
+        """Number of columns the string takes up when displayed in a terminal.
+        Escape sequences take up none, and East Asian wide characters take up two.
+        This should be used in place of `len()` whenever text is aligned"""
+        if len(string) > WIDTH_CACHE_MAX_LENGTH:
+            return _display_width(string)
 
-        return length
+        return _cached_display_width(string)
 
     @classmethod
-    @functools.cache
-    def __ansi_escape(self) -> re.Pattern[str]:
-        return re.compile(r"(\x9B|\x1B\[)[0-?]*[ -\/]*[@-~]")
+    def truncate(cls, string: str, width: int, placeholder: str = "…") -> str:
+        """Shortens the string to at most `width` columns (as measured by
+        `Ansi.len()`), ending it with `placeholder`. Escape sequences
+        are kept, so the text keeps its color"""
+        if cls.len(string) <= width:
+            return string
+
+        limit = width - cls.len(placeholder)
+        if limit < 0:
+            return ""
+
+        parts: list[str] = []
+        used = 0
+        # Every other part is an escape sequence
+        for idx, part in enumerate(ESCAPE_SEQUENCE_SPLIT.split(string)):
+            if idx % 2:
+                parts.append(part)
+                continue
+
+            for char in part:
+                used += _char_width(char)
+                if used > limit:
+                    break
+                parts.append(char)
+
+            if used > limit:
+                break
+
+        parts.append(placeholder)
+        if not ESCAPE_CHARS.isdisjoint(string):
+            parts.append(fx.CLEAR)
+
+        return "".join(parts)
+
+
+def _display_width(string: str) -> int:
+    string = Ansi.clean(string)
+    if string.isascii():
+        return len(string)
+
+    return sum(map(_char_width, string))
+
+
+_cached_display_width = functools.lru_cache(WIDTH_CACHE_SIZE)(_display_width)
+
+
+@functools.cache
+def _char_width(char: str) -> int:
+    if unicodedata.category(char) in ("Mn", "Me", "Cf"):
+        return 0
+    if unicodedata.east_asian_width(char) in ("W", "F"):
+        return 2
+    return 1
 
 
 class fg:
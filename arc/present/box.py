@@ -1,4 +1,3 @@
-import re
 import shutil
 from typing import Optional, Union
 
@@ -58,7 +57,7 @@ class Box:
         cleaned = list(
             self.pad_line(Ansi.clean(string)) for string in self.string.split("\n")
         )
-        width = len(max(cleaned, key=len)) + 4
+        width = max(map(Ansi.len, cleaned)) + 4
         term_width, _ = shutil.get_terminal_size()
         width = min(width, term_width)
 
@@ -106,23 +105,23 @@ class Box:
         width: int,
         cleaned: Optional[str] = None,
     ) -> str:
-        cleaned = cleaned or line
-        formatted = (
+        content = self.pad_line(line) if line else ""
+        # The display width of the clean string is used, so that colored
+        # and wide characters are padded correctly
+        space = max(width - 2 - Ansi.len(cleaned or content), 0)
+        if self.__justify == "<":
+            left = 0
+        elif self.__justify == ">":
+            left = space
+        else:
+            left = space // 2
+
+        return (
             f"{self.__color}{self.border['vertical']}{fx.CLEAR}"
-            f"{cleaned:{self.__justify}{width - 2}}"
+            f"{' ' * left}{content}{' ' * (space - left)}"
             f"{self.__color}{self.border['vertical']}{fx.CLEAR}\n"
         )
 
-        if line == "":
-            return formatted
-
-        # Uses the clean string for calculating the necessary
-        # amount of padding on the right, but we want the color, so
-        # just re.sub it back in after
-        regex = re.compile(cleaned)
-        formatted = regex.sub(self.pad_line(line), formatted)
-        return formatted
-
     def pad_line(self, line: str) -> str:
         return " " * self.__padding["left"] + line + " " * self.__padding["right"]
 
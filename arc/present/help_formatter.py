@@ -78,7 +78,7 @@ class DefaultHelpFormatter(TextFormatter):
         options = self.get_params(self.key_params)
         subcommands = self.get_subcommands(
             self.command, self.command.subcommands.values()
-        )
+        ) + self.get_lazy_subcommands(self.command)
 
         longest = max(map(Ansi.len, (v[0] for v in args + options + subcommands))) + 2
 
@@ -93,10 +93,11 @@ class DefaultHelpFormatter(TextFormatter):
 
     def write_usage(self) -> None:
         command = self.command
+        has_subcommands = bool(command.subcommands or command.lazy_subcommands)
 
         with self.section("# USAGE"):
             self.write("```\n")
-            if command.is_root and command.subcommands:
+            if command.is_root and has_subcommands:
                 params_str = self.usage_params(self.key_params, self.argument_params)
                 self.write_text(
                     Join.with_space(
@@ -107,7 +108,7 @@ class DefaultHelpFormatter(TextFormatter):
                     )
                 )
 
-                if self.doc.command.subcommands:
+                if has_subcommands:
                     self.write_paragraph()
                     self.write_text(
                         Join.with_space(
@@ -137,10 +138,10 @@ class DefaultHelpFormatter(TextFormatter):
                             remove_falsey=True,
                         )
                     )
-                    if self.doc.command.subcommands:
+                    if has_subcommands:
                         self.write_paragraph()
 
-                if self.doc.command.subcommands:
+                if has_subcommands:
                     self.write_text(
                         Join.with_space(
                             [
@@ -258,6 +259,18 @@ class DefaultHelpFormatter(TextFormatter):
 
         return data
 
+    def get_lazy_subcommands(self, parent: Command) -> list[tuple[str, str]]:
+        data = []
+        for lazy in parent.lazy_subcommands.values():
+            name = colorize(lazy.name, self.color.accent)
+            aliases = parent.lazy_subcommands.aliases_for(lazy.name)
+            if aliases:
+                name += colorize(f" ({Join.with_comma(aliases)})", self.color.subtle)
+
+            data.append((name, lazy.short_description or ""))
+
+        return data
+
     def write_section(
         self, section: str, data: list[tuple[str, str]], longest: int
     ) -> None:
@@ -1,5 +1,6 @@
 import os
 import subprocess
+import typing as t
 
 from arc import errors
 
@@ -28,8 +29,12 @@ def pager(contents: object, command: list[str] | None = None) -> None:
     $ cli-app | less
     ```
 
+    If `contents` is an iterator (like the output of `stream_markdown()`, or an open file),
+    each chunk is written to the pager as soon as it is produced, so the user can
+    begin reading before all of it has been generated.
+
     Args:
-        contents (str): String contents to display in their page
+        contents (str | Iterator[str]): String contents to display in their page
         command (list[str] | None, optional): Override the default
             pager discovery with a given command to run. Defaults to None.
 
@@ -37,4 +42,17 @@ def pager(contents: object, command: list[str] | None = None) -> None:
         ArcError: if no pager can be found for the user
     """
     command = command or [_get_pager_command()]
-    subprocess.run(command, input=str(contents).encode("utf-8"))
+
+    if not isinstance(contents, t.Iterator):
+        subprocess.run(command, input=str(contents).encode("utf-8"))
+        return
+
+    try:
+        with subprocess.Popen(command, stdin=subprocess.PIPE) as process:
+            assert process.stdin
+            for chunk in contents:
+                process.stdin.write(str(chunk).encode("utf-8"))
+                process.stdin.flush()
+    except BrokenPipeError:
+        # The user closed the pager before reaching the end
+        pass
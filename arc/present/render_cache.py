@@ -0,0 +1,108 @@
+"""Persistent cache for rendered text, like help messages. Entries are stored
+as individual files, so that they are shared between processes"""
+
+from __future__ import annotations
+
+import contextlib
+import hashlib
+import os
+import sys
+import tempfile
+import typing as t
+
+from arc.version import __version__
+
+MAX_ENTRIES = 256
+
+
+def user_cache_dir(name: str) -> str:
+    """The platform's directory for `name`'s user-specific cache files
+
+    ```py
+    arc.configure(present=PresentConfig(cache_dir=user_cache_dir("mycli")))
+    ```
+    """
+    if sys.platform == "win32":
+        base = os.getenv("LOCALAPPDATA") or os.path.expanduser("~\\AppData\\Local")
+        return os.path.join(base, name, "Cache")
+    if sys.platform == "darwin":
+        return os.path.join(os.path.expanduser("~/Library/Caches"), name)
+
+    base = os.getenv("XDG_CACHE_HOME") or os.path.expanduser("~/.cache")
+    return os.path.join(base, name)
+
+
+class RenderCache:
+    """Cache of rendered strings stored in `directory`. Holds at most `max_entries`
+    entries, the least recently used entries are removed when it is full"""
+
+    def __init__(
+        self, directory: str | os.PathLike[str], max_entries: int = MAX_ENTRIES
+    ) -> None:
+        self.directory = os.fspath(directory)
+        self.max_entries = max_entries
+
+    @staticmethod
+    def key(*parts: object) -> str:
+        """Creates a key from the `repr()` of `parts`. Includes
+        the version of arc, as rendering may change between versions"""
+        return hashlib.sha256(repr((__version__, *parts)).encode()).hexdigest()
+
+    def path(self, key: str) -> str:
+        return os.path.join(self.directory, key)
+
+    def get(self, key: str) -> str | None:
+        path = self.path(key)
+        try:
+            with open(path, encoding="utf-8") as f:
+                value = f.read()
+        except OSError:
+            return None
+
+        # The modification time is used to track when an entry was last used
+        with contextlib.suppress(OSError):
+            os.utime(path)
+
+        return value
+
+    def set(self, key: str, value: str) -> None:
+        """Stores `value` for `key`. Failing to write to the
+        cache is not an error, the value just won't be cached"""
+        with contextlib.suppress(OSError):
+            os.makedirs(self.directory, exist_ok=True)
+            fd, tmp = tempfile.mkstemp(dir=self.directory, prefix=".tmp")
+            try:
+                with os.fdopen(fd, "w", encoding="utf-8") as f:
+                    f.write(value)
+                # Replaced atomically, so concurrent readers never see a partial entry
+                os.replace(tmp, self.path(key))
+            except OSError:
+                os.unlink(tmp)
+                raise
+
+            self.prune()
+
+    def prune(self) -> None:
+        """Removes the least recently used entries, until there are at most `max_entries`"""
+        with contextlib.suppress(OSError):
+            entries = [
+                entry
+                for entry in os.scandir(self.directory)
+                if entry.is_file() and not entry.name.startswith(".tmp")
+            ]
+            if len(entries) <= self.max_entries:
+                return
+
+            entries.sort(key=lambda entry: entry.stat().st_mtime_ns)
+            for entry in entries[: len(entries) - self.max_entries]:
+                with contextlib.suppress(FileNotFoundError):
+                    os.unlink(entry.path)
+
+    def fetch(self, key: str, render: t.Callable[[], str]) -> str:
+        """Retrieves the value for `key`, calling `render()` to create it on a miss"""
+        value = self.get(key)
+        if value is None:
+            value = render()
+            self.set(key, value)
+
+        return value
@@ -1,11 +1,11 @@
 from __future__ import annotations
 
-import functools
+import array
 import itertools
 import typing as t
 
 from arc import errors
-from arc.present import drawing
+from arc.present import drawing, out
 from arc.present.ansi import Ansi, colorize, fg, fx
 
 
@@ -51,6 +51,14 @@ ColumnInput = t.Sequence[t.Union[str, Column]]
 Row = dict[str, t.Any]
 TableFormatter = t.Callable[[t.Any], str]
 
+
+class FormattedCells(t.NamedTuple):
+    """The formatted contents of the cells in a column, along with their display widths"""
+
+    text: list[str]
+    widths: array.array[int]
+
+
 T = t.TypeVar("T")
 
 
@@ -136,34 +144,57 @@ class Table:
             self.add_rows(rows)
 
     def __str__(self) -> str:
-        for col in self.__columns:
-            cells = [row[col["name"]] for row in self.__rows]
-            cells.append(col["name"])
+        cells = self._format_columns(self.__rows)
+        widths = self._column_widths(cells)
 
-            col["width"] = max(
-                Ansi.len(self._fmt_cell_contents(cell)) + 2 for cell in cells
-            )
+        lines = [self._fmt_header(widths), *self._fmt_rows(cells, widths)]
+        if not self.__rows:
+            return lines[0] + "\n"
 
-        table = ""
-        table += self._fmt_header()
-        table += "\n"
+        lines.append(self._fmt_footer(widths))
+        return "\n".join(lines)
 
-        for row, has_next_row in has_next(self.__rows):
-            table += self._fmt_row(row, has_next_row)
-            if has_next_row:
-                table += "\n"
-
-        return table
+    def stream(
+        self,
+        rows: t.Iterable[t.Sequence[t.Any]],
+        sample: int = 100,
+        file: t.IO[str] | None = None,
+    ) -> None:
+        """Print a table of `rows` as they are produced, instead of collecting
+        them all first. Useful for large, or unbounded, sets of rows
 
-    def add_row(self, row: t.Sequence[t.Any]) -> None:
-        if len(row) > len(self.__columns):
-            raise errors.ArcError("Too many values")
+        ```py
+        table = Table(["Host", "Status"])
+        table.stream(inventory.hosts(), sample=50)
+        ```
 
-        resolved = {}
-        for col, value in itertools.zip_longest(self.__columns, row, fillvalue=""):
-            resolved[col["name"]] = value  # type: ignore
+        Args:
+            rows (Iterable[Sequence[Any]]): Rows to display. Rows previously added
+                with `add_row()` are displayed first
+            sample (int, optional): Number of rows to determine the width of each column
+                from. Columns that provide a `width` use it instead. Cells in later rows that
+                don't fit in their column are truncated. Defaults to 100
+            file (IO[str], optional): Stream to write to. Defaults to stdout
+        """
+        for line in self.lines(rows, sample):
+            out.print(line, file=file)
+
+    def lines(
+        self, rows: t.Iterable[t.Sequence[t.Any]] = (), sample: int = 100
+    ) -> t.Iterator[str]:
+        """Lazily renders the table, one line at a time. See `Table.stream()`"""
+        stream = itertools.chain(self.__rows, map(self._resolve_row, rows))
+        window = self._format_columns(list(itertools.islice(stream, sample)))
+        widths = self._column_widths(window)
+
+        yield self._fmt_header(widths)
+        yield from self._fmt_rows(window, widths)
+        for row in stream:
+            yield from self._fmt_rows(self._format_columns([row]), widths)
+        yield self._fmt_footer(widths)
 
-        self.__rows.append(resolved)
+    def add_row(self, row: t.Sequence[t.Any]) -> None:
+        self.__rows.append(self._resolve_row(row))
 
     def add_rows(self, rows: t.Sequence[t.Sequence[t.Any]]) -> None:
         for row in rows:
@@ -215,33 +246,64 @@ class Table:
 
         return inner
 
-    def _fmt_header(self) -> str:
+    def _resolve_row(self, row: t.Sequence[t.Any]) -> Row:
+        if len(row) > len(self.__columns):
+            raise errors.ArcError("Too many values")
+
+        resolved = {}
+        for col, value in itertools.zip_longest(self.__columns, row, fillvalue=""):
+            resolved[col["name"]] = value  # type: ignore
+
+        return resolved
+
+    def _format_columns(self, rows: t.Sequence[Row]) -> list[FormattedCells]:
+        """Formats each cell in `rows` a single time, grouped by column"""
+        columns = []
+        for col in self.__columns:
+            name = col["name"]
+            text = [self._fmt_cell_contents(row[name]) for row in rows]
+            columns.append(FormattedCells(text, array.array("I", map(Ansi.len, text))))
+
+        return columns
+
+    def _column_widths(self, cells: t.Sequence[FormattedCells]) -> list[int]:
+        """The width of each column, including padding. Columns without a fixed
+        `width` are sized to fit their widest cell, cells that don't fit in
+        a column with a fixed `width` are truncated"""
+        widths = []
+
+        for col, column in zip(self.__columns, cells):
+            if "width" in col:
+                widths.append(col["width"])
+            else:
+                header = Ansi.len(self._fmt_cell_contents(col["name"], header=True))
+                widths.append(max(max(column.widths, default=0), header) + 2)
+
+        return widths
+
+    def _fmt_header(self, widths: t.Sequence[int]) -> str:
         border = self._head_border
         header = ""
 
         header += border["corner"]["top_left"]
-        for idx, col in enumerate(self.__columns):
-            header += border["horizontal"] * col["width"]
-            if idx < len(self.__columns) - 1:
+        for idx, width in enumerate(widths):
+            header += border["horizontal"] * width
+            if idx < len(widths) - 1:
                 header += border["intersect"]["hori_top"]
             else:
                 header += border["corner"]["top_right"]
 
         header += "\n"
         header += border["vertical"]
-        for col in self.__columns:
-            header += self._fmt_cell(
-                col["name"],
-                col["width"],
-                col["justify"],
-                header=True,
-            )
+        for col, width in zip(self.__columns, widths):
+            name = self._fmt_cell_contents(col["name"], header=True)
+            header += self._fmt_cell(name, Ansi.len(name), width, col["justify"])
             header += border["vertical"]
 
         header += "\n"
         header += border["intersect"]["vert_left"]
-        for col, has_next_column in has_next(self.__columns):
-            header += border["horizontal"] * col["width"]
+        for width, has_next_column in has_next(widths):
+            header += border["horizontal"] * width
             if has_next_column:
                 header += border["intersect"]["cross"]
             else:
@@ -249,52 +311,60 @@ class Table:
 
         return header
 
-    def _fmt_row(self, row: Row, next_row: bool) -> str:
-        border = self._border
-        fmt = ""
+    def _fmt_rows(
+        self, cells: t.Sequence[FormattedCells], widths: t.Sequence[int]
+    ) -> t.Iterator[str]:
+        vertical = self._border["vertical"]
+        columns = list(zip(cells, widths, (col["justify"] for col in self.__columns)))
+        rows = len(cells[0].text) if cells else 0
 
-        fmt += border["vertical"]
+        for idx in range(rows):
+            fmt = vertical
+            for column, width, justify in columns:
+                fmt += self._fmt_cell(
+                    column.text[idx], column.widths[idx], width, justify
+                )
+                fmt += vertical
 
-        for col in self.__columns:
-            cell = row.get(col["name"], "")
-            fmt += self._fmt_cell(cell, col["width"], col["justify"])
-            fmt += border["vertical"]
-
-        if not next_row:
-            fmt += "\n"
-            fmt += border["corner"]["bot_left"]
-            for col, has_next_column in has_next(self.__columns):
-                fmt += border["horizontal"] * col["width"]
-                if has_next_column:
-                    fmt += border["intersect"]["hori_bot"]
-                else:
-                    fmt += border["corner"]["bot_right"]
+            yield fmt
+
+    def _fmt_footer(self, widths: t.Sequence[int]) -> str:
+        border = self._border
+        fmt = border["corner"]["bot_left"]
+        for width, has_next_column in has_next(widths):
+            fmt += border["horizontal"] * width
+            if has_next_column:
+                fmt += border["intersect"]["hori_bot"]
+            else:
+                fmt += border["corner"]["bot_right"]
 
         return fmt
 
     def _fmt_cell(
         self,
-        cell: t.Any,
+        formatted_cell: str,
+        length: int,
         width: int,
         justify: drawing.Justification,
-        header: bool = False,
     ) -> str:
-        formatted_cell = self._fmt_cell_contents(cell, header)
         width = width - 2
-        padding = " " * (width - Ansi.len(formatted_cell))
+        if length > width:
+            formatted_cell = Ansi.truncate(formatted_cell, width)
+            length = Ansi.len(formatted_cell)
+
+        padding = " " * (width - length)
 
         if justify == "left":
             return " " + formatted_cell + padding + " "
         elif justify == "right":
             return " " + padding + formatted_cell + " "
         elif justify == "center":
-            padding_width, remainder = divmod(width - Ansi.len(formatted_cell), 2)
+            padding_width, remainder = divmod(width - length, 2)
             padding = " " * padding_width
             return (
                 " " + padding + formatted_cell + padding + ("  " if remainder else " ")
             )
 
-    @functools.cache
     def _fmt_cell_contents(self, cell: t.Any, header: bool = False) -> str:
         if header:
             return self._header_cell_formatter(cell)
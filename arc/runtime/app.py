@@ -1,6 +1,8 @@
 from __future__ import annotations
 
+import functools
 import os
+import shlex
 import sys
 import typing as t
 
@@ -8,14 +10,19 @@ import arc
 from arc.define.param import groups
 import arc.typing as at
 from arc import errors
+from arc.autocompletions import ShellCompletion
 from arc.logging import WARNING, logger, mode_map, DEBUG
 from arc.runtime.init import InitMiddleware
 from arc.runtime.middleware import Middleware, MiddlewareManager
 from arc.runtime.plugin import PluginManager
 
 if t.TYPE_CHECKING:
+    import asyncio
+
     from arc.define import Command
 
+T = t.TypeVar("T")
+
 
 class App(MiddlewareManager):
     def __init__(
@@ -31,12 +38,63 @@ class App(MiddlewareManager):
         self.state = state or {}
         self.config = root.config
         self.plugins = PluginManager()
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._completion_index_current = False
+
+    @classmethod
+    def from_snapshot(cls, path: str | os.PathLike[str], **kwargs: t.Any) -> App:
+        """Create an App from a command tree snapshot created with
+        [`Snapshot.dump()`][arc.snapshot.Snapshot.dump]. Only the module
+        of the command that gets executed will be imported.
+
+        Args:
+            path (str | PathLike): Path to the snapshot file
+            **kwargs: Passed on to the `App` constructor
+        """
+        from arc.snapshot import Snapshot
+
+        snapshot = Snapshot.load(path)
+        app = cls(snapshot.root, **kwargs)
+        app.use(snapshot.middleware, after=InitMiddleware.Parser)
+        return app
+
+    def serve(
+        self,
+        path: str | os.PathLike[str],
+        workers: int = 0,
+        max_requests: int | None = None,
+    ) -> None:
+        """Keeps the app resident, executing requests sent to the Unix socket at `path`
+        with [`arc.runtime.client`][arc.runtime.client]. Saves the cost of starting
+        Python and importing the app on each invocation. Unix only.
+
+        Args:
+            path (str | PathLike): Path to create the socket at
+            workers (int, optional): When provided, requests are handled concurrently
+                by a pool of this many forked worker processes. Defaults to handling
+                requests one at a time in this process
+            max_requests (int, optional): Replace each worker with a fresh one after
+                it has handled this many requests. Without workers, the server stops
+                after handling this many requests instead. Defaults to no limit
+        """
+        from arc.runtime.server import CommandServer, WorkerPool
+
+        if workers:
+            with WorkerPool(self, path, workers, max_requests) as pool:
+                pool.serve()
+        else:
+            with CommandServer(self, path) as server:
+                server.serve(max_requests)
 
     def __call__(self, input: at.InputArgs = None) -> t.Any:
         self._handle_dynamic_name()
         self._setup_logger()
+        shell = self._completion_shell(input)
         ctx = self._create_ctx({"arc.input": input})
         try:
+            if shell is not None:
+                self._complete(shell)
+
             try:
                 ctx = self._stack.start(ctx)
                 if "arc.command" not in ctx:
@@ -54,6 +112,7 @@ class App(MiddlewareManager):
                 self._stack.throw(e)
             else:
                 res = self._stack.close(res)
+                self._update_completion_index()
         except errors.ArcError as exc:
             if self.config.environment == "production":
                 arc.info(exc.fmt(ctx))
@@ -64,14 +123,140 @@ class App(MiddlewareManager):
             if exc.message:
                 arc.info(exc.fmt(ctx))
             raise
+        finally:
+            self.close_loop()
 
         return res
 
     def execute(self, command: Command, **kwargs: t.Any) -> t.Any:
+        """Executes `command` with `kwargs` as its arguments. When called from a coroutine
+        running on the app's event loop, the command is executed in a worker thread
+        (so that any async parts of it can still use the loop), and an awaitable
+        for its result is returned instead"""
         args = self._unroll_param_groups(kwargs)
         ctx = self._create_ctx({"arc.command": command, "arc.parse.result": args})
+        if self._in_loop():
+            return self.loop.run_in_executor(None, functools.partial(command.run, ctx))
+
         return command.run(ctx)
 
+    @property
+    def loop(self) -> asyncio.AbstractEventLoop:
+        """Event loop that coroutine callbacks, async middlewares and async
+        dependencies are run on. Created when it is first needed, and shared
+        by every command executed during the same call to the app"""
+        import asyncio
+
+        if self._loop is None or self._loop.is_closed():
+            self._loop = asyncio.new_event_loop()
+
+        return self._loop
+
+    def run_async(self, awaitable: t.Awaitable[T]) -> T:
+        """Runs `awaitable` on the app's event loop and returns its result. If the loop
+        is already running in another thread (see `App.execute()`), this blocks until
+        the loop has finished running it"""
+        import asyncio
+
+        async def wrapper() -> T:
+            return await awaitable
+
+        loop = self.loop
+        if not loop.is_running():
+            return loop.run_until_complete(wrapper())
+
+        if self._in_loop():
+            raise errors.InternalError(
+                "Cannot block on the event loop from within a coroutine "
+                "running on it. Await the object instead"
+            )
+
+        return asyncio.run_coroutine_threadsafe(wrapper(), loop).result()
+
+    def close_loop(self) -> None:
+        if self._loop is None or self._loop.is_running():
+            return
+
+        loop, self._loop = self._loop, None
+        try:
+            loop.run_until_complete(loop.shutdown_asyncgens())
+            loop.run_until_complete(loop.shutdown_default_executor())
+        finally:
+            loop.close()
+
+    def _in_loop(self) -> bool:
+        """Whether the caller is running on the app's event loop"""
+        if self._loop is None:
+            return False
+
+        import asyncio
+
+        try:
+            return asyncio.get_running_loop() is self._loop
+        except RuntimeError:
+            return False
+
+    def _completion_shell(self, input: at.InputArgs) -> str | None:
+        """When the shell is requesting completions, returns the name of the shell"""
+        if not self.config.autocomplete or not os.getenv(
+            ShellCompletion.completion_var_for(self.root.name)
+        ):
+            return None
+
+        if input is None:
+            args = sys.argv[1:]
+        elif isinstance(input, str):
+            args = shlex.split(input)
+        else:
+            args = list(input)
+
+        if "--autocomplete" not in args[:-1]:
+            return None
+
+        return args[args.index("--autocomplete") + 1]
+
+    def _complete(self, shell: str) -> t.NoReturn:
+        """Fast path for completions. Completions only need the command tree,
+        so this skips the init middleware stack (loading plugins, parsing, etc...)"""
+        root = self.root
+        if self.config.completion_index:
+            from arc.snapshot import Snapshot
+
+            # Building the index inspects every command that has been loaded,
+            # so that is left to `_update_completion_index()` after a command runs
+            snapshot = Snapshot.current(self.config.completion_index, root)
+            if snapshot is not None:
+                root = snapshot.root
+
+        if root is self.root:
+            InitMiddleware.AddRuntimeParms.add_params(root.param_def, self.config)
+
+        print(ShellCompletion.run(shell, root, log=self.config.debug), end="")
+        arc.exit()
+
+    def _update_completion_index(self) -> None:
+        """Creates the completion index if it is missing or out of date. This
+        runs after every command, so it only reads the header of the index, and
+        only does so once per process (the loaded modules can't change anyway)"""
+        if self._completion_index_current or not (
+            self.config.autocomplete and self.config.completion_index
+        ):
+            return
+
+        from arc.snapshot import Snapshot
+
+        path = self.config.completion_index
+        if not Snapshot.is_fresh(path, self.root):
+            try:
+                # Lazy subcommands are stored by their import path, so that
+                # running a command never imports all of them
+                Snapshot.create(self.root, load_lazy=False).dump(path)
+            except (errors.ArcError, OSError):
+                logger.debug("Unable to create completion index for %s", self.root)
+                return
+
+        self._completion_index_current = True
+
     def _create_ctx(self, data: dict[str, t.Any] = None) -> arc.Context:
         return arc.Context(
             {
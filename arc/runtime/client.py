@@ -0,0 +1,124 @@
+"""Client for [`CommandServer`][arc.runtime.server.CommandServer].
+
+This module only depends on the standard library, and does not import
+the rest of arc, so it can be run directly as a script to keep the startup
+time of each invocation as low as possible:
+
+```console
+$ python path/to/arc/runtime/client.py /tmp/cli.sock greet --name joe
+```
+
+The client forwards its arguments, environment, working directory and
+stdio file descriptors to the server, and exits with the exit code
+of the command.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import socket
+import struct
+import sys
+import typing as t
+
+HEADER = struct.Struct("!I")
+"""Length of the JSON payload that follows it. The stdio
+file descriptors are sent along with the header"""
+EXIT_CODE = struct.Struct("!i")
+
+
+def request(
+    path: str | os.PathLike[str],
+    args: t.Sequence[str],
+    *,
+    env: t.Mapping[str, str] | None = None,
+    cwd: str | None = None,
+    fds: t.Sequence[int] = (0, 1, 2),
+) -> int:
+    """Executes `args` on the server listening at `path`
+
+    Args:
+        path (str | PathLike): Path of the server's Unix socket
+        args (Sequence[str]): Command line arguments, not including the program name
+        env (Mapping[str, str], optional): Environment to run the command with.
+            Defaults to `os.environ`
+        cwd (str, optional): Directory to run the command in. Defaults to `os.getcwd()`
+        fds (Sequence[int], optional): File descriptors to use as stdin,
+            stdout and stderr for the command. Defaults to the client's own
+
+    Returns:
+        exit_code (int): The exit code of the command
+    """
+    payload = json.dumps(
+        {
+            "args": list(args),
+            "env": dict(os.environ if env is None else env),
+            "cwd": cwd or os.getcwd(),
+        }
+    ).encode()
+
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+        sock.connect(os.fspath(path))
+        socket.send_fds(sock, [HEADER.pack(len(payload))], list(fds))
+        sock.sendall(payload)
+        (code,) = EXIT_CODE.unpack(recv_exact(sock, EXIT_CODE.size))
+
+    return t.cast(int, code)
+
+
+def receive_request(conn: socket.socket) -> tuple[dict[str, t.Any], list[int]]:
+    """Receives a request sent by `request()`. Returns the
+    request data, along with the stdio file descriptors.
+
+    Raises:
+        ValueError: If the request isn't valid JSON
+        TypeError: If the request doesn't contain the expected data
+        OSError: If the connection is closed before the request is received
+    """
+    header, fds, _, _ = socket.recv_fds(conn, HEADER.size, 3)
+    try:
+        if len(header) < HEADER.size:
+            header += recv_exact(conn, HEADER.size - len(header))
+
+        (size,) = HEADER.unpack(header)
+        data = json.loads(recv_exact(conn, size))
+        if (
+            not isinstance(data, dict)
+            or not isinstance(data.get("args"), list)
+            or not isinstance(data.get("env"), dict)
+            or not isinstance(data.get("cwd"), str)
+        ):
+            raise TypeError("Malformed request")
+    except BaseException:
+        for fd in fds:
+            os.close(fd)
+        raise
+
+    return data, fds
+
+
+def send_exit_code(conn: socket.socket, code: int) -> None:
+    conn.sendall(EXIT_CODE.pack(code))
+
+
+def recv_exact(sock: socket.socket, size: int) -> bytes:
+    data = bytearray()
+    while len(data) < size:
+        chunk = sock.recv(size - len(data))
+        if not chunk:
+            raise ConnectionError("Connection closed before the message was received")
+        data += chunk
+
+    return bytes(data)
+
+
+def main() -> t.NoReturn:
+    if len(sys.argv) < 2:
+        sys.exit(f"usage: {os.path.basename(sys.argv[0])} SOCKET [ARGS...]")
+
+    sys.exit(request(sys.argv[1], sys.argv[2:]))
+
+
+if __name__ == "__main__":
+    main()
@@ -3,25 +3,33 @@
 from __future__ import annotations
 
 import contextlib
+import copy
+import inspect
 import os
 import typing as t
 
 import arc
-from arc import constants, errors, utils
+from arc import constants, errors
 from arc import typing as at
 from arc.config import Config
 from arc.define.param.param import InjectedParam, Param, ValueOrigin
-from arc.prompt.prompts import input_prompt
+from arc.define.param.plan import ParamPlanEntry, ResolutionPlan
 from arc.runtime import Context
 from arc.runtime.middleware import (
     DefaultMiddlewareNamespace,
     Middleware,
     MiddlewareBase,
+    MiddlewareStack,
 )
 
 if t.TYPE_CHECKING:
+    from typing_extensions import Self
+
     from arc.define import Command
-    from arc.define.param.param_instance import ParamInstanceTree
+    from arc.define.param.param_instance import (
+        ParamInstanceLeafNode,
+        ParamInstanceTree,
+    )
 
 
 class ExitStackMiddleware(MiddlewareBase):
@@ -51,6 +59,7 @@ class SetupParamMiddleware(MiddlewareBase):
 
     # Context Additions
     `arc.args.tree` - Tree representing the command's parameters and their realized values
+    `arc.args.plan` - The cached `ResolutionPlan` for the command's parameters
     `arc.args.origins` - Dictionary that stores where each parameter value comes from. See `Context.get_origin()`
     """
 
@@ -58,6 +67,7 @@ class SetupParamMiddleware(MiddlewareBase):
         command: Command = ctx["arc.command"]
         param_instance = command.param_def.create_instance()
         ctx["arc.args.tree"] = param_instance
+        ctx["arc.args.plan"] = command.param_def.plan
         ctx.setdefault("arc.args.origins", {})
         ctx.logger.debug("Parsed input: %s", ctx.get("arc.parse.result"))
 
@@ -65,35 +75,53 @@ class SetupParamMiddleware(MiddlewareBase):
 class ParamProcessor(MiddlewareBase):
     ctx: Context
     param_tree: ParamInstanceTree[type[dict[str, t.Any]]]
+    plan: ResolutionPlan
     config: Config
     origins: dict[str, str]
 
     __IGNORE = object()
 
     def __call__(self, ctx: Context) -> t.Any:
-        self.ctx = ctx
-        self.param_tree: ParamInstanceTree[type[dict[str, t.Any]]] = ctx[
-            "arc.args.tree"
-        ]
-        self.config = ctx["arc.config"]
-        self.origins = ctx["arc.args.origins"]
-
-        for param_value in self.param_tree.leaves():
-            if not self.skip(param_value.param, param_value.value):
-                updated = self.process(param_value.param, param_value.value)
-
-                if updated is not self.__IGNORE:
-                    param_value.value = updated
-
-                if param_value.value is constants.MISSING:
-                    updated = self.process_missing(param_value.param)
-                else:
-                    updated = self.process_not_missing(
-                        param_value.param, param_value.value
-                    )
+        bound = self.bind(ctx)
+        leaves = bound.param_tree.leaves()
+
+        # Selections are cached per predicate, so the
+        # shared processor's predicate is the one used
+        for entry in bound.plan.select(self.applies):
+            bound.process_leaf(leaves[entry.index])
+
+    def bind(self, ctx: Context) -> Self:
+        """Returns a copy of the processor that is set up to handle the params for
+        the execution in `ctx`. Processors are shared between executions (which
+        may run concurrently), so the processor itself is never modified"""
+        bound = copy.copy(self)
+        bound.ctx = ctx
+        bound.param_tree = ctx["arc.args.tree"]
+        bound.plan = ctx["arc.args.plan"]
+        bound.config = ctx["arc.config"]
+        bound.origins = ctx["arc.args.origins"]
+        return bound
+
+    def applies(self, entry: ParamPlanEntry) -> bool:
+        """Whether this processor needs to process the param for `entry` at all.
+        Only consulted when the plan is created, so it may only depend on the entry.
+        `skip()` is still checked for each value"""
+        return True
+
+    def process_leaf(self, param_value: ParamInstanceLeafNode) -> None:
+        if not self.skip(param_value.param, param_value.value):
+            updated = self.process(param_value.param, param_value.value)
+
+            if updated is not self.__IGNORE:
+                param_value.value = updated
+
+            if param_value.value is constants.MISSING:
+                updated = self.process_missing(param_value.param)
+            else:
+                updated = self.process_not_missing(param_value.param, param_value.value)
 
-                if updated is not self.__IGNORE:
-                    param_value.value = updated
+            if updated is not self.__IGNORE:
+                param_value.value = updated
 
     def process(self, param: Param[t.Any], value: t.Any) -> t.Any:
         return self.__IGNORE
@@ -126,9 +154,13 @@ class ApplyParseResultMiddleware(ParamProcessor):
 
     res: at.ParseResult
 
-    def __call__(self, ctx: Context) -> t.Any:
-        self.res = ctx["arc.parse.result"]
-        return super().__call__(ctx)
+    def applies(self, entry: ParamPlanEntry) -> bool:
+        return not entry.skip
+
+    def bind(self, ctx: Context) -> Self:
+        bound = super().bind(ctx)
+        bound.res = ctx["arc.parse.result"]
+        return bound
 
     def process_missing(self, param: Param[t.Any]) -> t.Any:
         value: t.Any = self.res.pop(param.argument_name, constants.MISSING)
@@ -158,6 +190,9 @@ class GetEnvValueMiddleware(ParamProcessor):
     None
     """
 
+    def applies(self, entry: ParamPlanEntry) -> bool:
+        return not entry.skip and entry.envvar is not None
+
     def process_missing(self, param: Param[t.Any]) -> t.Any:
         value = self.get_env_value(param)
         self.set_origin(param, ValueOrigin.ENV)
@@ -182,6 +217,9 @@ class GetPromptValueMiddleware(ParamProcessor):
     None
     """
 
+    def applies(self, entry: ParamPlanEntry) -> bool:
+        return not entry.skip and entry.prompter is not None
+
     def process_missing(self, param: Param[t.Any]) -> t.Any:
         value = self.get_prompt_value(param)
         self.set_origin(param, ValueOrigin.PROMPT)
@@ -191,8 +229,7 @@ class GetPromptValueMiddleware(ParamProcessor):
         if not param.prompt:
             return constants.MISSING
 
-        prompter = getattr(param.type.resolved_type, "__prompt__", input_prompt)
-        return utils.dispatch_args(prompter, param, self.ctx)
+        return param.dispatch_prompt(param, self.ctx)
 
 
 class GetterValueMiddleware(ParamProcessor):
@@ -207,17 +244,19 @@ class GetterValueMiddleware(ParamProcessor):
     None
     """
 
+    def applies(self, entry: ParamPlanEntry) -> bool:
+        return not entry.skip and entry.getter is not None
+
     def process_missing(self, param: Param[t.Any]) -> t.Any:
         value = self.get_getter_value(param)
         self.set_origin(param, ValueOrigin.GETTER)
         return value
 
     def get_getter_value(self, param: Param[t.Any]) -> t.Any | constants.Constant:
-        getter = param.getter_func
-        if not getter:
+        if not param.dispatch_getter:
             return constants.MISSING
 
-        return utils.dispatch_args(getter, param, self.ctx)
+        return param.dispatch_getter(param, self.ctx)
 
 
 class ConvertValuesMiddleware(ParamProcessor):
@@ -232,6 +271,9 @@ class ConvertValuesMiddleware(ParamProcessor):
     None
     """
 
+    def applies(self, entry: ParamPlanEntry) -> bool:
+        return not entry.skip
+
     def process_not_missing(self, param: Param[t.Any], value: t.Any) -> t.Any:
         if value in (None, constants.MISSING, True, False) and param.type.origin in (
             bool,
@@ -262,6 +304,9 @@ class DefaultValueMiddleware(ParamProcessor):
     None
     """
 
+    def applies(self, entry: ParamPlanEntry) -> bool:
+        return not entry.skip
+
     def process_missing(self, param: Param[t.Any]) -> t.Any:
         self.set_origin(param, ValueOrigin.DEFAULT)
         return param.default
@@ -279,11 +324,39 @@ class DependancyInjectorMiddleware(ParamProcessor):
     None
     """
 
+    injected: dict[Param[t.Any], t.Any]
+
+    def bind(self, ctx: Context) -> Self:
+        """Retrieves the value of each dependency. Asynchronous dependencies
+        (`__depends__` returns an awaitable) are awaited concurrently"""
+        bound = super().bind(ctx)
+        injected: dict[Param[t.Any], t.Any] = {}
+        pending: dict[Param[t.Any], t.Awaitable[t.Any]] = {}
+
+        for entry in bound.plan.select(self.applies):
+            param = t.cast(InjectedParam[t.Any], entry.param)
+            value = param.get_injected_value(ctx)
+            if inspect.isawaitable(value):
+                pending[param] = value
+            injected[param] = value
+
+        if pending:
+            import asyncio
+
+            async def gather() -> list[t.Any]:
+                return await asyncio.gather(*pending.values())
+
+            injected.update(zip(pending, ctx.app.run_async(gather())))
+
+        bound.injected = injected
+        return bound
+
+    def applies(self, entry: ParamPlanEntry) -> bool:
+        return entry.injected
+
     def process(self, param: Param[t.Any], value: t.Any) -> t.Any:
-        param = t.cast(InjectedParam[t.Any], param)
-        injected = param.get_injected_value(self.ctx)
         self.set_origin(param, ValueOrigin.INJECTED)
-        return injected
+        return self.injected[param]
 
     def skip(self, param: Param[t.Any], _value: t.Any) -> bool:
         return not param.is_injected
@@ -301,6 +374,9 @@ class RunTypeMiddlewareMiddleware(ParamProcessor):
     None
     """
 
+    def applies(self, entry: ParamPlanEntry) -> bool:
+        return bool(entry.middleware)
+
     def process(self, param: Param[t.Any], value: t.Any) -> t.Any:
         if value not in (None, constants.MISSING):
             try:
@@ -314,11 +390,45 @@ class RunTypeMiddlewareMiddleware(ParamProcessor):
 
 
 class RunCallbacksMiddleware(ParamProcessor):
+    def applies(self, entry: ParamPlanEntry) -> bool:
+        return not entry.skip and entry.callback is not None
+
     def process(self, param: Param[t.Any], value: t.Any) -> t.Any:
-        if not param.callback:
+        if not param.dispatch_callback:
             return value
 
-        return utils.dispatch_args(param.callback, value, param, self.ctx)
+        return param.dispatch_callback(value, param, self.ctx)
+
+
+class FusedParamProcessorMiddleware(MiddlewareBase):
+    """Runs several `ParamProcessor` middlewares as a single middleware. Each
+    processor still makes its own pass over the parameters, in the given order,
+    so values are resolved exactly as they would be by the processors on their own.
+    Used by [`ExecMiddleware.compile()`][arc.runtime.exec.ExecMiddleware.compile]
+    to replace the default processors.
+
+    # Context Dependencies
+    The union of the dependencies of each processor
+
+    # Context Additions
+    None
+    """
+
+    def __init__(self, *processors: ParamProcessor) -> None:
+        self.processors = processors
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({self.processors!r})"
+
+    def __call__(self, ctx: Context) -> t.Any:
+        tree: ParamInstanceTree[t.Any] = ctx["arc.args.tree"]
+        plan: ResolutionPlan = ctx["arc.args.plan"]
+        leaves = tree.leaves()
+
+        for processor in self.processors:
+            bound = processor.bind(ctx)
+            for entry in plan.select(processor.applies):
+                bound.process_leaf(leaves[entry.index])
 
 
 class MissingParamsCheckerMiddleware(MiddlewareBase):
@@ -444,3 +554,39 @@ class ExecMiddleware(DefaultMiddlewareNamespace):
         CompileParams,
         OpenResource,
     ]
+
+    FusedParamProcessors = FusedParamProcessorMiddleware(
+        ApplyParseResult,
+        GetEnvValue,
+        GetPromptValue,
+        GetterValue,
+        ConvertValues,
+        DefaultValue,
+        DependancyInjector,
+        RunTypeMiddleware,
+        RunCallbacks,
+    )
+
+    _defaults: tuple[Middleware, ...] = tuple(_list)
+    _compiled: tuple[Middleware, ...] = (
+        ExitStack,
+        SetupParam,
+        FusedParamProcessors,
+        MissingParamsChecker,
+        CompileParams,
+        OpenResource,
+    )
+
+    @classmethod
+    def compile(cls, stack: MiddlewareStack) -> MiddlewareStack:
+        """Compiles the middleware `stack` into a faster version of itself. This is
+        only possible if the stack consists of exactly the default middlewares,
+        otherwise it will be returned unchanged. So adding any middleware to the
+        execution stack of a command (with `Command.use()`, for example) turns
+        the optimization off for it."""
+        if len(stack) != len(cls._defaults) or any(
+            a is not b for a, b in zip(stack, cls._defaults)
+        ):
+            return stack
+
+        return MiddlewareStack(cls._compiled)
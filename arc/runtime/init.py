@@ -3,13 +3,20 @@
 from __future__ import annotations
 import typing as t
 from datetime import datetime
+import mmap
+import os
 import shlex
 import sys
 
 from arc import autocompletions, errors
 from arc import typing as at
 from arc.define.param.param import FlagParam, OptionParam
-from arc.parser import CustomAutocompleteAction, CustomVersionAction, Parser
+from arc.parser import (
+    CustomAutocompleteAction,
+    CustomVersionAction,
+    NativeParser,
+    Parser,
+)
 from arc.runtime import Context
 from arc.runtime.middleware import (
     DefaultMiddlewareNamespace,
@@ -19,6 +26,7 @@ from arc.runtime.middleware import (
 from arc.types.type_info import TypeInfo
 
 if t.TYPE_CHECKING:
+    from arc.config import Config
     from arc.define import Command
     from arc.define.param import ParamDefinition
 
@@ -90,11 +98,13 @@ class PerformDevChecksMiddleware(MiddlewareBase):
         if ctx.config.environment == "development":
             ctx.logger.debug("Performing dev checks...")
             ctx.logger.debug("  Checking all command parameters")
+            self.build_params(ctx.root)
 
-            for command in ctx.root:
-                if "param_def" not in command.__dict__:
-                    command.param_def
-                    del command.param_def
+    @staticmethod
+    def build_params(root: Command) -> list[ParamDefinition]:
+        """Builds the `param_def` of every command in the tree, which raises
+        any errors in their definitions"""
+        return [command.param_def for command in root]
 
 
 class AddRuntimeParmsMiddleware(MiddlewareBase):
@@ -112,11 +122,19 @@ class AddRuntimeParmsMiddleware(MiddlewareBase):
     """
 
     def __call__(self, ctx: Context) -> t.Any:
-        if ctx.config.version:
-            self.__add_version_param(ctx.root.param_def)
+        self.add_params(ctx.root.param_def, ctx.config)
+
+    def add_params(self, group: ParamDefinition, config: Config) -> None:
+        """Adds the runtime params enabled by `config` to `group`"""
+        # The root command may be executed several times in
+        # the same process, so the params should only be added once
+        existing = {param.argument_name for param in group.params}
 
-        if ctx.config.autocomplete:
-            self.__add_autocomplete_param(ctx.root.param_def)
+        if config.version and "version" not in existing:
+            self.__add_version_param(group)
+
+        if config.autocomplete and "autocomplete" not in existing:
+            self.__add_autocomplete_param(group)
 
     def __add_version_param(self, group: ParamDefinition) -> None:
         group.params.insert(
@@ -180,7 +198,8 @@ class AddUsageErrorInfoMiddleware(MiddlewareBase):
 class NormalizeInputMiddleware(MiddlewareBase):
     """Middleware that normalizes different input sources. If input is provided when
     command is called, it will be normalized to an list. If input is not provided,
-    `sys.argv` is used.
+    `sys.argv` is used. When `Config.allow_argfiles` is enabled, `@path` arguments
+    are replaced with the lines of the file at `path`.
 
     # Context Dependencies
     - `arc.input` (optional): Only exists if input was provided in the call to the command
@@ -189,6 +208,9 @@ class NormalizeInputMiddleware(MiddlewareBase):
     - `arc.input`: Adds it if it's not already there, normalizes it if it is there
     """
 
+    MMAP_THRESHOLD = 1024 * 1024
+    """Argument files larger than this (in bytes) are read through `mmap`"""
+
     def __call__(self, ctx: Context) -> t.Any:
         args: at.InputArgs = ctx.get("arc.input")
         if args is None:
@@ -200,8 +222,60 @@ class NormalizeInputMiddleware(MiddlewareBase):
         else:
             ctx.logger.debug("Using provided iterable as input: %s", args)
 
-        args = list(args)
-        ctx["arc.input"] = args
+        if ctx.config.allow_argfiles:
+            ctx["arc.input"] = list(self.expand_argfiles(args, ()))
+        else:
+            ctx["arc.input"] = list(args)
+
+    def expand_argfiles(
+        self, args: t.Iterable[str], seen: tuple[str, ...]
+    ) -> t.Iterator[str]:
+        """Replaces each `@path` in `args` with the lines of the file at `path`, recursively.
+        Arguments after `--` are left alone"""
+        args = iter(args)
+        for arg in args:
+            if arg == "--":
+                yield arg
+                yield from args
+                return
+
+            if not arg.startswith("@") or len(arg) == 1:
+                yield arg
+                continue
+
+            path = os.path.realpath(arg[1:])
+            if path in seen:
+                raise errors.UsageError(f"Argument file {arg[1:]} includes itself")
+
+            yield from self.expand_argfiles(self.read_argfile(arg[1:]), (*seen, path))
+
+    def read_argfile(self, path: str) -> t.Iterator[str]:
+        """Yields each line of the file at `path` as an argument, skipping blank
+        lines. Large files are read through `mmap`, so their contents are never
+        read into memory all at once"""
+        try:
+            with open(path, "rb") as file:
+                if os.fstat(file.fileno()).st_size < self.MMAP_THRESHOLD:
+                    yield from self.decode_lines(file, path)
+                    return
+
+                with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                    yield from self.decode_lines(iter(mapped.readline, b""), path)
+        except OSError as e:
+            raise errors.UsageError(f"Cannot read argument file {path}: {e.strerror}")
+
+    def decode_lines(self, lines: t.Iterable[bytes], path: str) -> t.Iterator[str]:
+        for line in lines:
+            if arg := self.decode(line, path):
+                yield arg
+
+    def decode(self, line: bytes, path: str) -> str:
+        try:
+            return line.decode().rstrip("\r\n")
+        except UnicodeDecodeError as e:
+            raise errors.UsageError(
+                f"Cannot read argument file {path}: it is not valid UTF-8"
+            ) from e
 
 
 class CommandFinderMiddleware(MiddlewareBase):
@@ -226,7 +300,8 @@ class CommandFinderMiddleware(MiddlewareBase):
 
 
 class ArgParseMiddleware(MiddlewareBase):
-    """Middleware that parses the input using the `argparse` library
+    """Middleware that parses the input. Uses the `argparse` library by default,
+    or arc's native parser if `Config.parser` is set to `"native"`
 
     # Context Dependencies
     - `arc.command`: The command to parse the input for
@@ -247,11 +322,30 @@ class ArgParseMiddleware(MiddlewareBase):
     def parse_args(
         self, command: Command, args: list[str]
     ) -> tuple[at.ParseResult, list[str]]:
-        parser = self.create_parser(command)
+        parser = self.get_parser(command)
         return parser.parse_known_intermixed_args(args)
 
-    def create_parser(self, command: Command) -> Parser:
-        parser = Parser(add_help=False)
+    def get_parser(self, command: Command) -> Parser | NativeParser:
+        """Retrieves the parser for `command`. The parser is cached on the command
+        object, and will only be rebuilt when the command's params change
+        (or a different parsing engine is configured)"""
+        key = (command.config.parser, *command.cli_params)
+        cached = command._parser_cache
+
+        if cached and cached[0] == key:
+            return cached[1]
+
+        parser = self.create_parser(command)
+        command._parser_cache = (key, parser)
+        return parser
+
+    def create_parser(self, command: Command) -> Parser | NativeParser:
+        parser: Parser | NativeParser
+        if command.config.parser == "argparse":
+            parser = Parser(add_help=False)
+        else:
+            parser = NativeParser()
+
         for param in command.cli_params:
             parser.add_param(param, command)
 
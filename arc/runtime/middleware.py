@@ -2,6 +2,8 @@ from __future__ import annotations
 
 import abc
 import collections
+import contextlib
+import inspect
 import types
 import typing as t
 
@@ -10,10 +12,21 @@ from arc import errors
 if t.TYPE_CHECKING:
     from arc.runtime import Context
 
+T = t.TypeVar("T")
 E = t.TypeVar("E", bound=BaseException)
 
 MiddlewareGenerator = t.Generator["Context", t.Any, t.Any]
-Middleware = t.Callable[["Context"], t.Union["Context", MiddlewareGenerator, None]]
+AsyncMiddlewareGenerator = t.AsyncGenerator["Context", t.Any]
+Middleware = t.Callable[
+    ["Context"],
+    t.Union[
+        "Context",
+        MiddlewareGenerator,
+        AsyncMiddlewareGenerator,
+        t.Awaitable[t.Union["Context", None]],
+        None,
+    ],
+]
 ErrorHandler = t.Callable[["Context", E], t.Any]
 
 
@@ -26,19 +39,30 @@ class MiddlewareBase(abc.ABC):
 
 
 class MiddlewareStack(collections.UserList[Middleware]):
-    __gens: list[MiddlewareGenerator]
+    """Runs a sequence of middlewares. Middlewares may be plain functions, generators,
+    coroutine functions or async generators. Coroutines are run on the event loop
+    of the app (`App.run_async()`)"""
+
+    __gens: list[MiddlewareGenerator | AsyncMiddlewareGenerator]
+    __ctx: Context
 
     def __repr__(self) -> str:
         return f"MiddlewareStack({self.data!r})"
 
     def start(self, ctx: Context) -> Context:
         self.__gens = []
+        self.__ctx = ctx
 
         for handler in self:
             res = handler(ctx)
             if isinstance(res, types.GeneratorType):
                 self.__gens.append(res)
                 res = next(res)
+            elif isinstance(res, types.AsyncGeneratorType):
+                self.__gens.append(res)
+                res = self.__run(anext(res))
+            elif inspect.isawaitable(res):
+                res = self.__run(res)
 
             res = t.cast(t.Union["Context", None], res)
 
@@ -50,6 +74,12 @@ class MiddlewareStack(collections.UserList[Middleware]):
     def close(self, result: t.Any) -> t.Any:
         """Closes each callback by calling `next()` on them"""
         for gen in reversed(self.__gens):
+            if isinstance(gen, t.AsyncGenerator):
+                # Async generators cannot return a value
+                with contextlib.suppress(StopAsyncIteration):
+                    self.__run(gen.asend(result))
+                continue
+
             try:
                 gen.send(result)
             except StopIteration as e:
@@ -73,14 +103,20 @@ class MiddlewareStack(collections.UserList[Middleware]):
 
         for gen in reversed(self.__gens):
             try:
-                if exception_handled:
+                if isinstance(gen, t.AsyncGenerator):
+                    if exception_handled:
+                        with contextlib.suppress(StopAsyncIteration):
+                            self.__run(anext(gen))
+                    else:
+                        self.__run(gen.athrow(exception))
+                elif exception_handled:
                     try:
                         next(gen)
                     except StopIteration:
                         ...
                 else:
                     gen.throw(exception)
-            except StopIteration:
+            except (StopIteration, StopAsyncIteration):
                 exception_handled = True
             except Exception as e:
                 exception = e
@@ -88,6 +124,9 @@ class MiddlewareStack(collections.UserList[Middleware]):
         if not exception_handled:
             raise exception
 
+    def __run(self, awaitable: t.Awaitable[T]) -> T:
+        return self.__ctx.app.run_async(awaitable)
+
     def try_remove(self, m: Middleware) -> None:
         try:
             self.remove(m)
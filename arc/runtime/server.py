@@ -0,0 +1,311 @@
+"""Keeps an `App` resident on a Unix domain socket, so that each invocation of
+the CLI doesn't pay for starting the interpreter and importing the app.
+Requests are sent with [`arc.runtime.client`][arc.runtime.client]."""
+
+from __future__ import annotations
+
+import contextlib
+import gc
+import logging
+import os
+import signal
+import socket
+import stat
+import sys
+import typing as t
+
+from arc.present import out
+from arc.runtime import client
+
+if t.TYPE_CHECKING:
+    from typing_extensions import Self
+
+    from arc.runtime.app import App
+
+logger = logging.getLogger("arc.server")
+
+STDIO = ("stdin", "stdout", "stderr")
+
+
+class CommandServer:
+    """Serves requests for an `App` on the Unix socket at `path`.
+
+    Each request is executed with `App.__call__()`, so it gets its own
+    `Context`. For the duration of the request, the process' stdio file
+    descriptors, environment, working directory and `sys.argv` are swapped
+    for the client's, so requests are handled one at a time. See
+    [`WorkerPool`][arc.runtime.server.WorkerPool] for handling them concurrently.
+
+    ```py
+    with CommandServer(app, "/tmp/cli.sock") as server:
+        server.serve()
+    ```
+    """
+
+    def __init__(self, app: App, path: str | os.PathLike[str]) -> None:
+        self.app = app
+        self.path = os.fspath(path)
+        self.sock: socket.socket | None = None
+
+    def __enter__(self) -> Self:
+        self.listen()
+        return self
+
+    def __exit__(self, *args: object) -> None:
+        self.close()
+
+    def listen(self, backlog: int = 128) -> None:
+        """Binds the socket. A stale socket left at `path` is removed first"""
+        with contextlib.suppress(FileNotFoundError):
+            if stat.S_ISSOCK(os.stat(self.path).st_mode):
+                os.unlink(self.path)
+
+        self.sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        self.sock.bind(self.path)
+        self.sock.listen(backlog)
+
+    def close(self) -> None:
+        if self.sock is not None:
+            self.sock.close()
+            self.sock = None
+            with contextlib.suppress(FileNotFoundError):
+                os.unlink(self.path)
+
+    def serve(self, max_requests: int | None = None) -> None:
+        """Handles requests until `max_requests` have been handled,
+        or forever if it isn't provided. A request that fails (because it
+        is malformed, or the client disconnects) is logged and skipped"""
+        if self.sock is None:
+            self.listen()
+
+        assert self.sock is not None
+        handled = 0
+        while max_requests is None or handled < max_requests:
+            conn, _ = self.sock.accept()
+            with conn:
+                try:
+                    self.handle(conn)
+                except (OSError, ValueError, TypeError) as e:
+                    logger.warning("Failed to handle request: %s", e)
+            handled += 1
+
+    def handle(self, conn: socket.socket) -> None:
+        request, fds = client.receive_request(conn)
+        try:
+            code = self.execute(request, fds)
+        finally:
+            for fd in fds:
+                os.close(fd)
+
+        client.send_exit_code(conn, code)
+
+    def execute(self, request: dict[str, t.Any], fds: list[int]) -> int:
+        """Runs the request, and returns its exit code"""
+        with redirect_stdio(fds), environment(request["env"], request["cwd"]):
+            argv = sys.argv
+            sys.argv = [argv[0], *request["args"]]
+            try:
+                self.app(request["args"])
+            except SystemExit as e:
+                return exit_code(e.code)
+            except Exception:
+                # Written to the client's stderr
+                logger.exception("Unhandled error while running %s", request["args"])
+                return 1
+            finally:
+                sys.argv = argv
+
+        return 0
+
+
+class WorkerPool:
+    """Pre-forked pool of `CommandServer` processes sharing one socket, so that
+    concurrent invocations of the app don't wait on each other.
+
+    Before forking, the parent imports the whole command tree (including lazy
+    subcommands) and builds every command's parameter definition, so the
+    workers share them copy-on-write instead of each building them again.
+    Workers that exit, or that have handled `max_requests` requests, are
+    replaced with a fresh fork. Stops on `SIGINT` or `SIGTERM`.
+
+    ```py
+    with WorkerPool(app, "/tmp/cli.sock", workers=4, max_requests=1000) as pool:
+        pool.serve()
+    ```
+    """
+
+    def __init__(
+        self,
+        app: App,
+        path: str | os.PathLike[str],
+        workers: int | None = None,
+        max_requests: int | None = None,
+    ) -> None:
+        self.server = CommandServer(app, path)
+        self.workers = workers or os.cpu_count() or 1
+        self.max_requests = max_requests
+        self.pids: set[int] = set()
+        self.running = False
+
+    def __enter__(self) -> Self:
+        self.server.listen()
+        return self
+
+    def __exit__(self, *args: object) -> None:
+        self.stop()
+        self.server.close()
+
+    def prepare(self) -> None:
+        """Builds everything the workers will need, so that it's shared between them"""
+        from arc.runtime.init import InitMiddleware
+
+        app = self.server.app
+        app.root.load_lazy_subcommands()
+        InitMiddleware.AddRuntimeParms.add_params(app.root.param_def, app.config)
+        for definition in InitMiddleware.PerformDevChecks.build_params(app.root):
+            _ = definition.plan
+
+        # Objects that already exist don't need to be tracked by the garbage
+        # collector, which would otherwise write to their pages in each worker
+        gc.freeze()
+
+    def serve(self) -> None:
+        if self.server.sock is None:
+            self.server.listen()
+
+        self.prepare()
+        self.running = True
+        previous = {
+            sig: signal.signal(sig, self.handle_signal)
+            for sig in (signal.SIGINT, signal.SIGTERM)
+        }
+
+        try:
+            while self.running or self.pids:
+                while self.running and len(self.pids) < self.workers:
+                    self.spawn()
+
+                try:
+                    pid, _ = os.wait()
+                except ChildProcessError:
+                    break
+                self.pids.discard(pid)
+        finally:
+            for sig, handler in previous.items():
+                signal.signal(sig, handler)
+            self.stop()
+
+    def spawn(self) -> None:
+        # Signals are blocked while forking, so that the pool can't be stopped
+        # before the new worker has been added to `pids` (which would leave
+        # it running), and the worker can't run the pool's signal handler
+        signals = {signal.SIGINT, signal.SIGTERM}
+        previous = signal.pthread_sigmask(signal.SIG_BLOCK, signals)
+        pid = os.fork()
+        if pid:
+            self.pids.add(pid)
+            signal.pthread_sigmask(signal.SIG_SETMASK, previous)
+            return
+
+        code = 1
+        try:
+            for sig in signals:
+                signal.signal(sig, signal.SIG_DFL)
+            signal.pthread_sigmask(signal.SIG_SETMASK, previous)
+            self.server.serve(self.max_requests)
+            code = 0
+        except Exception:
+            logger.exception("Worker %d stopped unexpectedly", os.getpid())
+        finally:
+            os._exit(code)
+
+    def stop(self) -> None:
+        self.running = False
+        for pid in self.pids:
+            with contextlib.suppress(ProcessLookupError):
+                os.kill(pid, signal.SIGTERM)
+
+    def handle_signal(self, signum: int, frame: t.Any) -> None:
+        self.stop()
+
+
+def exit_code(code: t.Any) -> int:
+    """Converts the `code` of a `SystemExit` into the integer the process would exit with"""
+    if code is None:
+        return 0
+    if isinstance(code, int):
+        return code
+
+    print(code, file=sys.stderr)
+    return 1
+
+
+@contextlib.contextmanager
+def redirect_stdio(fds: t.Sequence[int]) -> t.Iterator[None]:
+    """Points the process' stdio file descriptors at `fds` for the duration of
+    the context. Works at the descriptor level, so that any objects holding
+    onto `sys.stdout` and friends (like the console) write to the client.
+
+    `sys.stdin`, `sys.stdout` and `sys.stderr` are also replaced with fresh
+    wrappers over the redirected descriptors (and the default console with
+    one that uses them), so that data buffered while handling one request
+    can't leak into the next. The wrappers are flushed, but not closed,
+    afterwards, as something may still be holding onto them"""
+    targets = list(range(len(fds)))
+    names = STDIO[: len(fds)]
+    originals = [getattr(sys, name) for name in names]
+    flush(originals)
+    saved = [os.dup(target) for target in targets]
+    streams: list[t.IO[t.Any]] = []
+    console = out._console
+    out._console = None
+    try:
+        for fd, target in zip(fds, targets):
+            os.dup2(fd, target)
+        for name, target, original in zip(names, targets, originals):
+            stream = wrap_fd(target, "r" if name == "stdin" else "w", original)
+            streams.append(stream)
+            setattr(sys, name, stream)
+        yield
+    finally:
+        flush([*streams, *originals])
+        out._console = console
+        for name, original in zip(names, originals):
+            setattr(sys, name, original)
+        for fd, target in zip(saved, targets):
+            os.dup2(fd, target)
+            os.close(fd)
+
+
+def wrap_fd(fd: int, mode: str, like: t.IO[t.Any]) -> t.IO[t.Any]:
+    """Opens a text stream over `fd`, with the same encoding as `like`.
+    The descriptor is left open when the stream is closed"""
+    return open(
+        fd,
+        mode,
+        encoding=getattr(like, "encoding", None),
+        errors=getattr(like, "errors", None),
+        closefd=False,
+    )
+
+
+@contextlib.contextmanager
+def environment(env: dict[str, str], cwd: str) -> t.Iterator[None]:
+    saved_env = os.environ.copy()
+    saved_cwd = os.getcwd()
+    os.environ.clear()
+    os.environ.update(env)
+    try:
+        os.chdir(cwd)
+        yield
+    finally:
+        os.environ.clear()
+        os.environ.update(saved_env)
+        os.chdir(saved_cwd)
+
+
+def flush(streams: t.Iterable[t.IO[t.Any]]) -> None:
+    for stream in streams:
+        with contextlib.suppress(Exception):
+            if stream.writable():
+                stream.flush()
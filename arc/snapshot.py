@@ -0,0 +1,621 @@
+"""Serialized snapshots of a command tree.
+
+A snapshot records everything needed to find a command, parse its arguments,
+display `--help` and provide `--autocomplete` completions, without having to
+import the modules that define the commands, or inspect their signatures.
+
+```py
+# build step: mycli/build.py
+from arc.snapshot import Snapshot
+from mycli.commands import root
+
+Snapshot.create(root).dump("mycli/cli.snapshot")
+```
+
+```py
+# entrypoint: mycli/__main__.py
+import arc
+
+app = arc.App.from_snapshot("mycli/cli.snapshot")
+app()
+```
+
+When the app is executed, only the module that defines the selected command will be
+imported. The snapshot is not kept up to date automatically, so it should be recreated
+whenever the command tree changes.
+
+Snapshots are also used as the completion index for apps with
+[`Config.completion_index`][arc.config.Config.completion_index] set. See
+`Snapshot.cached()`.
+"""
+
+from __future__ import annotations
+
+import contextlib
+import dataclasses
+import functools
+import importlib
+import importlib.util
+import json
+import os
+import sys
+import typing as t
+
+import arc.typing as at
+from arc import errors, utils
+from arc.autocompletions import Completion, CompletionInfo, get_completions
+from arc.config import Config
+from arc.constants import MISSING
+from arc.define.command import Command, LazyCommand, namespace_callback
+from arc.define.param import ParamDefinition
+from arc.define.param.param import (
+    Action,
+    ArgumentParam,
+    FlagParam,
+    OptionParam,
+    Param,
+)
+from arc.parser import (
+    CustomAutocompleteAction,
+    CustomHelpAction,
+    CustomVersionAction,
+)
+from arc.runtime.init import InitMiddleware
+from arc.runtime.middleware import MiddlewareBase
+from arc.types.type_info import TypeInfo
+from arc.version import __version__
+
+if t.TYPE_CHECKING:
+    from arc.runtime import Context
+
+T = t.TypeVar("T")
+
+FORMAT_VERSION = 2
+
+PARAM_KINDS: dict[type[Param[t.Any]], str] = {
+    ArgumentParam: "argument",
+    OptionParam: "option",
+    FlagParam: "flag",
+}
+
+CUSTOM_ACTIONS: dict[str, type[t.Any]] = {
+    "help": CustomHelpAction,
+    "version": CustomVersionAction,
+    "autocomplete": CustomAutocompleteAction,
+}
+
+
+class Snapshot:
+    """A serializable representation of a command tree"""
+
+    def __init__(self, data: dict[str, t.Any]) -> None:
+        if data.get("format") != FORMAT_VERSION or data.get("arc") != __version__:
+            raise errors.CommandError(
+                f"Snapshot was created with arc {data.get('arc')} "
+                f"(format {data.get('format')}), but arc {__version__} is installed. "
+                "Recreate the snapshot with this version of arc"
+            )
+
+        self.data = data
+        self._imports: dict[Command, str | None] = {}
+        self._resolved: dict[Command, Command] = {}
+
+    __repr__ = utils.display("data")
+
+    @classmethod
+    def create(cls, root: Command, load_lazy: bool = True) -> Snapshot:
+        """Create a snapshot of `root` and all of its subcommands. When `load_lazy`
+        is `False`, lazy subcommands that haven't been imported yet are stored by
+        their import path, and will be imported when they are used, like they
+        would be without the snapshot"""
+        if load_lazy:
+            root.load_lazy_subcommands()
+
+        imports = _find_imports(root)
+
+        if not imports.get(root):
+            raise errors.CommandError(
+                f"Unable to create a snapshot of {root!r}. The root command must be "
+                "assigned to a global variable in an importable module"
+            )
+
+        modules = {command.callback.__module__ for command in root}
+
+        return cls(
+            {
+                "format": FORMAT_VERSION,
+                "arc": __version__,
+                "config": _dump_config(root.config),
+                "modules": _module_mtimes(modules),
+                "main": _main_path() if "__main__" in modules else None,
+                "root": _dump_command(root, imports),
+            }
+        )
+
+    @classmethod
+    def current(cls, path: str | os.PathLike[str], root: Command) -> Snapshot | None:
+        """Load the snapshot at `path` if it exists and is still current for `root`.
+        Unlike `Snapshot.cached()`, this never creates a snapshot, so it never
+        imports the modules of `root`'s lazy subcommands"""
+        if cls.is_fresh(path, root):
+            with contextlib.suppress(OSError, ValueError, errors.CommandError):
+                return cls.load(path)
+
+        return None
+
+    @classmethod
+    def is_fresh(cls, path: str | os.PathLike[str], root: Command) -> bool:
+        """Whether the snapshot at `path` exists and is still current for `root`.
+        Only the small header at the start of the file is read, so this is much
+        cheaper than loading the snapshot and checking `Snapshot.is_current()`"""
+        with contextlib.suppress(OSError, ValueError):
+            with open(path) as f:
+                header = json.loads(f.readline())
+            return isinstance(header, dict) and _is_current(header, root)
+
+        return False
+
+    @classmethod
+    def cached(cls, path: str | os.PathLike[str], root: Command) -> Snapshot | None:
+        """Load the snapshot at `path` if it is still current for `root`,
+        otherwise create a new one and write it to `path`. Returns `None`
+        if a snapshot of `root` cannot be created"""
+        snapshot = cls.current(path, root)
+        if snapshot is not None:
+            return snapshot
+
+        try:
+            snapshot = cls.create(root)
+        except errors.ArcError:
+            return None
+
+        with contextlib.suppress(OSError):
+            snapshot.dump(path)
+
+        return snapshot
+
+    def is_current(self, root: Command | None = None) -> bool:
+        """Whether the modules the snapshot was created from have not been
+        modified since. If `root` is provided, its version must also match the
+        version the snapshot was created with"""
+        return _is_current(self.header, root)
+
+    @property
+    def header(self) -> dict[str, t.Any]:
+        """The data needed to check whether the snapshot is current. Written on
+        the first line of the file, so it can be checked without loading the rest"""
+        return {
+            "format": self.data["format"],
+            "arc": self.data["arc"],
+            "version": self.data["config"].get("version"),
+            "main": self.data.get("main"),
+            "modules": self.data.get("modules", {}),
+        }
+
+    @classmethod
+    def load(cls, path: str | os.PathLike[str]) -> Snapshot:
+        """Load a snapshot previously written with `Snapshot.dump()`"""
+        with open(path) as f:
+            header = f.readline()
+            # Snapshots written before the header was added are a single line,
+            # which is then rejected for having an older format
+            return cls(json.loads(f.read() or header))
+
+    def dump(self, path: str | os.PathLike[str]) -> None:
+        """Write the snapshot to `path`"""
+        with open(path, "w") as f:
+            json.dump(self.header, f, separators=(",", ":"))
+            f.write("\n")
+            json.dump(self.data, f, separators=(",", ":"))
+
+    @functools.cached_property
+    def root(self) -> Command:
+        """Placeholder command tree built from the snapshot. The placeholder
+        commands can be used to find, parse, document and complete commands,
+        but must be resolved with `Snapshot.resolve()` before they are executed.
+
+        Subcommands are registered like lazy subcommands, so their placeholders are
+        only built once `Command.find_command()` walks to them. Until then, listing
+        them (in `--help` or completions) only uses the data in the snapshot"""
+        config = _load_config(Config, self.data["config"])
+        return self._load_command(self.data["root"], config)
+
+    def resolve(self, command: Command) -> Command:
+        """Import the real command object for the placeholder `command`"""
+        if command in self._resolved:
+            return self._resolved[command]
+
+        resolved: Command | None = None
+        path = self._imports.get(command)
+
+        if path:
+            module_name, _, attr = path.partition(":")
+            module = importlib.import_module(module_name)
+            resolved = getattr(module, attr, None)
+
+            if not isinstance(resolved, Command):
+                raise errors.CommandError(
+                    f"{path} is not a command. The snapshot is likely out of date"
+                )
+
+            # The command was found, but it's not attached to the tree, so it
+            # must be adopted by its parent in some other module
+            if command.parent and resolved.parent is None:
+                resolved = None
+
+        if resolved is None:
+            if command.parent is None:
+                raise errors.CommandError(f"Unable to import {command!r}")
+
+            parent = self.resolve(command.parent)
+            resolved = parent.get_subcommand(command.name)
+
+            if resolved is None:
+                raise errors.CommandError(
+                    f"{parent!r} has no subcommand named {command.name!r}. "
+                    "The snapshot is likely out of date"
+                )
+
+        if resolved.is_root and not resolved.explicit_name:
+            resolved.name = command.root.name
+
+        self._resolved[command] = resolved
+        return resolved
+
+    @functools.cached_property
+    def middleware(self) -> SnapshotMiddleware:
+        """Init middleware that swaps the placeholder command for the real one"""
+        return SnapshotMiddleware(self)
+
+    def _load_command(self, data: dict[str, t.Any], config: Config) -> Command:
+        command = Command(
+            callback=namespace_callback if data["namespace"] else _placeholder,
+            config=config,
+            name=data["name"],
+            description=data["doc"],
+            explicit_name=data["explicit_name"],
+        )
+        definition = ParamDefinition("root")
+        definition.params.extend(
+            self._load_param(command, param) for param in data["params"]
+        )
+        # Stored directly so that the definition is not generated
+        # from the callback's signature
+        command.__dict__["param_def"] = definition
+        self._imports[command] = data["import"]
+
+        for sub in data["subcommands"]:
+            command.lazy_subcommands[sub["name"]] = PlaceholderCommand(
+                self, sub, config
+            )
+            if sub["aliases"]:
+                command.lazy_subcommands.add_aliases(sub["name"], *sub["aliases"])
+
+        for lazy in data["lazy"]:
+            command.lazy_subcommand(
+                lazy["path"], *lazy["aliases"], name=lazy["name"], desc=lazy["desc"]
+            )
+
+        return command
+
+    def _load_param(self, command: Command, data: dict[str, t.Any]) -> Param[t.Any]:
+        cls = next(cls for cls, kind in PARAM_KINDS.items() if kind == data["kind"])
+        action = data["action"]
+        default = data["default"][0] if data["default"] else MISSING
+
+        param: Param[t.Any] = cls(
+            data["argument_name"],
+            type=_placeholder_type(),
+            default=default,
+            param_name=data["param_name"],
+            short_name=data["short_name"],
+            description=data["description"],
+            action=(
+                CUSTOM_ACTIONS[action] if action in CUSTOM_ACTIONS else Action(action)
+            ),
+            expose=data["expose"],
+            comp_func=_completion_func(self, command, data["completions"]),
+        )
+        param.__dict__["nargs"] = data["nargs"]
+        return param
+
+
+class PlaceholderCommand(LazyCommand):
+    """A subcommand in a snapshot, registered as a lazy subcommand of its parent's
+    placeholder. Loading it builds its placeholder from the snapshot's data,
+    without importing anything"""
+
+    def __init__(
+        self, snapshot: Snapshot, data: dict[str, t.Any], config: Config
+    ) -> None:
+        super().__init__(data["import"] or "", data["name"], data["summary"])
+        self.snapshot = snapshot
+        self.data = data
+        self.config = config
+
+    def load(self) -> Command:
+        return self.snapshot._load_command(self.data, self.config)
+
+
+class SnapshotMiddleware(MiddlewareBase):
+    """Replaces the placeholder command from a snapshot with the real command
+    object, then parses the input again with it. If the input requested
+    `--help`, `--version` or `--autocomplete` this middleware will never be reached,
+    so they never import the command's module.
+
+    # Context Dependencies
+    - `arc.command`: The placeholder command
+    - `arc.input`
+
+    # Context Additions
+    - `arc.root`: The root of the real command tree
+    - `arc.command`: The real command object
+    - `arc.config`: The real command's configuration
+    - `arc.parse.result`
+    - `arc.parse.extra`
+    """
+
+    def __init__(self, snapshot: Snapshot) -> None:
+        self.snapshot = snapshot
+
+    def __call__(self, ctx: Context) -> t.Any:
+        command = self.snapshot.resolve(ctx.command)
+        ctx.logger.debug("Resolved %s from snapshot: %s", ctx.command, command)
+        ctx["arc.root"] = command.root
+        ctx["arc.command"] = command
+        ctx["arc.config"] = command.config
+
+        result, extra = InitMiddleware.Parser.parse_args(command, ctx["arc.input"])
+        ctx["arc.parse.result"] = result
+        ctx["arc.parse.extra"] = extra
+
+
+def _placeholder(**kwargs: t.Any) -> t.NoReturn:
+    raise errors.InternalError(
+        "Commands loaded from a snapshot must be resolved before being executed"
+    )
+
+
+@functools.cache
+def _placeholder_type() -> TypeInfo[str]:
+    return TypeInfo.analyze(str)
+
+
+def _find_imports(root: Command) -> dict[Command, str]:
+    """Find the global variables that each command in the tree is
+    assigned to. Commands without one are imported through their parent"""
+    imports: dict[Command, str] = {}
+    modules = {command.callback.__module__ for command in root}
+
+    for name in sorted(modules):
+        module = sys.modules.get(name)
+        if module is None:
+            continue
+
+        for attr, value in vars(module).items():
+            if isinstance(value, Command) and value not in imports:
+                imports[value] = f"{name}:{attr}"
+
+    return imports
+
+
+def _is_current(header: dict[str, t.Any], root: Command | None) -> bool:
+    if header.get("format") != FORMAT_VERSION or header.get("arc") != __version__:
+        return False
+
+    if root is not None:
+        version = root.config.version
+        if header.get("version") != (None if version is None else str(version)):
+            return False
+
+    # A root defined in a script is recorded as `__main__`, so the
+    # snapshot only applies to the script it was created from
+    modules = header.get("modules", {})
+    if "__main__" in modules and header.get("main") != _main_path():
+        return False
+
+    return _module_mtimes(modules) == modules
+
+
+def _module_mtimes(names: t.Iterable[str]) -> dict[str, int | None]:
+    """The modification time of each module's source file"""
+    mtimes: dict[str, int | None] = {}
+
+    for name in sorted(names):
+        module = sys.modules.get(name)
+        path = getattr(module, "__file__", None)
+        if name == "__main__":
+            path = _main_path()
+        elif module is None:
+            with contextlib.suppress(ImportError, ValueError):
+                spec = importlib.util.find_spec(name)
+                path = spec.origin if spec else None
+
+        try:
+            mtimes[name] = os.stat(path).st_mtime_ns if path else None
+        except OSError:
+            mtimes[name] = None
+
+    return mtimes
+
+
+def _main_path() -> str | None:
+    """The script being run. Identifies the `__main__` module between processes"""
+    if not sys.argv or not sys.argv[0] or sys.argv[0] == "-c":
+        return None
+
+    return os.path.realpath(sys.argv[0])
+
+
+def _dump_command(command: Command, imports: dict[Command, str]) -> dict[str, t.Any]:
+    aliases = (
+        command.parent.subcommands.aliases_for(command.name) if command.parent else []
+    )
+    params = list(command.cli_params)
+
+    if command.is_root:
+        # Add the --version / --autocomplete params to a copy of the definition,
+        # so they can be handled from the snapshot as well
+        definition = ParamDefinition(command.param_def.name)
+        definition.params.extend(command.param_def.params)
+        definition.children = command.param_def.children
+        InitMiddleware.AddRuntimeParms.add_params(definition, command.config)
+        params = [param for param in definition.all_params() if not param.is_injected]
+
+    return {
+        "name": command.name,
+        "aliases": list(aliases),
+        "explicit_name": command.explicit_name,
+        "namespace": command.is_namespace,
+        "import": imports.get(command),
+        "doc": command.doc.docstring,
+        "summary": command.doc.short_description,
+        "params": [_dump_param(command, param) for param in params],
+        "subcommands": [
+            _dump_command(sub, imports) for sub in command.subcommands.values()
+        ],
+        "lazy": [
+            {
+                "path": lazy.path,
+                "name": lazy.name,
+                "aliases": list(command.lazy_subcommands.aliases_for(lazy.name)),
+                "desc": lazy.description,
+            }
+            for lazy in command.lazy_subcommands.values()
+        ],
+    }
+
+
+def _dump_config(config: t.Any) -> dict[str, t.Any]:
+    """Stores the config options that are used before the real command is
+    imported. `prompt` and `extra` can hold arbitrary objects, so they are
+    left out and only available from the real command's config"""
+    data: dict[str, t.Any] = {}
+
+    for field in dataclasses.fields(config):
+        value = getattr(config, field.name)
+
+        if field.name in ("prompt", "extra"):
+            continue
+        elif dataclasses.is_dataclass(value):
+            value = _dump_config(value)
+        elif isinstance(value, type):
+            value = {"import": f"{value.__module__}:{value.__qualname__}"}
+        elif field.name == "version" and value is not None:
+            value = str(value)
+
+        data[field.name] = value
+
+    return data
+
+
+def _load_config(cls: type[T], data: dict[str, t.Any]) -> T:
+    kwargs: dict[str, t.Any] = {}
+
+    for field in dataclasses.fields(cls):  # type: ignore[arg-type]
+        if field.name not in data:
+            continue
+
+        value = data[field.name]
+        factory = field.default_factory
+
+        if isinstance(value, dict) and "import" in value:
+            module_name, _, attr = value["import"].partition(":")
+            value = functools.reduce(
+                getattr, attr.split("."), importlib.import_module(module_name)
+            )
+        elif isinstance(value, dict) and dataclasses.is_dataclass(factory):
+            value = _load_config(t.cast(type, factory), value)
+
+        kwargs[field.name] = value
+
+    return cls(**kwargs)
+
+
+def _dump_param(command: Command, param: Param[t.Any]) -> dict[str, t.Any]:
+    action: str | None
+    if isinstance(param.action, Action):
+        action = param.action.value
+    else:
+        action = next(
+            (name for name, cls in CUSTOM_ACTIONS.items() if cls is param.action), None
+        )
+        if action is None:
+            raise errors.ParamError(
+                "Param uses an action that cannot be stored in a snapshot",
+                command.name,
+                param,
+            )
+
+    return {
+        "kind": PARAM_KINDS[type(param)],
+        "argument_name": param.argument_name,
+        "param_name": param.param_name,
+        "short_name": param.short_name,
+        "description": param.description,
+        "action": action,
+        "nargs": param.nargs,
+        "expose": param.expose,
+        # Wrapped in a list so that MISSING and None can be differentiated
+        "default": None if param.default is MISSING else [_dump_default(param.default)],
+        "completions": _dump_completions(param),
+    }
+
+
+def _dump_default(value: t.Any) -> t.Any:
+    # Defaults are only used for display purposes,
+    # so they get stored as they would be displayed
+    if value is None or isinstance(value, (str, int, float, bool)):
+        return value
+    if isinstance(value, (list, tuple, set)):
+        return [str(v) for v in value]
+
+    return str(value)
+
+
+def _dump_completions(param: Param[t.Any]) -> dict[str, t.Any] | None:
+    """Stores the completions for the param, if they can be known ahead of time.
+    Completions provided by the user (or any non-arc type) are assumed to be dynamic
+    and will require importing the command to retrieve"""
+    if param.comp_func:
+        return {"dynamic": True}
+
+    resolved = param.type.resolved_type
+    if not hasattr(resolved, "__completions__"):
+        return None
+
+    if not resolved.__module__.startswith("arc."):
+        return {"dynamic": True}
+
+    first = get_completions(param, CompletionInfo([], "first"))
+    second = get_completions(param, CompletionInfo([], "second"))
+
+    if first == second:
+        return {
+            "values": [[comp.value, comp.description, comp.type] for comp in first],
+        }
+
+    if len(first) == 1 and first[0].value == "first" and second[0].value == "second":
+        return {"current": first[0].type}
+
+    return {"dynamic": True}
+
+
+def _completion_func(
+    snapshot: Snapshot, command: Command, data: dict[str, t.Any] | None
+) -> at.CompletionFunc | None:
+    if data is None:
+        return None
+
+    def completions(info: CompletionInfo, param: Param[t.Any]) -> list[Completion]:
+        if "values" in data:
+            return [
+                Completion(v, description=d, type=tp) for v, d, tp in data["values"]
+            ]
+        if "current" in data:
+            return [Completion(info.current, type=data["current"])]
+
+        real = snapshot.resolve(command).get_param(param.argument_name)
+        return get_completions(real, info) if real else []
+
+    return completions
@@ -22,7 +22,7 @@ from arc.autocompletions import Completion, CompletionInfo, CompletionType
 from arc.color import colorize, fg
 from arc.present.joiner import Join
 from arc.prompt.prompts import select_prompt
-from arc.types.convert import convert_type
+from arc.types.convert import convert_many, convert_type
 from arc.types.dates import DateArgs, DateTimeArgs, TimeArgs
 from arc.types.type_arg import TypeArg
 from arc.types.default import unwrap
@@ -45,6 +45,10 @@ class Alias:
     it provides a convenience wrapper for alias types by implementing
     a custom `cls.__convert__()` that calls `cls.convert()` for non-parameterized
     types and `cls.g_convert()` for generic types.
+
+    Aliases may also implement `cls.convert_many()` to convert a batch of values
+    at once (used for the elements of collection types). It is called by
+    `cls.__convert_many__()` for non-parameterized types.
     """
 
     aliases: dict[Annotation, type[TypeProtocol]] = {}
@@ -52,19 +56,36 @@ class Alias:
     name: t.ClassVar[t.Optional[str]] = None
     convert: t.Callable[..., t.Any]
     g_convert: t.Callable[..., t.Any]
+    convert_many: t.Callable[..., list[t.Any]]
+
+    # Results of `resolve()`. Both are cleared whenever a new alias is registered
+    _resolved: t.ClassVar[dict[Annotation, type[TypeProtocol]]] = {}
+    _unresolvable: t.ClassVar[set[Annotation]] = set()
 
     @classmethod
-    def __convert__(cls, value: str, typ: TypeInfo[T]) -> T:
+    def __convert__(
+        cls, value: str, typ: TypeInfo[T], param: Param[t.Any] | None = None
+    ) -> T:
         if cls.name:
             typ.name = cls.name
 
         if not typ.sub_types:
-            obj = utils.dispatch_args(cls.convert, value, typ)
+            obj = utils.dispatch_args(cls.convert, value, typ, param)
         else:
-            obj = utils.dispatch_args(cls.g_convert, value, typ)
+            obj = utils.dispatch_args(cls.g_convert, value, typ, param)
 
         return obj
 
+    @classmethod
+    def __convert_many__(cls, values: t.Sequence[t.Any], typ: TypeInfo[T]) -> list[T]:
+        if typ.sub_types or not hasattr(cls, "convert_many"):
+            return [cls.__convert__(value, typ) for value in values]
+
+        if cls.name:
+            typ.name = cls.name
+
+        return cls.convert_many(values, typ)
+
     def __init_subclass__(cls, of: t.Optional[AliasFor | tuple[AliasFor]] = None):
         if of:
             cls.alias_for = of
@@ -77,10 +98,38 @@ class Alias:
             for alias in aliases:
                 Alias.aliases[alias] = cls  # type: ignore
 
+            Alias._resolved.clear()
+            Alias._unresolvable.clear()
+
     @classmethod
     def resolve(cls, annotation: Annotation) -> type[TypeProtocol]:
-        """Handles resolving alias types"""
+        """Handles resolving alias types. Results are cached per type"""
+        try:
+            resolved = cls._resolved.get(annotation)
+        except TypeError:
+            # Unhashable, so the result can't be cached
+            resolved = cls._resolve(annotation)
+        else:
+            if resolved is None and annotation not in cls._unresolvable:
+                resolved = cls._resolve(annotation)
+                if resolved is None:
+                    cls._unresolvable.add(annotation)
+                else:
+                    cls._resolved[annotation] = resolved
+
+        if resolved is None:
+            name = colorize(getattr(annotation, "__name__", str(annotation)), fg.YELLOW)
+            raise TypeError(
+                f"{name} is not a valid type. "
+                f"Please ensure that {name} conforms to the custom type protocol "
+                f"or that there is a alias type registered for it: "
+                "https://arc.seancollings.dev/usage/parameters/types/custom-types"
+            )
+
+        return resolved
 
+    @classmethod
+    def _resolve(cls, annotation: Annotation) -> type[TypeProtocol] | None:
         if safe.issubclass(annotation, TypeProtocol):
             return t.cast(type[TypeProtocol], annotation)
         elif annotation in cls.aliases:
@@ -97,13 +146,7 @@ class Alias:
                 if parent in cls.aliases:
                     return cls.aliases[parent]
 
-        name = colorize(annotation.__name__, fg.YELLOW)
-        raise TypeError(
-            f"{name} is not a valid type. "
-            f"Please ensure that {name} conforms to the custom type protocol "
-            f"or that there is a alias type registered for it: "
-            "https://arc.seancollings.dev/usage/parameters/types/custom-types"
-        )
+        return None
 
 
 # Builtin Types ---------------------------------------------------------------------------------
@@ -117,6 +160,10 @@ class StringAlias(Alias, str, of=(str, t.Any, collections.UserString)):  # type:
         except ValueError as e:
             raise errors.ConversionError(value, str(e))
 
+    @classmethod
+    def convert_many(cls, values: t.Sequence[t.Any], info: TypeInfo[str]) -> list[str]:
+        return list(map(str, values))
+
 
 class BytesAlias(bytes, Alias, of=bytes):
     @classmethod
@@ -139,6 +186,17 @@ class IntAlias(Alias, of=int):
         except ValueError as e:
             raise errors.ConversionError(value, "must be an integer", e)
 
+    @classmethod
+    def convert_many(cls, values: t.Sequence[t.Any], info: TypeInfo[int]) -> list[int]:
+        if info.type_arg:
+            return [cls.convert(value, info) for value in values]
+
+        try:
+            return list(map(int, values))
+        except ValueError:
+            # Convert them one at a time to find the invalid value
+            return [cls.convert(value, info) for value in values]
+
 
 class FloatAlias(Alias, of=float):
     @classmethod
@@ -148,6 +206,15 @@ class FloatAlias(Alias, of=float):
         except ValueError as e:
             raise errors.ConversionError(value, "must be a float", e)
 
+    @classmethod
+    def convert_many(
+        cls, values: t.Sequence[t.Any], info: TypeInfo[float]
+    ) -> list[float]:
+        try:
+            return list(map(info.origin, values))
+        except ValueError:
+            return [cls.convert(value, info) for value in values]
+
 
 class _CollectionAlias(Alias):
     alias_for: t.ClassVar[type]
@@ -166,7 +233,7 @@ class _CollectionAlias(Alias):
         sub_type = sub.resolved_type
 
         try:
-            return cls.alias_for([sub_type.__convert__(v, sub) for v in lst])
+            return cls.alias_for(convert_many(sub_type, lst, sub))
         except errors.ConversionError as e:
             if name := getattr(sub_type, "name"):
                 raise errors.ConversionError(
@@ -199,6 +266,12 @@ class TupleAlias(tuple[t.Any], _CollectionAlias, of=tuple):
                 f"accepts {len(info.sub_types)} arguments, but recieved {len(tup)}",
             )
 
+        # Homogeneous tuples (tuple[int, int, int]) can be converted in one batch.
+        # TypeInfo objects are interned, so an identity check is enough
+        first = info.sub_types[0]
+        if all(item_type is first for item_type in info.sub_types):
+            return tuple(convert_many(first.resolved_type, tup, first))
+
         return tuple(
             convert_type(item_type.resolved_type, item, item_type)
             for item_type, item in zip(info.sub_types, tup)
@@ -281,10 +354,12 @@ class NoneAlias(Alias, of=types.NoneType):
 
 class UnionAlias(Alias, of=(t.Union, types.UnionType)):
     @classmethod
-    def g_convert(cls, value: t.Any, info: TypeInfo[t.Any]) -> t.Any:
+    def g_convert(
+        cls, value: t.Any, info: TypeInfo[t.Any], param: Param[t.Any] | None = None
+    ) -> t.Any:
         for sub in info.sub_types:
             try:
-                return convert_type(sub.resolved_type, value, sub)
+                return convert_type(sub.resolved_type, value, sub, param)
             except Exception:
                 ...
 
@@ -366,6 +441,12 @@ class PathAlias(Alias, of=pathlib.Path):
     def convert(cls, value: t.Any) -> pathlib.Path:
         return pathlib.Path(value)
 
+    @classmethod
+    def convert_many(
+        cls, values: t.Sequence[t.Any], info: TypeInfo[pathlib.Path]
+    ) -> list[pathlib.Path]:
+        return list(map(pathlib.Path, values))
+
     @classmethod
     def __completions__(
         cls, info: CompletionInfo, _param: Param[pathlib.Path]
@@ -412,6 +493,18 @@ class _Address(Alias):
                 value, f"Not a valid {info.name} Address"
             ) from e
 
+    @classmethod
+    def convert_many(
+        cls, values: t.Sequence[str], info: TypeInfo[t.Any]
+    ) -> list[ipaddress.IPv4Address | ipaddress.IPv6Address]:
+        try:
+            return [
+                cls.alias_for(int(value) if value.isnumeric() else value)
+                for value in values
+            ]
+        except ipaddress.AddressValueError:
+            return [cls.convert(value, info) for value in values]
+
 
 class IPv4Alias(ipaddress.IPv4Address, _Address, of=ipaddress.IPv4Address):
     name = "IPv4"
@@ -446,6 +539,15 @@ class UUIDAlias(Alias, of=uuid.UUID):
         except ValueError as e:
             raise errors.ConversionError(value, "Not a valid UUID", e) from e
 
+    @classmethod
+    def convert_many(
+        cls, values: t.Sequence[str], info: TypeInfo[uuid.UUID]
+    ) -> list[uuid.UUID]:
+        try:
+            return list(map(uuid.UUID, values))
+        except ValueError:
+            return [cls.convert(value, info) for value in values]
+
 
 class DateTimeAlias(Alias, of=datetime.datetime):
     @classmethod
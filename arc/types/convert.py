@@ -5,6 +5,7 @@ import typing as t
 from arc import types, utils
 
 if t.TYPE_CHECKING:
+    from arc.define.param import Param
     from arc.typing import TypeProtocol
 
 
@@ -15,16 +16,34 @@ def convert_type(
     protocol: type[TypeProtocol],
     value: t.Any,
     info: types.TypeInfo[T],
+    param: Param[t.Any] | None = None,
 ) -> T:
-    """Uses `protocol` to convert `value`"""
-    return utils.dispatch_args(protocol.__convert__, value, info)
+    """Uses `protocol` to convert `value`. `param` is the parameter being
+    converted for, if there is one"""
+    if protocol is info.resolved_type:
+        return info.converter(value, info, param)
+
+    return utils.dispatch_args(protocol.__convert__, value, info, param)
+
+
+def convert_many(
+    protocol: type[TypeProtocol],
+    values: t.Sequence[t.Any],
+    info: types.TypeInfo[T],
+) -> list[T]:
+    """Uses `protocol` to convert each of `values`. Types that implement
+    `__convert_many__()` convert them all in one call"""
+    if (many := getattr(protocol, "__convert_many__", None)) is not None:
+        return t.cast(list[T], many(values, info))
+
+    return [convert_type(protocol, value, info) for value in values]
 
 
 def convert(value: str, type: type[T]) -> T:
     info = types.TypeInfo[T].analyze(type)
     converted = convert_type(info.resolved_type, value, info)
 
-    for middleware in info.middleware:
-        converted = utils.dispatch_args(middleware, converted, None, None)
+    for middleware in info.middleware_dispatchers:
+        converted = middleware(converted, None, None)
 
     return converted
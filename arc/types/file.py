@@ -6,13 +6,18 @@ import sys
 import typing as t
 
 from arc import errors
-from arc.types.convert import convert_type
+from arc.types.convert import convert_many, convert_type
 from arc.types.default import Default, unwrap
 from arc.types.type_arg import TypeArg
 from arc.types.type_info import TypeInfo
 
 __all__ = ["File", "Stdin", "StdinFile", "Stream"]
 
+if t.TYPE_CHECKING:
+    from arc.define.param import Param
+
+T = t.TypeVar("T")
+
 
 OpenNewline = t.Literal[None, "", "\n", "\r", "\r\n"]
 OpenErrors = t.Literal[
@@ -115,11 +120,36 @@ class File(t.IO[str], abc.ABC):
     """Equivalent to `open(filename, "ab+")`"""
 
 
-class Stream(t.IO[str], abc.ABC):
+class Stream(t.IO[str], abc.ABC, t.Generic[T]):
+    """Read input from a stream, if `-` is passed as the argument.
+
+    When given a type parameter (`Stream[int]`), the argument is instead an
+    iterator that lazily reads values from stdin (when `-` is passed) or from
+    a file (when `@path` is passed), one per line like an argument file, and
+    converts each of them to the given type. Blank lines are skipped. Only a
+    small batch of values is held in memory at a time, regardless of the size
+    of the input.
+
+    ```py
+    @arc.command
+    def command(ids: Stream[int]):
+        for id in ids:
+            arc.print(id)
+    ```
+    ```console
+    $ seq 1 1000000 | python example.py -
+    ```
+    """
+
     name = "stream"
 
     @classmethod
-    def __convert__(cls, value: str, info: TypeInfo[t.Any]) -> "t.IO[str]":
+    def __convert__(
+        cls, value: str, info: TypeInfo[t.Any], param: Param[t.Any] | None = None
+    ) -> t.Any:
+        if info.sub_types:
+            return StreamReader.open(value, info, param)
+
         arg: Stream.Args = TypeArg.ensure(
             t.cast(t.Optional[Stream.Args], info.type_arg), cls.__name__
         )
@@ -139,21 +169,109 @@ class Stream(t.IO[str], abc.ABC):
             self.char = char
 
 
-Stdin = t.Union[t.Annotated[Stream, Stream.Args(sys.stdin)], io.StringIO]
+class StreamReader(t.Generic[T]):
+    """Iterator for a `Stream[T]` argument. Reads the lines of `file` and
+    converts them in batches. Like any iterator, it can only be consumed once.
+    Conversion errors are reported against `param`. Closes `file` when the
+    command exits, unless it was stdin"""
+
+    batch_size = 1024
+
+    def __init__(
+        self,
+        file: t.IO[str],
+        info: TypeInfo[T],
+        owns_file: bool,
+        param: Param[t.Any] | None = None,
+    ):
+        self.file = file
+        self.info = info
+        self.owns_file = owns_file
+        self.param = param
+        self._values = self._read()
+
+    @classmethod
+    def open(
+        cls, value: str, info: TypeInfo[t.Any], param: Param[t.Any] | None = None
+    ) -> StreamReader[t.Any]:
+        sub = info.sub_types[0]
+        arg = t.cast(Stream.Args | None, info.type_arg)
+        char = unwrap(arg.char) if arg else "-"
+
+        if value == char:
+            return cls(arg.stream if arg else sys.stdin, sub, False, param)
+
+        if value.startswith("@"):
+            try:
+                return cls(open(value[1:]), sub, True, param)
+            except OSError as e:
+                raise errors.ConversionError(
+                    value, f"Cannot access {value[1:]}: {e.strerror}"
+                ) from e
+
+        raise errors.ConversionError(
+            value, f"expected {char!r} to read from stdin or '@<file>' to read a file"
+        )
+
+    def __iter__(self) -> StreamReader[T]:
+        return self
+
+    def __next__(self) -> T:
+        return next(self._values)
+
+    def _read(self) -> t.Iterator[T]:
+        batch: list[str] = []
+
+        for line in self.file:
+            line = line.rstrip("\r\n")
+            if not line:
+                continue
+
+            batch.append(line)
+            if len(batch) >= self.batch_size:
+                yield from self.__convert(batch)
+                batch = []
+
+        if batch:
+            yield from self.__convert(batch)
+
+    def __convert(self, batch: list[str]) -> list[T]:
+        try:
+            return convert_many(self.info.resolved_type, batch, self.info)
+        except errors.ConversionError as e:
+            if self.param is None:
+                raise
+
+            raise errors.InvalidParamValueError(str(e), self.param, e.details) from e
+
+    def __enter__(self) -> StreamReader[T]:
+        return self
+
+    def __exit__(self, *args: object) -> None:
+        self.close()
+
+    def close(self) -> None:
+        if self.owns_file:
+            self.file.close()
+
+
+Stdin = t.Union[t.Annotated[Stream, Stream.Args(sys.stdin)], io.StringIO]  # type: ignore[type-arg]
 """Read input from command line, or from stdin if `-` is passed as the argument"""
 
 
-_FileOrStdin = t.Union[File.Read, t.Annotated[Stream, Stream.Args(sys.stdin)]]
+_FileOrStdin = t.Union[File.Read, t.Annotated[Stream, Stream.Args(sys.stdin)]]  # type: ignore[type-arg]
 _info: TypeInfo[t.Any] = TypeInfo.analyze(_FileOrStdin)
 
 
-class StdinFile(Stream):
+class StdinFile(Stream):  # type: ignore[type-arg]
     """Read input from a file, or from a stdin if '-' is passed as the argument"""
 
     @classmethod
-    def __convert__(cls, value: str, info: TypeInfo[t.Any]) -> "t.IO[str]":
+    def __convert__(
+        cls, value: str, info: TypeInfo[t.Any], param: Param[t.Any] | None = None
+    ) -> "t.IO[str]":
         try:
-            return convert_type(_info.resolved_type, value, _info)
+            return convert_type(_info.resolved_type, value, _info, param)
         except errors.ConversionError as e:
             raise errors.ConversionError(
                 value, "expected file or '-' to read from stdin"
@@ -1,10 +1,12 @@
 from __future__ import annotations
 
+import functools
 import types
 import typing as t
 from functools import cached_property
 from arc.constants import COLLECTION_TYPES
 
+from arc import utils
 from arc.define.param import constructors
 import arc.typing as at
 from arc.types.aliases import Alias
@@ -12,6 +14,8 @@ from arc.types.type_arg import TypeArg
 
 T = t.TypeVar("T")
 
+ANALYZE_CACHE_SIZE = 1024
+
 
 class TypeInfo(t.Generic[T]):
     def __init__(
@@ -63,6 +67,11 @@ class TypeInfo(t.Generic[T]):
     def middleware(self) -> list[at.TypeMiddleware]:
         return [a for a in self.annotations if callable(a)]
 
+    @cached_property
+    def middleware_dispatchers(self) -> tuple[t.Callable[..., t.Any], ...]:
+        """`middleware`, pre-bound with `utils.dispatcher()`"""
+        return tuple(utils.dispatcher(m) for m in self.middleware)
+
     @cached_property
     def param_info(self) -> constructors.ParamInfo | None:
         for a in reversed(self.annotations):
@@ -75,6 +84,11 @@ class TypeInfo(t.Generic[T]):
     def resolved_type(self) -> type[at.TypeProtocol]:
         return Alias.resolve(self.origin)
 
+    @cached_property
+    def converter(self) -> t.Callable[..., T]:
+        """The `__convert__` method of `resolved_type`, pre-bound with `utils.dispatcher()`"""
+        return utils.dispatcher(self.resolved_type.__convert__)
+
     @property
     def is_union_type(self) -> bool:
         """The type is `Union[T...]`"""
@@ -95,7 +109,23 @@ class TypeInfo(t.Generic[T]):
 
     @classmethod
     def analyze(cls, annotation: at.Annotation) -> TypeInfo[T]:
-        """Create a `TypeInfo` object based on a type annotation"""
+        """Create a `TypeInfo` object based on a type annotation.
+
+        Results are cached, so analyzing an annotation that has been seen before
+        returns the same `TypeInfo` object, and its cached properties are only
+        computed once. Annotations that cannot be hashed (like `Annotated` with
+        unhashable metadata) are analyzed every time.
+        """
+        try:
+            key = _cache_key(annotation)
+            hash(key)
+        except TypeError:
+            return cls._analyze(annotation)
+
+        return _analyze_cached(cls, key, annotation)  # type: ignore[arg-type]
+
+    @classmethod
+    def _analyze(cls, annotation: at.Annotation) -> TypeInfo[T]:
         original_type = annotation
         origin = t.get_origin(annotation) or annotation
         annotated_args: tuple[t.Any, ...] = tuple()
@@ -114,3 +144,26 @@ class TypeInfo(t.Generic[T]):
             sub_types=sub_types,
             annotations=annotated_args,
         )
+
+
+def _cache_key(annotation: t.Any) -> t.Hashable:
+    """Builds a key for `annotation` that keeps the order and kind of its arguments.
+    Annotations can't be used as a key directly, because `Union` and `Literal` compare
+    equal regardless of the order of their members (`Union[int, str] == Union[str, int]`),
+    and `int | str` compares equal to `Union[int, str]`"""
+    args = t.get_args(annotation)
+    if not args:
+        return (type(annotation), annotation)
+
+    return (
+        type(annotation),
+        t.get_origin(annotation),
+        tuple(_cache_key(arg) for arg in args),
+    )
+
+
+@functools.lru_cache(maxsize=ANALYZE_CACHE_SIZE)
+def _analyze_cached(
+    cls: type[TypeInfo[T]], key: t.Hashable, annotation: at.Annotation
+) -> TypeInfo[T]:
+    return cls._analyze(annotation)
@@ -23,13 +23,18 @@ ParseResult = dict[str, t.Union[str, list[str], None, Constant]]
 
 Env = t.Literal["production", "development", "test"]
 
+ParserEngine = t.Literal["native", "argparse"]
+
 InputArgs = t.Union[str, t.Sequence[str], None]
 
-CompletionFunc = t.Callable[
-    [CompletionInfo, "Param[t.Any]"], t.Union[t.Iterable[Completion], None]
-]
+CompletionReturn = (
+    t.Iterable[Completion]
+    | t.AsyncIterable[Completion]
+    | t.Awaitable[t.Iterable[Completion] | None]
+    | None
+)
 
-CompletionReturn = t.Iterable[Completion] | None
+CompletionFunc = t.Callable[[CompletionInfo, "Param[t.Any]"], CompletionReturn]
 
 TypeMiddleware = t.Callable[[t.Any, "Context", "Param[t.Any]"], t.Any]
 
@@ -40,14 +40,29 @@ def dispatch_args(func: t.Callable[..., T], *args: t.Any) -> T:
     # 1 2
     ```
     """
+    args = args[0 : arg_count(func)]
+    return func(*args)
+
+
+def dispatcher(func: t.Callable[..., T]) -> t.Callable[..., T]:
+    """Pre-binds `dispatch_args()` to `func`. The returned callable
+    can be called with any number of args, and will call `func`
+    with as many as it accepts, without inspecting `func` again"""
+    count = arg_count(func)
+
+    def dispatch(*args: t.Any) -> T:
+        return func(*args[0:count])
+
+    return dispatch
+
+
+def arg_count(func: t.Callable[..., t.Any]) -> int:
+    """The number of positional arguments that `func` accepts"""
     # TODO: I haven't tested if this will capture
     # all callables, but it should hopefully.
     if isinstance(func, MethodType):
-        arg_count = func.__func__.__code__.co_argcount - 1
+        return func.__func__.__code__.co_argcount - 1
     elif inspect.isfunction(func):
-        arg_count = func.__code__.co_argcount
-    else:
-        arg_count = func.__call__.__func__.__code__.co_argcount - 1  # type: ignore
+        return func.__code__.co_argcount
 
-    args = args[0:arg_count]
-    return func(*args)
+    return func.__call__.__func__.__code__.co_argcount - 1  # type: ignore
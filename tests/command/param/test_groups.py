@@ -125,3 +125,57 @@ def test_errors_bubbling() -> None:
 
     with pytest.raises(RuntimeError):
         command("1")
+
+
+def test_instance_tree() -> None:
+    @arc.group
+    class Sub:
+        other_val: int
+
+    @arc.group
+    class Group:
+        val: int
+        sub: Sub
+
+    @arc.command
+    def command(first: int, group: Group):
+        return group
+
+    tree = command.param_def.create_instance()
+    tree["first"] = 1
+    tree[("group", "val")] = 2
+    tree[("group", "sub", "other_val")] = 3
+
+    assert [leaf.value for leaf in tree.leaves()][-3:] == [1, 2, 3]
+    assert tree[("group", "sub", "other_val")] == 3
+    with pytest.raises(KeyError):
+        tree[("group", "sub")]
+
+    compiled = tree.compile()
+    assert compiled["first"] == 1
+    assert compiled["group"].val == 2
+    assert compiled["group"].sub.other_val == 3
+    assert "help" not in compiled
+    assert "help" in tree.compile(include_hidden=True)
+
+
+def test_deprecated_tree_root() -> None:
+    @arc.group
+    class Group:
+        val: int
+
+    @arc.command
+    def command(group: Group, other: int): ...
+
+    tree = command.param_def.create_instance()
+    with pytest.warns(DeprecationWarning):
+        root = tree.root
+
+    assert [child.name for child in root.children] == ["help", "other", "group"]
+    assert list(root.leaves()) == list(tree.leaves())
+
+    tree["other"] = 1
+    tree[("group", "val")] = 2
+    compiled = root.compile()
+    assert compiled["other"] == 1
+    assert compiled["group"].val == 2
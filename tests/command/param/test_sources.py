@@ -132,6 +132,23 @@ class TestGetter:
 
         assert getter("") == 2
 
+    def test_replaced(self):
+        @arc.command
+        def getter(val: int = Argument(default=1)):
+            return val
+
+        @getter.get("val")
+        def first(param):
+            return 2
+
+        assert getter("") == 2
+
+        @getter.get("val")
+        def second(param, ctx):
+            return 3
+
+        assert getter("") == 3
+
     def test_missing(self):
         @arc.command
         def getter(val: int = Argument()):
@@ -0,0 +1,48 @@
+import pytest
+
+from arc.present import Ansi, Box
+from arc.present.ansi import colorize, fg, fx
+
+
+@pytest.mark.parametrize(
+    "string,clean,length",
+    [
+        ("plain", "plain", 5),
+        (colorize("red", fg.RED, fx.BOLD), "red", 3),
+        (fg.rgb(1, 2, 3) + "rgb", "rgb", 3),
+        ("\x1b[2K\x1b[1Aup", "up", 2),
+        ("\x1b[?25lhidden", "hidden", 6),
+        ("\x1b]8;;https://arc.dev\x1b\\link\x1b]8;;\x1b\\", "link", 4),
+        ("\x1b]0;title\x07text", "text", 4),
+        ("日本語", "日本語", 6),
+        (colorize("ｆｕｌｌ", fg.RED), "ｆｕｌｌ", 8),
+        ("é", "é", 1),
+        ("a‍b", "a‍b", 2),
+        ("", "", 0),
+    ],
+)
+def test_ansi(string: str, clean: str, length: int):
+    assert Ansi.clean(string) == clean
+    assert Ansi.len(string) == length
+    assert Ansi.len(string * 100) == length * 100
+
+
+def test_box_width():
+    lines = str(Box(f"{colorize('日本', fg.RED)}\nabcd")).split("\n")
+    assert len({Ansi.len(line) for line in lines}) == 1
+
+
+@pytest.mark.parametrize(
+    "width, truncated",
+    [
+        (20, f"{fg.RED}漢字{fx.CLEAR}abc"),
+        (6, f"{fg.RED}漢字{fx.CLEAR}a…{fx.CLEAR}"),
+        (4, f"{fg.RED}漢…{fx.CLEAR}"),
+        (1, f"{fg.RED}…{fx.CLEAR}"),
+        (0, ""),
+    ],
+)
+def test_truncate(width: int, truncated: str):
+    result = Ansi.truncate(f"{fg.RED}漢字{fx.CLEAR}abc", width)
+    assert result == truncated
+    assert Ansi.len(result) <= width
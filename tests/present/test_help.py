@@ -1,5 +1,9 @@
+import os
+
 import arc
+from arc.define.documentation import ADDRESS
 from arc.present import Ansi
+from arc.present.render_cache import RenderCache
 
 
 def test_basic():
@@ -195,3 +199,59 @@ OPTIONS
     --help (-h)  Displays this help message
 """
     )
+
+
+def test_render_cache(tmp_path, monkeypatch):
+    config = arc.Config(present=arc.PresentConfig(cache_dir=str(tmp_path)))
+
+    @arc.command(config=config)
+    def command(name: str):
+        """Here's a description"""
+
+    rendered = command.doc.help()
+    assert len(list(tmp_path.iterdir())) == 1
+
+    def fail(*args, **kwargs):
+        raise AssertionError("help should be read from the cache")
+
+    monkeypatch.setattr(arc.present.MarkdownParser, "parse", fail)
+    assert command.doc.help() == rendered
+    monkeypatch.undo()
+
+    @command.subcommand
+    def sub(): ...
+
+    assert command.doc.help() != rendered
+    assert len(list(tmp_path.iterdir())) == 2
+
+
+def test_render_cache_key(tmp_path):
+    class Thing: ...
+
+    def make(width: int, cache_dir: str | None = str(tmp_path)):
+        config = arc.Config(present=arc.PresentConfig(cache_dir=cache_dir, width=width))
+
+        @arc.command(config=config)
+        def command(thing: str = Thing()):
+            """lorem ipsum dolor sit amet consectetur adipiscing elit sed do eiusmod"""
+
+        return command
+
+    wide = make(80).doc.help()
+    narrow = make(30).doc.help()
+    assert narrow != wide
+    uncached = make(30, cache_dir=None).doc.help()
+    assert ADDRESS.sub("", narrow) == ADDRESS.sub("", uncached)
+
+    # A new default object (at a different address) should hit the same entry
+    assert make(30).doc.help() == narrow
+    assert len(list(tmp_path.iterdir())) == 2
+
+
+def test_render_cache_limit(tmp_path):
+    cache = RenderCache(tmp_path, max_entries=2)
+    for idx in range(4):
+        cache.set(str(idx), "value")
+        os.utime(cache.path(str(idx)), ns=(idx, idx))
+
+    assert sorted(path.name for path in tmp_path.iterdir()) == ["2", "3"]
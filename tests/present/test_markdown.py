@@ -1,5 +1,10 @@
+import io
+import sys
+
+import pytest
+
 import arc
-from arc.color import fg, bg, fx
+from arc.color import bg, fg, fx
 
 
 def test_markdown_heading():
@@ -201,3 +206,92 @@ def test_command_markdown():
         command.doc.help()
         == "\x1b[1mUSAGE\x1b[0m\n    \x1b[38;2;59;192;240mcli\x1b[0m [-h] [--value3 VALUE3] --value VALUE --value2 VALUE2\n    \x1b[38;2;59;192;240mcli\x1b[0m \x1b[4m<subcommand>\x1b[0m [ARGUMENTS ...]\n\n\x1b[1mDESCRIPTION\x1b[0m\n    Here's a description lorem ipsum dolor sit amet consectetur adipiscing elit\n    sed do eiusmod tempor incididunt ut labore et dolore magna aliqua ut enim ad\n    minim veniam quis nostrud exercitation ullamco laboris nisi ut aliquip ex ea\n    commodo consequat duis aute irure dolor in reprehenderit in voluptate velit\n    esse\n\n\x1b[1mOPTIONS\x1b[0m\n    \x1b[38;2;59;192;240m--help\x1b[0m\x1b[90m (-h)\x1b[0m  Displays this help message\n    \x1b[38;2;59;192;240m--value\x1b[0m      lorem ipsum dolor sit amet consectetur adipiscing elit sed do\n                 eiusmod tempor incididunt ut labore et dolore magna aliqua ut\n                 enim ad minim veniam quis nostrud exercitation ullamco\n                 laboris nisi ut aliquip ex ea commodo consequat duis aute\n                 irure dolor in reprehenderit in voluptate velit esse\n    \x1b[38;2;59;192;240m--value2\x1b[0m     lorem ipsum dolor sit \x1b[1mamet\x1b[0m consectetur adipiscing elit sed do\n                 eiusmod tempor incididunt ut labore et dolore magna aliqua ut\n                 enim ad minim veniam quis nostrud exercitation ullamco\n                 laboris nisi ut aliquip ex ea commodo consequat duis aute\n                 irure dolor in reprehenderit in voluptate velit esse\n    \x1b[38;2;59;192;240m--value3\x1b[0m     thing \x1b[90m(default: hi)\x1b[0m\n\n\x1b[1mSUBCOMMANDS\x1b[0m\n    \x1b[38;2;59;192;240msub\x1b[0m          short desc\n\n\x1b[1mHEADING 1\x1b[0m\n    Here's a paragraph. Here's a second line for that paragraph\n\n\x1b[1mEMPHASIS\x1b[0m\n    Here's a \x1b[3msecond\x1b[0m paragraph\n\n\x1b[1mBOLD\x1b[0m\n    Here's a \x1b[1mthird\x1b[0m paragraph\n\n\x1b[1mLINKS\x1b[0m\n    Here's a link: \x1b[38;2;59;192;240m\x1b[4mhttps://www.google.com\x1b[0m\n\n\x1b[1mCODE\x1b[0m\n    Here's some code: \x1b[100m\x1b[37mcli --help\x1b[0m\n\n\x1b[1mSTRIKETHROUGH TEXT\x1b[0m\n    Here's some strikethrough: \x1b[9mstrikethrough\x1b[0m\n\n\x1b[1mUNDERLINED TEXT\x1b[0m\n    Here's some underline: \x1b[4munderline\x1b[0m\n\n\x1b[1mUNFORMATTED TEXT\x1b[0m\ndo not format this content at all\nThis should remain on this line\n            This should remain on this line\n                This should remain on this line\n\n\x1b[1mLIST\x1b[0m\n    For example:\n\n      • lorem ipsum dolor sit amet consectetur adipiscing elit sed do eiusmod\n        tempor incididunt ut labore et dolore magna aliqua ut enim ad minim\n        veniam quis nostrud\n      • \x1b[1mitem 1\x1b[0m\n      • \x1b[3mitem 2\x1b[0m \x1b[4mainfeianfeianfeianfein\x1b[0m\n      • item 3\n\n\x1b[1mCOLORED TEXT\x1b[0m\n      • \x1b[31mred\x1b[0m\n      • \x1b[90mred\x1b[0m\n"
     )
+
+
+STREAM_DOC = """
+# Report
+
+First paragraph
+spanning two lines
+
+- one
+- **two**
+
+```
+  raw content
+```
+
+---
+
+Last paragraph
+"""
+
+
+def test_stream_markdown():
+    config = arc.PresentConfig()
+    expected = arc.markdown(STREAM_DOC, config)
+
+    assert "".join(arc.stream_markdown(STREAM_DOC, config)) == expected
+    assert (
+        "".join(arc.stream_markdown(io.StringIO(STREAM_DOC.lstrip()), config))
+        == expected
+    )
+
+
+@pytest.mark.parametrize(
+    "text",
+    [
+        "",
+        "   \n\n  ",
+        "para\n\n```\n```",
+        "```\n```\n\npara\n\n```\n```\n\n# heading\n\n```\n```",
+    ],
+)
+def test_stream_markdown_edges(text: str):
+    config = arc.PresentConfig()
+    assert "".join(arc.stream_markdown(text, config)) == arc.markdown(text, config)
+
+
+def test_stream_markdown_is_lazy():
+    consumed = 0
+
+    def lines():
+        nonlocal consumed
+        for line in STREAM_DOC.split("\n"):
+            consumed += 1
+            yield line
+
+    stream = arc.stream_markdown(lines(), arc.PresentConfig())
+    assert next(stream) == f"{fx.BOLD}REPORT{fx.CLEAR}"
+    # The heading is yielded as soon as it has been parsed,
+    # so nothing after it should have been read
+    assert consumed == 2
+
+
+def test_parse_stream():
+    nodes = list(arc.present.MarkdownParser().parse_stream(STREAM_DOC.split("\n")))
+    assert [type(node).__name__ for node in nodes] == [
+        "Heading",
+        "Paragraph",
+        "List",
+        "Unformatted",
+        "HorizontalRule",
+        "Paragraph",
+    ]
+
+
+def test_pager_stream(tmp_path):
+    out = tmp_path / "out"
+    command = [
+        sys.executable,
+        "-c",
+        f"import sys, shutil; shutil.copyfileobj(sys.stdin, open({str(out)!r}, 'w'))",
+    ]
+
+    arc.pager(arc.stream_markdown(STREAM_DOC), command)
+    assert out.read_text() == arc.markdown(STREAM_DOC)
+
+
+def test_pager_closed_early():
+    chunks = ("x" * 65536 for _ in range(256))
+    arc.pager(chunks, [sys.executable, "-c", "pass"])
@@ -0,0 +1,94 @@
+import io
+import itertools
+
+from arc.color import fg, fx
+from arc.present import Ansi, Table
+
+ROWS = [
+    ["Jonathen Joestar", 20, "-"],
+    ["Joseph Joestar", 18, "Hermit Purple (in Part 3)"],
+]
+
+
+def test_str():
+    table = Table(["Name", "Age", "Stand"], ROWS, default_formatting=False)
+    assert str(table) == (
+        "┏━━━━━━━━━━━━━━━━━━┳━━━━━┳━━━━━━━━━━━━━━━━━━━━━━━━━━━┓\n"
+        "┃ Name             ┃ Age ┃ Stand                     ┃\n"
+        "┡━━━━━━━━━━━━━━━━━━╇━━━━━╇━━━━━━━━━━━━━━━━━━━━━━━━━━━┩\n"
+        "│ Jonathen Joestar │ 20  │ -                         │\n"
+        "│ Joseph Joestar   │ 18  │ Hermit Purple (in Part 3) │\n"
+        "└──────────────────┴─────┴───────────────────────────┘"
+    )
+
+
+def test_stream_matches_str():
+    table = Table(["Name", "Age", "Stand"])
+    file = io.StringIO()
+    table.stream(iter(ROWS), file=file)
+
+    assert (
+        file.getvalue() == Ansi.clean(str(Table(["Name", "Age", "Stand"], ROWS))) + "\n"
+    )
+
+
+def test_stream_sample():
+    table = Table(["Name", {"name": "Age", "width": 5}], default_formatting=False)
+    rows = [["Jotaro Kujo", 18], ["Josuke Higashikata", 16]]
+    assert list(table.lines(rows, sample=1))[1:] == [
+        "│ Jotaro Kujo │ 18  │",
+        "│ Josuke Hig… │ 16  │",
+        "└─────────────┴─────┘",
+    ]
+
+
+def test_fixed_width():
+    table = Table(
+        ["Name", {"name": "Id", "width": 6}],
+        [["Jotaro", 123456]],
+        default_formatting=False,
+    )
+    assert str(table).splitlines() == [
+        "┏━━━━━━━━┳━━━━━━┓",
+        "┃ Name   ┃ Id   ┃",
+        "┡━━━━━━━━╇━━━━━━┩",
+        "│ Jotaro │ 123… │",
+        "└────────┴──────┘",
+    ]
+
+
+def test_truncate_display_width():
+    table = Table([{"name": "Name", "width": 8}])
+    table.add_row([f"{fg.RED}漢字漢字{fx.CLEAR}"])
+    row = str(table).splitlines()[3]
+
+    assert row == f"│ {fg.RED}漢字…{fx.CLEAR}  │"
+    assert Ansi.len(row) == 10
+
+
+def test_stream_is_lazy():
+    table = Table(["Value"], default_formatting=False)
+    rows = ([i] for i in itertools.count())
+    lines = table.lines(rows, sample=10)
+
+    assert next(lines).count("\n") == 2
+    assert [next(lines) for _ in range(20)][-1] == "│ 19    │"
+
+
+def test_single_pass():
+    # Each cell should be formatted once, not once to
+    # measure its column and again to render it
+    rows = [[f"host-{i}", i, i % 2 == 0] for i in range(1_000)]
+    table = Table(["Host", "Id", "Up"], rows)
+    calls: dict[object, int] = {}
+
+    @table.fmt_cell
+    def fmt(cell):
+        calls[cell] = calls.get(cell, 0) + 1
+        return str(cell)
+
+    rendered = str(table)
+
+    assert len(calls) == len(rows)
+    assert set(calls.values()) == {1}
+    assert rendered.count("\n") == len(rows) + 3
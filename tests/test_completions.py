@@ -1,3 +1,6 @@
+import asyncio
+import threading
+import time
 from typing import Literal
 import pytest
 
@@ -79,3 +82,253 @@ def test_custom_completions():
         autocompletions.Completion("Johnathen"),
         autocompletions.Completion("Joseph"),
     ]
+
+
+def test_completion_fast_path(
+    monkeypatch: pytest.MonkeyPatch, capsys: pytest.CaptureFixture, tmp_path
+):
+    @arc.command("cli", config=arc.Config(autocomplete=True))
+    def command(name: Literal["Johnathen", "Joseph"]): ...
+
+    app = arc.App(command)
+
+    @app.use(pos=0)
+    def fail(ctx):
+        raise AssertionError("the init stack should not run")
+
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setenv("_CLI_COMPLETE", "true")
+    monkeypatch.setenv("COMP_WORDS", "cli")
+    monkeypatch.setenv("COMP_CURRENT", "")
+
+    with pytest.raises(SystemExit):
+        app("--autocomplete bash")
+
+    assert capsys.readouterr().out == "plain|Johnathen\nplain|Joseph"
+    assert not (tmp_path / "completions.log").exists()
+
+
+def test_completion_deadline():
+    @arc.command
+    def command(name: str): ...
+
+    @command.complete("name")
+    def names(info, param):
+        yield autocompletions.Completion("Johnathen")
+        yield autocompletions.Completion("Joseph")
+
+    info = autocompletions.CompletionInfo([], "")
+    assert autocompletions.get_completions(command, info, deadline=0) == [
+        autocompletions.Completion("Johnathen"),
+    ]
+
+
+def test_completion_deadline_blocking():
+    release = threading.Event()
+
+    @arc.command
+    def command(name: str, *, other: str): ...
+
+    @command.complete("name")
+    def names(info, param):
+        release.wait(5)
+        yield autocompletions.Completion("Johnathen")
+
+    @command.complete("other")
+    def others(info, param):
+        yield autocompletions.Completion("Joseph")
+        release.wait(5)
+        yield autocompletions.Completion("Jane")
+
+    try:
+        start = time.monotonic()
+        info = autocompletions.CompletionInfo([], "")
+        assert (
+            autocompletions.get_completions(command, info, deadline=start + 0.1) == []
+        )
+
+        info = autocompletions.CompletionInfo(["--other"], "")
+        assert autocompletions.get_completions(
+            command, info, deadline=time.monotonic() + 0.1
+        ) == [autocompletions.Completion("Joseph")]
+        assert time.monotonic() - start < 1
+    finally:
+        release.set()
+
+
+def test_completion_workers():
+    release = threading.Event()
+    started = []
+
+    @arc.command
+    def command(*, other: str): ...
+
+    @command.complete("other")
+    def others(info, param):
+        started.append(threading.current_thread())
+        release.wait(5)
+        yield autocompletions.Completion("Jane")
+
+    workers = autocompletions._workers
+    info = autocompletions.CompletionInfo(["--other"], "")
+    try:
+        # Like a server handling many requests for a source that stays blocked
+        for _ in range(workers.size + 2):
+            assert (
+                autocompletions.get_completions(
+                    command, info, deadline=time.monotonic() + 0.01
+                )
+                == []
+            )
+
+        assert len(started) == workers.size
+        assert len(workers.threads) == workers.size
+    finally:
+        release.set()
+
+    # The threads are reused once the sources finish
+    assert autocompletions.get_completions(
+        command, info, deadline=time.monotonic() + 1
+    ) == [autocompletions.Completion("Jane")]
+    assert len(workers.threads) == workers.size
+
+
+def test_async_completions():
+    @arc.command
+    def command(name: str, *, other: str): ...
+
+    @command.complete("name")
+    async def names(info, param):
+        return [autocompletions.Completion("Johnathen")]
+
+    @command.complete("other")
+    async def others(info, param):
+        yield autocompletions.Completion("Joseph")
+
+    assert autocompletions.get_completions(
+        command, autocompletions.CompletionInfo([], "")
+    ) == [autocompletions.Completion("Johnathen")]
+    assert autocompletions.get_completions(
+        command, autocompletions.CompletionInfo(["--other"], "")
+    ) == [autocompletions.Completion("Joseph")]
+
+
+def test_async_completion_deadline():
+    slow = False
+
+    @arc.command
+    def command(name: str): ...
+
+    @command.complete("name")
+    async def names(info, param):
+        yield autocompletions.Completion("Johnathen")
+        if slow:
+            await asyncio.sleep(10)
+        yield autocompletions.Completion("Joseph")
+
+    info = autocompletions.CompletionInfo([], "")
+    deadline = time.monotonic() + 0.1
+    assert autocompletions.get_completions(command, info, deadline=deadline) == [
+        autocompletions.Completion("Johnathen"),
+        autocompletions.Completion("Joseph"),
+    ]
+
+    # Cut off by the deadline, only what was yielded before it is kept
+    slow = True
+    start = time.monotonic()
+    deadline = start + 0.1
+    info = autocompletions.CompletionInfo([], "J")
+    assert autocompletions.get_completions(command, info, deadline=deadline) == [
+        autocompletions.Completion("Johnathen"),
+    ]
+    assert time.monotonic() - start < 1
+
+
+@pytest.mark.parametrize("is_async", [True, False])
+def test_completion_fallback(is_async: bool):
+    release = threading.Event()
+    slow = False
+
+    @arc.command
+    def command(name: str): ...
+
+    if is_async:
+
+        @command.complete("name")
+        async def names(info, param):
+            yield autocompletions.Completion("Johnathen")
+            if slow:
+                await asyncio.sleep(10)
+            yield autocompletions.Completion("Joseph")
+
+    else:
+
+        @command.complete("name")
+        def names(info, param):
+            yield autocompletions.Completion("Johnathen")
+            if slow:
+                release.wait(5)
+            yield autocompletions.Completion("Joseph")
+
+    def complete(current: str) -> list[str]:
+        info = autocompletions.CompletionInfo([], current)
+        comps = autocompletions.get_completions(
+            command, info, deadline=time.monotonic() + 0.1
+        )
+        return [comp.value for comp in comps]
+
+    try:
+        assert complete("") == ["Johnathen", "Joseph"]
+
+        # Timed out, so the previous full result for the same input is used
+        slow = True
+        assert complete("") == ["Johnathen", "Joseph"]
+        assert complete("J") == ["Johnathen"]
+    finally:
+        release.set()
+
+
+def test_async_completions_gather():
+    @arc.command
+    def command(first: str, second: str): ...
+
+    @command.complete("first")
+    async def first(info, param):
+        await asyncio.sleep(0.2)
+        return [autocompletions.Completion("a")]
+
+    @command.complete("second")
+    async def second(info, param):
+        await asyncio.sleep(0.2)
+        return [autocompletions.Completion("b")]
+
+    async def both(info):
+        results = await asyncio.gather(
+            *(
+                autocompletions.get_completions_async(param, info)
+                for param in command.argument_params
+            )
+        )
+        return [comp for comps in results for comp in comps]
+
+    start = time.monotonic()
+    assert asyncio.run(both(autocompletions.CompletionInfo([], ""))) == [
+        autocompletions.Completion("a"),
+        autocompletions.Completion("b"),
+    ]
+    assert time.monotonic() - start < 0.35
+
+
+def test_async_completions_in_running_loop():
+    @arc.command
+    def command(name: str): ...
+
+    @command.complete("name")
+    async def names(info, param):
+        return [autocompletions.Completion("Johnathen")]
+
+    async def main():
+        info = autocompletions.CompletionInfo([], "")
+        return autocompletions.get_completions(command, info)
+
+    assert asyncio.run(main()) == [autocompletions.Completion("Johnathen")]
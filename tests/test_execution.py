@@ -1,3 +1,8 @@
+import asyncio
+import subprocess
+import sys
+import time
+
 import arc
 
 
@@ -50,3 +55,124 @@ class TestNestedExecution:
         assert command("sub2") == 10
         assert command("sub3 15") == 15
         assert command("sub4") == 1
+
+
+class TestAsync:
+    def test_sync_commands_skip_asyncio(self):
+        code = (
+            "import sys, arc\n"
+            "arc.command(lambda val: val)('2')\n"
+            "assert 'asyncio' not in sys.modules, 'asyncio'\n"
+            "assert 'concurrent.futures' not in sys.modules, 'concurrent'\n"
+        )
+        subprocess.run([sys.executable, "-c", code], check=True)
+
+    def test_coroutine_callback(self):
+        @arc.command
+        async def command(val: int):
+            await asyncio.sleep(0)
+            return val
+
+        assert command("2") == 2
+
+    def test_shared_loop(self):
+        loops = []
+
+        @arc.command
+        async def command(ctx: arc.Context):
+            loops.append(asyncio.get_running_loop())
+            return await asyncio.gather(
+                ctx.execute(sub, val=1), ctx.execute(sub, val=2)
+            )
+
+        @command.subcommand
+        async def sub(val: int):
+            loops.append(asyncio.get_running_loop())
+            await asyncio.sleep(0.01)
+            return val
+
+        assert command("") == [1, 2]
+        assert len(loops) == 3 and len(set(loops)) == 1
+
+    def test_concurrent_executions(self):
+        def slow(param, ctx):
+            time.sleep(0.05)
+            return id(ctx)
+
+        def fast(param, ctx):
+            return id(ctx)
+
+        @arc.command
+        async def command(ctx: arc.Context):
+            return await asyncio.gather(
+                ctx.execute(sub, val=1), ctx.execute(sub, val=2)
+            )
+
+        @command.subcommand
+        def sub(
+            ctx: arc.Context,
+            val: int,
+            first: int = arc.Option(get=slow),
+            second: int = arc.Option(get=fast),
+        ):
+            return val, first == id(ctx), second == id(ctx)
+
+        # The default middlewares are shared by every execution,
+        # so they must not hold on to the state of one of them
+        assert command("") == [(1, True, True), (2, True, True)]
+
+    def test_async_middleware(self):
+        calls = []
+
+        @arc.command
+        def command():
+            calls.append("command")
+            return 1
+
+        @command.use
+        async def middleware(ctx: arc.Context):
+            calls.append("before")
+            yield
+            calls.append("after")
+
+        assert command("") == 1
+        assert calls == ["before", "command", "after"]
+
+    def test_async_middleware_error(self):
+        @arc.command
+        def command():
+            raise RuntimeError()
+
+        @command.use
+        async def middleware(ctx: arc.Context):
+            try:
+                yield
+            except RuntimeError:
+                ctx.state["handled"] = True
+
+        state = {"handled": False}
+        command("", state=state)
+        assert state["handled"]
+
+    def test_async_depends(self):
+        started = 0
+        both = asyncio.Event()
+
+        class Dep:
+            @classmethod
+            async def __depends__(cls, ctx):
+                nonlocal started
+                started += 1
+                if started == 2:
+                    both.set()
+
+                # Only finishes if the other dependency is awaited at the same time
+                await asyncio.wait_for(both.wait(), 5)
+                return cls()
+
+        @arc.command
+        def command(first: Dep, second: Dep):
+            return first, second
+
+        first, second = command("")
+        assert isinstance(first, Dep) and isinstance(second, Dep)
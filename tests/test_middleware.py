@@ -1,6 +1,10 @@
 from collections import UserDict
+from pathlib import Path
+
+import pytest
+
 import arc
-from arc.runtime import Context
+from arc.runtime import Context, MiddlewareStack
 
 
 def test_install():
@@ -85,3 +89,170 @@ def test_overwrite_result():
         return 1
 
     assert command() == 1
+
+
+class TestCompile:
+    def test_default_stack(self):
+        @arc.command
+        def command(): ...
+
+        compiled = arc.ExecMiddleware.compile(MiddlewareStack(command._stack))
+        assert arc.ExecMiddleware.FusedParamProcessors in compiled
+        assert arc.ExecMiddleware.ConvertValues not in compiled
+
+    def test_custom_stack(self):
+        @arc.command
+        def command(): ...
+
+        @command.use(after=arc.ExecMiddleware.ConvertValues)
+        def middleware(ctx): ...
+
+        stack = MiddlewareStack(command._stack)
+        assert arc.ExecMiddleware.compile(stack) is stack
+
+    def test_same_results(self):
+        @arc.command
+        def command(val: int, *, opt: str = "default", flag: bool, ctx: Context):
+            return val, opt, flag, ctx.get_origin("opt")
+
+        assert command("1") == (1, "default", False, "default")
+        assert command("1 --opt hi --flag") == (1, "hi", True, "command_line")
+
+        @command.use
+        def middleware(ctx): ...
+
+        assert command("1") == (1, "default", False, "default")
+        assert command("1 --opt hi --flag") == (1, "hi", True, "command_line")
+
+    @pytest.mark.parametrize("custom", [False, True])
+    def test_stage_order(self, monkeypatch: pytest.MonkeyPatch, custom: bool):
+        calls = []
+
+        @arc.command
+        def command(*, first: int = arc.Option(envvar="FIRST"), second: str): ...
+
+        @command.get("second")
+        def get_second(param, ctx):
+            calls.append("second")
+            return "value"
+
+        if custom:
+
+            @command.use
+            def middleware(ctx): ...
+
+        # Every value is retrieved before any of them are converted
+        monkeypatch.setenv("FIRST", "invalid")
+        with pytest.raises(arc.errors.InvalidParamValueError):
+            command("")
+
+        assert calls == ["second"]
+
+
+class TestPlan:
+    def test_cached(self):
+        @arc.command
+        def command(val: int, *, opt: str = "default"): ...
+
+        plan = command.param_def.plan
+        assert plan is command.param_def.plan
+        assert [entry.param.argument_name for entry in plan.entries] == [
+            "help",
+            "val",
+            "opt",
+        ]
+
+    def test_select(self):
+        @arc.command
+        def command(val: int, *, env: str = arc.Option(envvar="ENV"), ctx: Context): ...
+
+        plan = command.param_def.plan
+        env = plan.select(arc.ExecMiddleware.GetEnvValue.applies)
+        assert [entry.param.argument_name for entry in env] == ["env"]
+        injected = plan.select(arc.ExecMiddleware.DependancyInjector.applies)
+        assert [entry.param.argument_name for entry in injected] == ["ctx"]
+
+    def test_rebuilt_on_change(self):
+        @arc.command
+        def command(*, val: int = 1):
+            return val
+
+        assert command("") == 1
+        plan = command.param_def.plan
+
+        @command.get("val")
+        def get_val(param, ctx):
+            return 2
+
+        assert command.param_def.plan is not plan
+        assert command("") == 2
+
+    def test_rebuilt_on_param_change(self, monkeypatch: pytest.MonkeyPatch):
+        @arc.command
+        def command(*, val: int = 1):
+            return val
+
+        assert command("") == 1
+        plan = command.param_def.plan
+        assert command.param_def.plan is plan
+
+        monkeypatch.setenv("VAL", "2")
+        command.get_param("val").envvar = "VAL"
+        assert command.param_def.plan is not plan
+        assert command("") == 2
+
+        plan = command.param_def.plan
+        command.param_def.params.append(command.param_def.params.popleft())
+        assert command.param_def.plan is not plan
+
+
+class TestArgfiles:
+    @pytest.fixture
+    def command(self):
+        @arc.command(config=arc.Config(environment="development", allow_argfiles=True))
+        def command(vals: list[str], *, flag: bool):
+            return vals, flag
+
+        return command
+
+    def test_expand(self, command: arc.Command, tmp_path: Path):
+        (tmp_path / "nested").write_text("c d\n--flag\n")
+        (tmp_path / "args").write_text(f"a\n@{tmp_path / 'nested'}\nb\r\n")
+
+        assert command(["x", f"@{tmp_path / 'args'}"]) == (["x", "a", "c d", "b"], True)
+        assert command(["--", f"@{tmp_path / 'args'}"]) == (
+            [f"@{tmp_path / 'args'}"],
+            False,
+        )
+
+    def test_large(self, command: arc.Command, tmp_path: Path, monkeypatch):
+        monkeypatch.setattr(arc.InitMiddleware.NormalizeInput, "MMAP_THRESHOLD", 10)
+        (tmp_path / "args").write_text("\n".join(str(i) for i in range(1000)))
+
+        vals, _ = command([f"@{tmp_path / 'args'}"])
+        assert vals == [str(i) for i in range(1000)]
+
+    def test_errors(self, command: arc.Command, tmp_path: Path):
+        (tmp_path / "args").write_text(f"a\n@{tmp_path / 'args'}")
+
+        with pytest.raises(arc.errors.UsageError):
+            command([f"@{tmp_path / 'args'}"])
+
+        with pytest.raises(arc.errors.UsageError):
+            command([f"@{tmp_path / 'missing'}"])
+
+        (tmp_path / "binary").write_bytes(b"a\n\xff\xfe\n")
+        with pytest.raises(arc.errors.UsageError, match="binary"):
+            command([f"@{tmp_path / 'binary'}"])
+
+    def test_blank_lines(self, command: arc.Command, tmp_path: Path):
+        (tmp_path / "args").write_text("a\n\nb\r\n\r\n")
+
+        assert command([f"@{tmp_path / 'args'}"]) == (["a", "b"], False)
+
+    def test_disabled(self, tmp_path: Path):
+        @arc.command
+        def command(vals: list[str]):
+            return vals
+
+        assert command([f"@{tmp_path}"]) == [f"@{tmp_path}"]
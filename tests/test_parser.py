@@ -1,6 +1,16 @@
 import pytest
 import arc
 from arc import errors
+from arc.config import Config
+
+
+@pytest.fixture(autouse=True, params=["native", "argparse"])
+def engine(request):
+    config = Config.load()
+    previous = config.parser
+    config.parser = request.param
+    yield request.param
+    config.parser = previous
 
 
 class TestOptionSyntax:
@@ -33,6 +43,14 @@ class TestOptionSyntax:
         with pytest.raises(errors.ArgumentError):
             command("-f")
 
+    def test_ambiguous_prefix(self):
+        @arc.command()
+        def command(flag: bool, flag_two: bool):
+            return flag, flag_two
+
+        with pytest.raises(errors.ParserError):
+            command("--fl")
+
     def test_value_with_space(self):
         @arc.command()
         def command(*, value: int):
@@ -47,3 +65,121 @@ class TestOptionSyntax:
 
         assert command("--value=42") == 42
         assert command("--v=42") == 42
+
+    def test_short_value(self):
+        @arc.command()
+        def command(*, value: int = arc.Option(short="v")):
+            return value
+
+        assert command("-v 42") == 42
+        assert command("-v42") == 42
+        assert command("-v=42") == 42
+
+    def test_combined_short_flags(self):
+        @arc.command()
+        def command(
+            first: bool = arc.Flag(short="f"),
+            *,
+            count: int = arc.Count(short="c"),
+            value: int = arc.Option(short="v", default=0),
+        ):
+            return first, count, value
+
+        assert command("-fcc") == (True, 2, 0)
+        assert command("-fccv3") == (True, 2, 3)
+
+        with pytest.raises(errors.ParserError):
+            command("-fx")
+
+
+class TestPositionalSyntax:
+    def test_intermixed(self):
+        @arc.command()
+        def command(first: str, rest: list[int], *, flag: bool, value: int = 0):
+            return first, rest, flag, value
+
+        assert command("a 1 --flag 2 --value 3 4") == ("a", [1, 2, 4], True, 3)
+
+    def test_negative_numbers(self):
+        @arc.command()
+        def command(value: int, *, other: float = 0):
+            return value, other
+
+        assert command("-1 --other -2.5") == (-1, -2.5)
+
+    def test_stdin_char(self):
+        @arc.command()
+        def command(value: str):
+            return value
+
+        assert command("-") == "-"
+
+    def test_fixed_size_after_collection(self):
+        @arc.command()
+        def command(first: list[int], second: tuple[int, int]):
+            return first, second
+
+        assert command("1 2 3 4") == ([1, 2], (3, 4))
+
+        with pytest.raises(errors.ParserError):
+            command("1")
+
+    def test_unrecognized(self):
+        @arc.command()
+        def command(value: str):
+            return value
+
+        with pytest.raises(errors.UnrecognizedArgError):
+            command("a b")
+
+        with pytest.raises(errors.UnrecognizedArgError):
+            command("a --other")
+
+
+def test_default_engine():
+    # The native parser is opt-in, as it handles "--" differently
+    assert Config().parser == "argparse"
+
+
+def test_separator(engine):
+    if engine == "argparse":
+        pytest.skip("argparse's intermixed parsing does not respect '--'")
+
+    @arc.command()
+    def command(values: list[str], *, flag: bool):
+        return values, flag
+
+    assert command("--flag -- --flag -x -") == (["--flag", "-x", "-"], True)
+
+
+class TestParserCache:
+    def test_reused(self):
+        @arc.command()
+        def command(value: int):
+            return value
+
+        assert command("1") == 1
+        parser = command._parser_cache
+        assert command("2") == 2
+        assert command._parser_cache is parser
+
+    def test_invalidated(self, engine):
+        @arc.command()
+        def command(value: int):
+            return value
+
+        command("1")
+        _, parser = command._parser_cache
+
+        command.config.version = "1.0.0"
+        try:
+            assert command("1") == 1
+            _, new_parser = command._parser_cache
+            assert new_parser is not parser
+            assert "--version" in new_parser.param_map
+
+            assert command("2") == 2
+            assert command._parser_cache[1] is new_parser
+            assert [p.argument_name for p in command.params].count("version") == 1
+        finally:
+            command.config.version = None
@@ -0,0 +1,122 @@
+import json
+import multiprocessing
+import os
+import socket
+import sys
+from pathlib import Path
+
+import pytest
+
+import arc
+from arc.present import out
+from arc.runtime import client
+from arc.runtime.server import CommandServer, WorkerPool
+
+pytestmark = pytest.mark.skipif(
+    sys.platform in ("win32", "cygwin", "emscripten"), reason="Unix sockets only"
+)
+
+
+@arc.command(config=arc.Config(environment="production"))
+def command(name: str, *, env: str = arc.Option(envvar="NAME", default="none")):
+    if name == "pid":
+        arc.print(os.getpid())
+        return
+
+    if name == "read":
+        arc.print(sys.stdin.readline(), end="")
+        return
+
+    arc.print(f"{name} {env} {os.getcwd()}")
+    if name == "fail":
+        arc.exit(3)
+
+
+def serve(server: CommandServer | WorkerPool):
+    # pytest replaces the stdio streams with its own, which
+    # don't write to the file descriptors the server redirects
+    sys.stdout = sys.__stdout__
+    sys.stderr = sys.__stderr__
+    out._console = None
+    server.serve()
+
+
+@pytest.fixture
+def server(tmp_path: Path):
+    path = str(tmp_path / "cli.sock")
+    server = CommandServer(arc.App(command), path)
+    server.listen()
+    process = multiprocessing.get_context("fork").Process(target=serve, args=(server,))
+    process.start()
+    server.sock.close()  # type: ignore
+    yield path
+    process.kill()
+    process.join()
+
+
+def run(
+    path: str, args: list[str], tmp_path: Path, input: str = "", **kwargs
+) -> tuple[int, str]:
+    out = tmp_path / "out"
+    inp = tmp_path / "in"
+    inp.write_text(input)
+    with inp.open() as stdin, out.open("w") as stdout:
+        code = client.request(
+            path, args, fds=(stdin.fileno(), stdout.fileno(), stdout.fileno()), **kwargs
+        )
+
+    return code, out.read_text()
+
+
+def test_request(server: str, tmp_path: Path):
+    assert run(server, ["joe"], tmp_path, env={"NAME": "env"}, cwd="/") == (
+        0,
+        "joe env /\n",
+    )
+    assert run(server, ["fail"], tmp_path, cwd="/") == (3, "fail none /\n")
+
+
+def test_usage_error(server: str, tmp_path: Path):
+    code, output = run(server, [], tmp_path)
+    assert code == 1
+    assert "The following arguments are required: name" in output
+
+
+def test_bad_requests(server: str, tmp_path: Path):
+    payload = json.dumps({"args": "joe"}).encode()
+    for message in (
+        b"",
+        client.HEADER.pack(100),
+        client.HEADER.pack(len(payload)) + payload,
+        client.HEADER.pack(4) + b"\xff\xfe{[",
+    ):
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+            sock.connect(server)
+            sock.sendall(message)
+            sock.shutdown(socket.SHUT_WR)
+            assert sock.recv(client.EXIT_CODE.size) == b""
+
+    assert run(server, ["joe"], tmp_path, cwd="/") == (0, "joe none /\n")
+
+
+def test_stdin_per_request(server: str, tmp_path: Path):
+    assert run(server, ["read"], tmp_path, "first\nsecret\n") == (0, "first\n")
+    assert run(server, ["read"], tmp_path, "second\n") == (0, "second\n")
+
+
+def test_worker_pool(tmp_path: Path):
+    path = str(tmp_path / "cli.sock")
+    pool = WorkerPool(arc.App(command), path, workers=2, max_requests=1)
+    pool.server.listen()
+    process = multiprocessing.get_context("fork").Process(target=serve, args=(pool,))
+    process.start()
+
+    try:
+        pids = {run(path, ["pid"], tmp_path)[1] for _ in range(4)}
+        assert len(pids) == 4
+        assert str(process.pid) not in pids
+    finally:
+        process.terminate()
+        process.join(5)
+
+    assert process.exitcode == 0
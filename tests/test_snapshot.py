@@ -0,0 +1,296 @@
+import importlib.util
+import os
+import sys
+from pathlib import Path
+
+import pytest
+
+import arc
+from arc import autocompletions
+from arc.snapshot import Snapshot
+
+SOURCE = """\
+import typing as t
+import arc
+
+config = arc.Config(version="1.2.3", allow_unrecognized_args=True)
+
+@arc.command("cli", config=config)
+def root():
+    \"\"\"The root command\"\"\"
+
+@root.subcommand("greet", "g")
+def greet(name: str, *, times: int = 1, loud: bool):
+    \"\"\"Greets someone
+
+    # Arguments
+    name: who to greet
+    \"\"\"
+    return f"{name}!" * times if loud else name * times
+
+ns = arc.namespace("ns", desc="A namespace")
+root.subcommand(ns)
+
+@ns.subcommand
+def color(value: t.Literal["red", "blue"], *, user: str = "me"):
+    return value
+
+@color.complete("user")
+def users(info, param):
+    yield arc.Completion("them")
+"""
+
+
+@pytest.fixture
+def module(tmp_path: Path, monkeypatch: pytest.MonkeyPatch):
+    name = f"snapshot_cli_{id(tmp_path)}"
+    (tmp_path / f"{name}.py").write_text(SOURCE)
+    monkeypatch.syspath_prepend(str(tmp_path))
+    yield name
+    sys.modules.pop(name, None)
+
+
+@pytest.fixture
+def snapshot(module: str, tmp_path: Path):
+    mod = __import__(module)
+    Snapshot.create(mod.root).dump(tmp_path / "cli.snapshot")
+    sys.modules.pop(module)
+    return Snapshot.load(tmp_path / "cli.snapshot")
+
+
+def test_execute(snapshot: Snapshot, module: str):
+    app = arc.App(snapshot.root)
+    app.use(snapshot.middleware, after=arc.InitMiddleware.Parser)
+
+    assert module not in sys.modules
+    assert app("greet joe --times 2") == "joejoe"
+    assert module in sys.modules
+    assert app("g joe --loud") == "joe!"
+    assert app("ns color red") == "red"
+
+
+def test_from_snapshot(module: str, tmp_path: Path):
+    Snapshot.create(__import__(module).root).dump(tmp_path / "cli.snapshot")
+    app = arc.App.from_snapshot(tmp_path / "cli.snapshot")
+    assert app("greet joe") == "joe"
+
+
+def test_help(snapshot: Snapshot, module: str):
+    with pytest.raises(SystemExit):
+        arc.App(snapshot.root)("greet --help")
+
+    from_snapshot = snapshot.root.subcommands["greet"].doc.help()
+    assert module not in sys.modules
+
+    root = __import__(module).root
+    assert root.subcommands["greet"].doc.help() == from_snapshot
+    assert "who to greet" in from_snapshot
+
+
+def test_lazy_placeholders(snapshot: Snapshot, module: str):
+    root = snapshot.root
+    assert not root.subcommands
+    help = root.doc.help()
+
+    app = arc.App(root)
+    app.use(snapshot.middleware, after=arc.InitMiddleware.Parser)
+    assert app("greet joe") == "joe"
+    # Only the placeholders on the path to the command are built
+    assert list(root.subcommands) == ["greet"]
+    assert list(root.lazy_subcommands) == ["ns"]
+
+    real = __import__(module).root
+    arc.InitMiddleware.AddRuntimeParms.add_params(real.param_def, real.config)
+    assert help == real.doc.help()
+
+
+def test_resolve_lazy_subcommand(module: str, tmp_path: Path):
+    lazy = f"{module}_lazy"
+    (tmp_path / f"{lazy}.py").write_text("def job(): return 'job'\n")
+    source = tmp_path / f"{module}.py"
+    source.write_text(f"{SOURCE}\nroot.lazy_subcommand('{lazy}:job')\n")
+    Snapshot.create(__import__(module).root).dump(tmp_path / "cli.snapshot")
+    sys.modules.pop(module)
+    sys.modules.pop(lazy)
+
+    try:
+        app = arc.App.from_snapshot(tmp_path / "cli.snapshot")
+        assert app("job") == "job"
+    finally:
+        sys.modules.pop(lazy, None)
+
+
+def test_completions(snapshot: Snapshot, module: str):
+    info = autocompletions.CompletionInfo(["ns", "color"], "")
+    assert autocompletions.get_completions(snapshot.root, info) == [
+        autocompletions.Completion("red"),
+        autocompletions.Completion("blue"),
+    ]
+    assert module not in sys.modules
+
+    info = autocompletions.CompletionInfo(["ns", "color", "--user"], "")
+    assert autocompletions.get_completions(snapshot.root, info) == [
+        autocompletions.Completion("them"),
+    ]
+    assert module in sys.modules
+
+
+def test_config(snapshot: Snapshot, module: str):
+    app = arc.App(snapshot.root)
+    app.use(snapshot.middleware, after=arc.InitMiddleware.Parser)
+
+    with pytest.raises(SystemExit):
+        app("--version")
+
+    assert snapshot.root.config.version == "1.2.3"
+    assert snapshot.root.config.allow_unrecognized_args
+    assert module not in sys.modules
+    assert app("greet joe extra") == "joe"
+
+
+def test_create_does_not_modify(module: str):
+    root = __import__(module).root
+    Snapshot.create(root)
+    assert root.get_param("version") is None
+
+
+def test_version_mismatch(snapshot: Snapshot):
+    with pytest.raises(arc.errors.CommandError):
+        Snapshot(snapshot.data | {"arc": "0.0.0"})
+
+
+def test_root_must_be_importable():
+    @arc.command
+    def command(): ...
+
+    with pytest.raises(arc.errors.CommandError):
+        Snapshot.create(command)
+
+
+def test_cached(module: str, tmp_path: Path):
+    root = __import__(module).root
+    path = tmp_path / "index.snapshot"
+
+    snapshot = Snapshot.cached(path, root)
+    assert snapshot is not None and path.exists()
+    assert Snapshot.cached(path, root).data == snapshot.data
+
+    source = tmp_path / f"{module}.py"
+    os.utime(source, ns=(0, 0))
+    assert not snapshot.is_current(root)
+    assert Snapshot.cached(path, root).is_current(root)
+
+    root.config.version = "2.0.0"
+    assert not Snapshot.load(path).is_current(root)
+    assert Snapshot.cached(path, root).data["config"]["version"] == "2.0.0"
+
+
+def test_completion_index(
+    module: str,
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+    capsys: pytest.CaptureFixture,
+):
+    root = __import__(module).root
+    root.config.autocomplete = True
+    root.config.completion_index = str(tmp_path / "index.snapshot")
+    app = arc.App(root)
+
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setenv("_CLI_COMPLETE", "true")
+    monkeypatch.setenv("COMP_CURRENT", "")
+
+    def complete(words: str) -> str:
+        monkeypatch.setenv("COMP_WORDS", words)
+        with pytest.raises(SystemExit):
+            app("--autocomplete bash")
+        return capsys.readouterr().out
+
+    assert complete("cli ns color") == "plain|red\nplain|blue"
+    assert not (tmp_path / "index.snapshot").exists()
+
+    assert app("ns color red") == "red"
+    assert Snapshot.current(tmp_path / "index.snapshot", root) is not None
+    assert complete("cli ns color") == "plain|red\nplain|blue"
+    assert complete("cli ns color --user") == "plain|them"
+
+
+def test_completion_index_lazy(
+    module: str,
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+    capsys: pytest.CaptureFixture,
+):
+    lazy = f"{module}_lazy"
+    (tmp_path / f"{lazy}.py").write_text("import arc\n\ndef job(): ...\n")
+    root = __import__(module).root
+    root.lazy_subcommand(f"{lazy}:job")
+    root.config.autocomplete = True
+    root.config.completion_index = str(tmp_path / "index.snapshot")
+
+    monkeypatch.setenv("_CLI_COMPLETE", "true")
+    monkeypatch.setenv("COMP_CURRENT", "")
+    monkeypatch.setenv("COMP_WORDS", "cli ns")
+
+    try:
+        app = arc.App(root)
+        with pytest.raises(SystemExit):
+            app("--autocomplete bash")
+
+        assert "plain|color" in capsys.readouterr().out
+        assert lazy not in sys.modules
+
+        app("ns color red")
+        assert lazy not in sys.modules
+        index = Snapshot.current(tmp_path / "index.snapshot", root)
+        assert index is not None
+        assert "job" in index.root.lazy_subcommands
+
+        monkeypatch.setenv("COMP_WORDS", "cli")
+        with pytest.raises(SystemExit):
+            app("--autocomplete bash")
+
+        assert "plain|job" in capsys.readouterr().out
+        assert lazy not in sys.modules
+    finally:
+        sys.modules.pop(lazy, None)
+
+
+def test_header(module: str, tmp_path: Path):
+    root = __import__(module).root
+    path = tmp_path / "index.snapshot"
+    assert not Snapshot.is_fresh(path, root)
+
+    Snapshot.create(root).dump(path)
+    assert Snapshot.is_fresh(path, root)
+
+    # Only the header is read to check freshness
+    header, _ = path.read_text().split("\n")
+    path.write_text(header + "\n{")
+    assert Snapshot.is_fresh(path, root)
+    assert Snapshot.current(path, root) is None
+
+    os.utime(tmp_path / f"{module}.py", ns=(0, 0))
+    assert not Snapshot.is_fresh(path, root)
+
+
+def test_main_module(tmp_path: Path, monkeypatch: pytest.MonkeyPatch):
+    script = tmp_path / "script.py"
+    script.write_text(SOURCE)
+    spec = importlib.util.spec_from_file_location("__main__", script)
+    main = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(main)
+
+    monkeypatch.setitem(sys.modules, "__main__", main)
+    monkeypatch.setattr(sys, "argv", [str(script)])
+
+    snapshot = Snapshot.create(main.root)
+    assert snapshot.data["root"]["import"] == "__main__:root"
+    assert snapshot.is_current(main.root)
+
+    os.utime(script, ns=(0, 0))
+    assert not snapshot.is_current(main.root)
+
+    snapshot = Snapshot.create(main.root)
+    monkeypatch.setattr(sys, "argv", [str(tmp_path / "other.py")])
+    assert not snapshot.is_current(main.root)
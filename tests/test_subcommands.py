@@ -1,4 +1,10 @@
+import sys
+
+import pytest
+
 import arc
+from arc import errors
+from arc.autocompletions import Completion, CompletionInfo, get_completions
 
 
 def test_subcommand():
@@ -54,3 +60,112 @@ def test_creation_conventions():
     assert ns("sub2")
     assert ns("sub3")
     assert ns("changed-name")
+
+
+class TestAbbreviations:
+    @pytest.fixture
+    def ns(self):
+        ns = arc.namespace("ns", config=arc.Config(allow_abbreviated_commands=True))
+
+        @ns.subcommand("deploy", "ship")
+        def deploy():
+            return "deploy"
+
+        @ns.subcommand
+        def delete():
+            return "delete"
+
+        return ns
+
+    def test_unique_prefix(self, ns: arc.Command):
+        assert ns("dep") == "deploy"
+        assert ns("deploy") == "deploy"
+        assert ns("sh") == "deploy"
+        assert ns("del") == "delete"
+
+    def test_ambiguous_prefix(self, ns: arc.Command):
+        command, args = ns.find_command(["de"])
+        assert command is ns
+        assert args == ["de"]
+
+    def test_disabled(self):
+        ns = arc.namespace("ns")
+
+        @ns.subcommand
+        def deploy(): ...
+
+        command, _ = ns.find_command(["dep"])
+        assert command is ns
+
+    def test_completions(self, ns: arc.Command):
+        info = CompletionInfo(["del"], "del")
+        assert get_completions(ns, info) == [Completion("delete", "")]
+
+
+class TestLazy:
+    SOURCE = """\
+import arc
+
+def run_job(name: str):
+    \"\"\"Runs a job\"\"\"
+    return name
+
+@arc.command("other")
+def build():
+    return "build"
+"""
+
+    @pytest.fixture
+    def module(self, tmp_path, monkeypatch: pytest.MonkeyPatch):
+        name = f"lazy_cli_{id(tmp_path)}"
+        (tmp_path / f"{name}.py").write_text(self.SOURCE)
+        monkeypatch.syspath_prepend(str(tmp_path))
+        yield name
+        sys.modules.pop(name, None)
+
+    def test_execute(self, module: str):
+        ns = arc.namespace("ns")
+        ns.lazy_subcommand(f"{module}:run_job", "r", desc="Runs a job")
+        ns.lazy_subcommand(f"{module}:build")
+
+        assert module not in sys.modules
+        assert ns("r joe") == "joe"
+        assert module in sys.modules
+        assert ns("run-job jane") == "jane"
+        assert ns("build") == "build"
+        assert ns.subcommands.aliases_for("run-job") == ["r"]
+        assert not ns.lazy_subcommands
+
+    def test_help(self, module: str):
+        ns = arc.namespace("ns")
+        ns.lazy_subcommand(f"{module}:run_job", "r", desc="Runs a job")
+
+        help = ns.doc.help()
+        assert "run-job" in help
+        assert "Runs a job" in help
+        assert module not in sys.modules
+
+    def test_completions(self, module: str):
+        ns = arc.namespace("ns")
+        ns.lazy_subcommand(f"{module}:run_job", desc="Runs a job")
+
+        info = CompletionInfo([], "")
+        assert get_completions(ns, info) == [Completion("run-job", "Runs a job")]
+        assert module not in sys.modules
+
+    def test_failed_import(self, module: str):
+        ns = arc.namespace("ns")
+        ns.lazy_subcommand(f"{module}:missing", "m")
+        ns.lazy_subcommand(f"{module}_missing:run_job", "r")
+
+        for name in ("missing", "m", "run-job", "r"):
+            with pytest.raises(errors.CommandError, match="Failed to load subcommand"):
+                ns.get_subcommand(name)
+
+        assert list(ns.lazy_subcommands) == ["missing", "run-job"]
+        assert ns.lazy_subcommands.aliases_for("missing") == ["m"]
+
+    def test_invalid_path(self):
+        ns = arc.namespace("ns")
+        with pytest.raises(errors.CommandError):
+            ns.lazy_subcommand("module.without.attribute")
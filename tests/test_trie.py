@@ -0,0 +1,36 @@
+from arc.define.trie import Trie
+
+
+def test_get():
+    trie: Trie[int] = Trie()
+    trie.insert("sub", 1)
+    trie.insert("subcommand", 2)
+
+    assert trie.get("sub") == 1
+    assert trie.get("subcommand") == 2
+    assert trie.get("su") is None
+    assert "sub" in trie
+    assert "su" not in trie
+    assert len(trie) == 2
+
+
+def test_items():
+    trie: Trie[int] = Trie()
+    for idx, key in enumerate(["ab", "b", "ac", "abc"]):
+        trie.insert(key, idx)
+
+    assert trie.items() == [("ab", 0), ("b", 1), ("ac", 2), ("abc", 3)]
+    assert trie.items("a") == [("ab", 0), ("ac", 2), ("abc", 3)]
+    assert trie.items("abc") == [("abc", 3)]
+    assert trie.items("x") == []
+
+
+def test_overwrite():
+    trie: Trie[int] = Trie()
+    trie.insert("a", 1)
+    trie.insert("b", 2)
+    trie.insert("a", 3)
+
+    assert trie.items() == [("a", 3), ("b", 2)]
+    assert trie.items("a") == [("a", 3)]
+    assert len(trie) == 2
@@ -55,3 +55,29 @@ def test_cleanup():
 
     with pytest.raises(CleanupError):
         c("2")
+
+
+def test_alias_resolve_cache():
+    from arc.types.aliases import Alias, IntAlias
+
+    class Custom: ...
+
+    class Sub(int): ...
+
+    assert Alias.resolve(Sub) is IntAlias
+    assert Sub in Alias._resolved
+
+    with pytest.raises(TypeError):
+        Alias.resolve(Custom)
+    assert Custom in Alias._unresolvable
+
+    class CustomAlias(Alias, of=Custom):
+        @classmethod
+        def convert(cls, value: str) -> Custom:
+            return Custom()
+
+    try:
+        assert Alias.resolve(Custom) is CustomAlias
+    finally:
+        del Alias.aliases[Custom]
+        Alias._resolved.clear()
@@ -109,3 +109,88 @@ def test_stdin_file(content_file: Path):
 
     with pytest.raises(arc.errors.InvalidParamValueError):
         command("provided")
+
+
+class TestStreamOf:
+    def test_stdin(self, monkeypatch: pytest.MonkeyPatch):
+        monkeypatch.setattr(sys, "stdin", StringIO("1\n2\n3\n\n4\n5\n"))
+
+        @arc.command
+        def command(ids: Stream[int]):
+            assert not isinstance(ids, list)
+            return list(ids)
+
+        assert command("-") == [1, 2, 3, 4, 5]
+
+    def test_file(self, tmp_path: Path):
+        path = tmp_path / "ids"
+        path.write_text("\n".join(str(i) for i in range(5000)))
+        files = []
+
+        @arc.command
+        def command(ids: Stream[int]):
+            files.append(ids.file)
+            return sum(ids)
+
+        assert command(f"@{path}") == sum(range(5000))
+        assert files[0].closed
+
+    def test_invalid(self, tmp_path: Path):
+        path = tmp_path / "ids"
+        path.write_text("1\nword")
+
+        @arc.command
+        def command(ids: Stream[int]):
+            return list(ids)
+
+        with pytest.raises(arc.errors.InvalidParamValueError):
+            command("provided")
+
+        with pytest.raises(arc.errors.InvalidParamValueError):
+            command(f"@{tmp_path / 'missing'}")
+
+        with pytest.raises(arc.errors.InvalidParamValueError) as exc_info:
+            command(f"@{path}")
+
+        assert exc_info.value.param.argument_name == "ids"
+
+    def test_lines(self, tmp_path: Path):
+        path = tmp_path / "names"
+        path.write_bytes(b"first name\r\n\nsecond  name\nthird")
+
+        @arc.command
+        def command(names: Stream[str]):
+            return list(names)
+
+        assert command(f"@{path}") == ["first name", "second  name", "third"]
+
+    def test_optional(self, tmp_path: Path):
+        path = tmp_path / "ids"
+        path.write_text("1\nword")
+
+        @arc.command
+        def command(ids: t.Optional[Stream[int]] = None):
+            return ids if ids is None else list(ids)
+
+        assert command("") is None
+        with pytest.raises(arc.errors.InvalidParamValueError) as exc_info:
+            command(f"@{path}")
+
+        assert exc_info.value.param.argument_name == "ids"
+
+    def test_single_pass(self, monkeypatch: pytest.MonkeyPatch):
+        monkeypatch.setattr(sys, "stdin", StringIO("1\n2\n3"))
+
+        @arc.command
+        def command(ids: Stream[int]):
+            assert iter(ids) is ids
+            return next(ids), list(ids), list(ids)
+
+        assert command("-") == (1, [2, 3], [])
+
+    def test_argfiles(self):
+        @arc.command(config=arc.Config(environment="development", allow_argfiles=True))
+        def command(ids: t.Optional[Stream[int]] = None): ...
+
+        with pytest.raises(arc.errors.ParamError):
+            command("-")
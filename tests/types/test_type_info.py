@@ -1,4 +1,4 @@
-from typing import Annotated, TypeVar
+from typing import Annotated, Literal, TypeVar, Union
 from unittest.mock import Mock
 
 import pytest
@@ -178,3 +178,47 @@ class TestAnalyze:
         assert info.name == "str"
         assert info.middleware == [func]
         assert info.param_info == option
+
+    def test_interned(self):
+        typ = Annotated[list[int], arc.Option(name="test")]
+        info = TypeInfo.analyze(typ)
+        assert TypeInfo.analyze(typ) is info
+        assert TypeInfo.analyze(int) is info.sub_types[0]
+        assert TypeInfo.analyze(int | str) is not TypeInfo.analyze(Union[int, str])  # noqa: UP007
+
+    def test_union_order(self):
+        first = TypeInfo.analyze(Union[int, str])  # noqa: UP007
+        second = TypeInfo.analyze(Union[str, int])  # noqa: UP007
+        assert [sub.origin for sub in first.sub_types] == [int, str]
+        assert [sub.origin for sub in second.sub_types] == [str, int]
+
+        @arc.command
+        def command(x: Union[str, int]):  # noqa: UP007
+            return x
+
+        assert command("5") == "5"
+
+    def test_literal_order(self):
+        first = TypeInfo.analyze(Literal[1, 2])
+        second = TypeInfo.analyze(Literal[2, 1])
+        assert [sub.original_type for sub in first.sub_types] == [1, 2]
+        assert [sub.original_type for sub in second.sub_types] == [2, 1]
+
+    def test_unhashable_annotation(self):
+        typ = Annotated[int, ["unhashable"]]
+        info = TypeInfo.analyze(typ)
+        assert info.origin is int
+        assert info.annotations == (["unhashable"],)
+        assert TypeInfo.analyze(typ) == info
+
+
+def test_dispatchers():
+    from arc import utils
+
+    def middleware(value, ctx):
+        return value * 2
+
+    info = TypeInfo.analyze(Annotated[int, middleware])
+    assert utils.arg_count(middleware) == 2
+    assert info.converter("2", info) == 2
+    assert [m(2, None, None) for m in info.middleware_dispatchers] == [4]
@@ -130,6 +130,30 @@ class TestList:
         with pytest.raises(errors.ArgumentError):
             cli("li ainfe")
 
+    def test_convert_many(self, cli: arc.Command):
+        @cli.subcommand
+        def li(*, ints: list[int], floats: list[float], paths: list[Path]):
+            return ints, floats, paths
+
+        assert cli("li --ints 1 --ints 2 --floats 1.5 --paths a") == (
+            [1, 2],
+            [1.5],
+            [Path("a")],
+        )
+
+        with pytest.raises(errors.InvalidParamValueError):
+            cli("li --ints 1 --ints word --floats 1 --paths a")
+
+        @cli.subcommand
+        def ids(val: list[uuid.UUID]):
+            return val
+
+        id = uuid.uuid4()
+        assert cli(f"ids {id} {id}") == [id, id]
+
+        with pytest.raises(errors.InvalidParamValueError):
+            cli(f"ids {id} 1234")
+
     def test_nested_union(self, cli: arc.Command):
         @cli.subcommand
         def liu(val: list[Union[int, str]]):
@@ -172,6 +196,9 @@ class TestTuple:
 
         assert cli("tu 1 2 3 4") == ((1, 2), (3, 4))
 
+        with pytest.raises(errors.InvalidParamValueError):
+            cli("tu 1 word 3 4")
+
     def test_variable_size(self, cli: arc.Command):
         @cli.subcommand
         def any_size(val: tuple[int, ...]):